@@ -25,6 +25,11 @@ class Settings:
     TAVILY_API_KEY: Optional[str] = os.getenv("TAVILY_API_KEY") or os.getenv("Tavily_API_KEY")
     ZOOMINFO_API_KEY: Optional[str] = os.getenv("ZOOMINFO_API_KEY") or os.getenv("ZoomInfo_API_KEY")
     GNEWS_API_KEY: Optional[str] = os.getenv("GNEWS_API_KEY") or os.getenv("GNews_API_KEY")
+    # ZoomInfo username/password auth (JWT from /authenticate, cached and refreshed ahead of expiry)
+    ZOOMINFO_USERNAME: Optional[str] = os.getenv("ZOOMINFO_USERNAME")
+    ZOOMINFO_PASSWORD: Optional[str] = os.getenv("ZOOMINFO_PASSWORD")
+    ZOOMINFO_TOKEN_TTL_SECONDS: float = float(os.getenv("ZOOMINFO_TOKEN_TTL_SECONDS", "3600"))  # If the JWT has no exp
+    TOKEN_REFRESH_MARGIN_SECONDS: float = float(os.getenv("TOKEN_REFRESH_MARGIN_SECONDS", "300"))
 
     # LLM Configuration (multi-provider with fallback)
     ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
@@ -32,6 +37,98 @@ class Settings:
     GEMINI_API_KEY: Optional[str] = os.getenv("GEMINI_API_KEY")
     LLM_MODEL: str = "claude-3-5-haiku-20241022"  # Fast, cost-effective
     LLM_TIMEOUT: int = 30  # seconds (target <60s end-to-end)
+    # One LLM call for ebook + intro/CTA personalization (false: two separate calls)
+    LLM_COMBINED_GENERATION: bool = os.getenv("LLM_COMBINED_GENERATION", "true").lower() == "true"
+
+    # Request time budgets (seconds): enrichment resolves with whatever sources
+    # arrived in time; late sources are backfilled into finalize_data
+    ENRICHMENT_BUDGET_SECONDS: float = float(os.getenv("ENRICHMENT_BUDGET_SECONDS", "8"))
+    REQUEST_BUDGET_SECONDS: float = float(os.getenv("REQUEST_BUDGET_SECONDS", "20"))
+
+    # Personalization job queue behind POST /rad/enrich (in-process worker pool)
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "4"))
+    JOB_QUEUE_MAX_SIZE: int = int(os.getenv("JOB_QUEUE_MAX_SIZE", "200"))
+    # "local": jobs run in the process that accepted them; "distributed": every
+    # process claims jobs from personalization_jobs with leases (multi-node fleets)
+    JOB_QUEUE_MODE: str = os.getenv("JOB_QUEUE_MODE", "local").lower()
+    JOB_WORKER_ID: Optional[str] = os.getenv("JOB_WORKER_ID")  # defaults to host:pid
+    JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "120"))
+    JOB_HEARTBEAT_SECONDS: float = float(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_POLL_SECONDS: float = float(os.getenv("JOB_POLL_SECONDS", "1"))
+
+    # Fetch plan: "full" calls every provider; "waterfall" calls provider tiers
+    # (by SOURCE_PRIORITY) only while required fields are missing.
+    # Per-campaign plans are keyed by the request's cta, e.g. "webinar:waterfall,demo:full"
+    ENRICHMENT_FETCH_PLAN: str = os.getenv("ENRICHMENT_FETCH_PLAN", "full")
+    CAMPAIGN_FETCH_PLANS: str = os.getenv("CAMPAIGN_FETCH_PLANS", "")
+    WATERFALL_REQUIRED_FIELDS: str = os.getenv(
+        "WATERFALL_REQUIRED_FIELDS",
+        "first_name,last_name,title,company_name,industry,company_size,country,company_context"
+    )
+
+    # Point all provider clients at a stand-in server (scripts/fake_provider_server.py),
+    # e.g. http://localhost:8900; per-provider overrides: <SRC>_BASE_URL
+    PROVIDER_BASE_URL: Optional[str] = os.getenv("PROVIDER_BASE_URL")
+
+    # Provider cassettes: "record" saves responses, "replay" serves them offline
+    CASSETTE_MODE: str = os.getenv("CASSETTE_MODE", "off").lower()
+    CASSETTE_DIR: str = os.getenv("CASSETTE_DIR", "cassettes")
+    CASSETTE_LATENCY_SCALE: float = float(os.getenv("CASSETTE_LATENCY_SCALE", "1.0"))  # 0 = no delay
+
+    # Outbound HTTP pooling for enrichment providers
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE: int = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+    HTTP_WARMUP_ON_STARTUP: bool = os.getenv("HTTP_WARMUP_ON_STARTUP", "true").lower() == "true"
+
+    # Company-level enrichment cache (in-process LRU + enrichment_cache table)
+    COMPANY_CACHE_ENABLED: bool = os.getenv("COMPANY_CACHE_ENABLED", "true").lower() == "true"
+    COMPANY_CACHE_MAX_ENTRIES: int = int(os.getenv("COMPANY_CACHE_MAX_ENTRIES", "5000"))
+    COMPANY_CACHE_SWEEP_SECONDS: int = int(os.getenv("COMPANY_CACHE_SWEEP_SECONDS", "300"))
+
+    # Rendered PDFs reused by /rad/deliver, /rad/pdf and /rad/download (in-process)
+    PDF_CACHE_MAX_ENTRIES: int = int(os.getenv("PDF_CACHE_MAX_ENTRIES", "50"))
+    PDF_CACHE_TTL_SECONDS: float = float(os.getenv("PDF_CACHE_TTL_SECONDS", "3600"))
+
+    # Email domain classification (free-mail/disposable/education/government lists;
+    # defaults to assets/domains). Disposable addresses are rejected before any provider call
+    DOMAIN_LISTS_DIR: Optional[str] = os.getenv("DOMAIN_LISTS_DIR")
+    REJECT_DISPOSABLE_EMAILS: bool = os.getenv("REJECT_DISPOSABLE_EMAILS", "true").lower() == "true"
+
+    # Negative cache for provider "no match" results (per-source TTL: NEGATIVE_CACHE_TTL_<SRC>)
+    NEGATIVE_CACHE_ENABLED: bool = os.getenv("NEGATIVE_CACHE_ENABLED", "true").lower() == "true"
+    NEGATIVE_CACHE_TTL_SECONDS: int = int(os.getenv("NEGATIVE_CACHE_TTL_SECONDS", "86400"))
+    NEGATIVE_CACHE_MAX_ENTRIES: int = int(os.getenv("NEGATIVE_CACHE_MAX_ENTRIES", "50000"))
+
+    # Per-company GNews index (incremental refresh after this many seconds)
+    NEWS_INDEX_REFRESH_SECONDS: int = int(os.getenv("NEWS_INDEX_REFRESH_SECONDS", "3600"))
+    NEWS_INDEX_MAX_COMPANIES: int = int(os.getenv("NEWS_INDEX_MAX_COMPANIES", "2000"))
+
+    # Adaptive per-provider rate limiting (per-provider overrides: <SRC>_RATE_LIMIT_RPS, <SRC>_MAX_CONCURRENCY)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_DEFAULT_RPS: float = float(os.getenv("RATE_LIMIT_DEFAULT_RPS", "5"))
+    RATE_LIMIT_DEFAULT_CONCURRENCY: int = int(os.getenv("RATE_LIMIT_DEFAULT_CONCURRENCY", "5"))
+
+    # Retries for transient provider failures (exponential backoff, full jitter)
+    RETRY_ENABLED: bool = os.getenv("RETRY_ENABLED", "true").lower() == "true"
+    RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+    RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "0.25"))
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "4"))
+    # Retry budget per provider: retries <= ratio x recent requests + floor/second
+    RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+    RETRY_BUDGET_MIN_PER_SECOND: float = float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "1"))
+
+    # Per-provider circuit breakers
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    CIRCUIT_WINDOW_SECONDS: float = float(os.getenv("CIRCUIT_WINDOW_SECONDS", "60"))
+    CIRCUIT_MIN_CALLS: int = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+    CIRCUIT_FAILURE_RATE: float = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+    CIRCUIT_SLOW_CALL_SECONDS: float = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "15"))
+    CIRCUIT_SLOW_CALL_RATE: float = float(os.getenv("CIRCUIT_SLOW_CALL_RATE", "0.8"))
+    CIRCUIT_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+    CIRCUIT_HALF_OPEN_PROBES: int = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1"))
 
     # App Configuration
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
@@ -2,6 +2,7 @@
 FastAPI app initialization and middleware setup.
 """
 
+import asyncio
 import logging
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,6 +10,11 @@ from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.routes import enrichment
+from app.services.http_pool import get_http_pool, close_http_pool
+from app.services.enrichment_apis import get_warmup_targets
+from app.services.enrichment_cache import get_company_cache
+from app.services.job_queue import get_job_queue, start_job_poller
+from app.services.supabase_client import get_supabase_client
 
 # Configure logging
 logging.basicConfig(
@@ -32,10 +38,31 @@ async def lifespan(app: FastAPI):
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise
+
+    # Shared provider HTTP clients (keep-alive pools, one per provider)
+    http_pool = get_http_pool()
+    if settings.HTTP_WARMUP_ON_STARTUP:
+        await http_pool.warm_up(get_warmup_targets())
+
+    # Background expiry for the company enrichment cache
+    cache_sweeper = asyncio.create_task(get_company_cache().run_expiry_loop())
+
+    # Worker pool draining queued /rad/enrich jobs
+    job_queue = get_job_queue()
+    job_queue.start()
+    # Distributed mode: claim leased jobs from personalization_jobs (any node's)
+    job_poller = None
+    if settings.JOB_QUEUE_MODE == "distributed":
+        job_poller = start_job_poller(get_supabase_client(), enrichment.run_claimed_job)
     
     yield
     
     logger.info("FastAPI app shutting down")
+    cache_sweeper.cancel()
+    if job_poller:
+        job_poller.cancel()
+    await job_queue.stop()
+    await close_http_pool()
 
 
 # Create FastAPI app
@@ -3,7 +3,7 @@ Pydantic schemas for request/response validation.
 """
 
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Literal
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -27,6 +27,10 @@ class EnrichmentRequest(BaseModel):
     persona: Optional[str] = Field(None, description="User's role (c_suite, vp_director, it_infrastructure, engineering, data_ai, security, procurement)")
     industry: Optional[str] = Field(None, description="User's industry (technology, financial_services, healthcare, retail_ecommerce, manufacturing, etc.)")
     cta: Optional[str] = Field(None, description="Campaign CTA context")
+    # Provider fetch plan (defaults to the campaign's plan, then ENRICHMENT_FETCH_PLAN)
+    fetch_plan: Optional[Literal["full", "waterfall"]] = Field(
+        None, description="full: call every provider; waterfall: call provider tiers only while required fields are missing"
+    )
     # Cache control
     force_refresh: Optional[bool] = Field(False, description="Force re-enrichment even if data exists")
 
@@ -106,6 +110,24 @@ class EnrichmentResponse(BaseModel):
     email: str
     status: str = Field(default="queued", description="Job status: queued, processing, completed, failed")
     created_at: datetime
+    status_url: Optional[str] = Field(None, description="GET endpoint reporting job progress")
+    events_url: Optional[str] = Field(None, description="Server-Sent Events stream of job progress")
+
+
+class JobStatusResponse(BaseModel):
+    """
+    GET /rad/jobs/{job_id} response.
+    Stage-level progress of a queued personalization job.
+    """
+    job_id: str
+    email: str
+    status: str = Field(..., description="Job status: pending, processing, completed, failed")
+    stage: Optional[str] = Field(None, description="Pipeline stage: queued, enriching, generating, compliance, storing, done")
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = Field(None, description="Enrichment summary once completed")
 
 
 # ============================================================================
@@ -1,80 +1,375 @@
 """
-Enrichment routes: POST /rad/enrich and GET /rad/profile/{email}
+Enrichment routes: POST /rad/enrich, GET /rad/jobs/{job_id} and GET /rad/profile/{email}
 Alpha endpoints for the personalization pipeline.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.responses import Response
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query
+from fastapi.responses import Response, StreamingResponse
 from app.models.schemas import (
     EnrichmentRequest,
     EnrichmentResponse,
+    JobStatusResponse,
     ProfileResponse,
     NormalizedProfile,
     PersonalizationContent,
     ErrorResponse
 )
+from app.config import settings
 from app.services.supabase_client import SupabaseClient, get_supabase_client
-from app.services.rad_orchestrator import RADOrchestrator
+from app.services.rad_orchestrator import RADOrchestrator, get_rad_orchestrator, select_fetch_plan
 from app.services.llm_service import LLMService
+from app.services.domain_classifier import DisposableEmailError
+from app.services.job_queue import JobLease, QueueFullError, get_job_queue, get_job_stats
+from app.services.job_events import (
+    TERMINAL_EVENTS, JobEvent, emit_job_event, get_job_event_bus, job_events_scope, shared_job_events
+)
 from app.services.compliance import ComplianceService, validate_personalization
-from app.services.pdf_service import PDFService
+from app.services.pdf_service import PDFService, get_pdf_artifact_cache
 from app.services.email_service import EmailService
+from app.services.enrichment_cache import get_company_cache
+from app.services.news_index import get_news_index
+from app.services.negative_cache import get_negative_cache
+from app.services.coalescing import personalization_flights, get_coalescing_stats
+from app.services.deadline import deadline_scope
+from app.services.rate_limiter import get_rate_limit_stats
+from app.services.circuit_breaker import get_circuit_breaker_stats
+from app.services.retry_policy import get_retry_stats
+from app.services.token_manager import get_token_stats
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/rad", tags=["enrichment"])
 
 
+# Pipeline stages reported in personalization_jobs.stage (GET /rad/jobs/{job_id})
+JOB_STAGE_QUEUED = "queued"
+JOB_STAGE_ENRICHING = "enriching"
+JOB_STAGE_GENERATING = "generating"
+JOB_STAGE_COMPLIANCE = "compliance"
+JOB_STAGE_STORING = "storing"
+JOB_STAGE_DONE = "done"
+
+# Idle seconds between SSE keepalive comments on GET /rad/jobs/{job_id}/events
+SSE_KEEPALIVE_SECONDS = 15
+
+
+def _record_job(
+    supabase: SupabaseClient,
+    job_id: str,
+    job_status: str,
+    lease: Optional[JobLease] = None,
+    **fields
+) -> None:
+    """
+    Update a job row; a failed status write never fails the job itself.
+    Leased jobs only record their stage, and only while this worker holds the
+    lease (outcomes go through _finish_job).
+    """
+    if fields.get("stage"):
+        emit_job_event("stage", {"stage": fields["stage"]})
+    try:
+        if lease is None:
+            supabase.update_job_status(job_id, job_status, **fields)
+        elif not supabase.heartbeat_job(job_id, lease.worker_id, stage=fields.get("stage")):
+            logger.warning(f"[{job_id}] Lease no longer held by {lease.worker_id}; stage not recorded")
+    except Exception as e:
+        logger.warning(f"[{job_id}] Could not record job status {job_status}: {e}")
+
+
+async def _personalize(
+    job_id: str,
+    request: EnrichmentRequest,
+    supabase: SupabaseClient,
+    orchestrator: RADOrchestrator,
+    lease: Optional[JobLease] = None
+) -> dict:
+    """
+    Run enrichment, LLM personalization and compliance for one request.
+
+    Returns:
+        Result summary stored on the job (data sources, quality, key fields)
+    """
+    email = request.email.lower().strip()
+    domain = request.domain or email.split("@")[1]
+    fetch_plan = select_fetch_plan(request.fetch_plan, request.cta)
+    # User-supplied fields count as filled for the waterfall plan
+    known_fields = {
+        "first_name": request.firstName,
+        "last_name": request.lastName,
+        "company_name": request.company,
+        "industry": request.industry,
+    }
+
+    # Create services (the orchestrator is shared across requests)
+    llm_service = LLMService()
+
+    # Run enrichment
+    finalized = await orchestrator.enrich(
+        email, domain, fetch_plan=fetch_plan, known_fields=known_fields
+    )
+
+    # Log which data sources returned real vs mock data
+    logger.info(f"[{job_id}] Data sources used: {finalized['data_sources']}")
+    logger.info(f"[{job_id}] Quality score: {finalized.get('data_quality_score', 0)}")
+
+    # Override enriched data with user-provided info (more reliable than API data)
+    if request.firstName:
+        finalized["first_name"] = request.firstName
+    if request.lastName:
+        finalized["last_name"] = request.lastName
+    if request.company:
+        finalized["company_name"] = request.company
+    if request.industry:
+        finalized["industry"] = request.industry
+
+    # Add user-provided context to the profile for LLM
+    user_context = {
+        "goal": request.goal,
+        "persona": request.persona,
+        "industry_input": request.industry,  # User-selected industry
+        "company": request.company,  # User-provided company name
+        "first_name": request.firstName,
+        "last_name": request.lastName,
+    }
+
+    # Get company news from Tavily (if available in enrichment)
+    company_news = finalized.get("company_context", "")
+
+    _record_job(supabase, job_id, "processing", lease, stage=JOB_STAGE_GENERATING)
+
+    if settings.LLM_COMBINED_GENERATION:
+        # AMD ebook (3 sections) and legacy intro/CTA from one LLM call
+        combined = await llm_service.generate_combined_personalization(
+            profile=finalized,
+            user_context=user_context,
+            company_news=company_news
+        )
+        ebook_personalization, personalization = llm_service.split_combined_personalization(combined)
+    else:
+        # Generate AMD ebook personalization (3 sections)
+        ebook_personalization = await llm_service.generate_ebook_personalization(
+            profile=finalized,
+            user_context=user_context,
+            company_news=company_news
+        )
+
+        # Also generate legacy personalization for backward compatibility
+        use_opus = llm_service.should_use_opus(finalized)
+        personalization = await llm_service.generate_personalization(
+            finalized,
+            use_opus=use_opus,
+            user_context=user_context
+        )
+
+    intro_hook = personalization.get("intro_hook", "")
+    cta = personalization.get("cta", "")
+
+    _record_job(supabase, job_id, "processing", lease, stage=JOB_STAGE_COMPLIANCE)
+
+    # Run compliance check on all personalized content
+    compliance_service = ComplianceService()
+    compliance_result = compliance_service.check(intro_hook, cta, auto_correct=True)
+
+    if not compliance_result.passed and compliance_result.corrected_intro:
+        intro_hook = compliance_result.corrected_intro
+        cta = compliance_result.corrected_cta
+        logger.info(f"[{job_id}] Using compliance-corrected content")
+    elif not compliance_result.passed:
+        intro_hook = compliance_service.get_safe_intro(finalized)
+        cta = compliance_service.get_safe_cta(finalized)
+        logger.warning(f"[{job_id}] Compliance failed, using fallback content")
+
+    # Also check ebook personalization
+    ebook_hook = ebook_personalization.get("personalized_hook", "")
+    ebook_cta = ebook_personalization.get("personalized_cta", "")
+    ebook_compliance = compliance_service.check(ebook_hook, ebook_cta, auto_correct=True)
+    if not ebook_compliance.passed and ebook_compliance.corrected_intro:
+        ebook_personalization["personalized_hook"] = ebook_compliance.corrected_intro
+        ebook_personalization["personalized_cta"] = ebook_compliance.corrected_cta
+    emit_job_event("compliance", {
+        "passed": compliance_result.passed and ebook_compliance.passed,
+        "intro_hook": intro_hook,
+        "cta": cta,
+        "personalized_hook": ebook_personalization.get("personalized_hook"),
+    })
+
+    # Store ebook personalization in normalized_data for PDF generation
+    finalized["ebook_personalization"] = ebook_personalization
+    finalized["user_context"] = user_context
+
+    _record_job(supabase, job_id, "processing", lease, stage=JOB_STAGE_STORING)
+
+    # Update finalize_data with personalization
+    supabase.upsert_finalize_data(
+        email=email,
+        normalized_data=finalized,
+        intro=intro_hook,
+        cta=cta,
+        data_sources=finalized["data_sources"]
+    )
+    # Late providers may now merge their data into the stored profile
+    orchestrator.mark_finalized(email)
+
+    logger.info(f"[{job_id}] Enrichment completed for {email}")
+
+    # Data source info (for debugging)
+    return {
+        "data_sources": finalized["data_sources"],
+        "fetch_plan": fetch_plan,
+        "skipped_sources": finalized.get("skipped_sources", []),
+        "skipped_reasons": finalized.get("skipped_reasons", {}),
+        "pending_sources": finalized.get("pending_sources", []),
+        "data_quality_score": finalized.get("data_quality_score", 0),
+        "enriched_fields": {
+            "first_name": finalized.get("first_name"),
+            "company_name": finalized.get("company_name"),
+            "title": finalized.get("title"),
+            "industry": finalized.get("industry"),
+        }
+    }
+
+
+def _finish_job(
+    supabase: SupabaseClient,
+    job_id: str,
+    lease: Optional[JobLease],
+    job_status: str,
+    **fields
+) -> None:
+    """Record a job outcome; leased jobs only if this worker still holds the lease."""
+    if lease is None:
+        _record_job(supabase, job_id, job_status, **fields)
+    elif not supabase.finish_job(job_id, lease.worker_id, job_status, **fields):
+        logger.warning(f"[{job_id}] Lease no longer held by {lease.worker_id}; outcome not recorded")
+
+
+async def run_personalization_job(
+    job_id: str,
+    request: EnrichmentRequest,
+    supabase: SupabaseClient,
+    orchestrator: RADOrchestrator,
+    lease: Optional[JobLease] = None
+) -> None:
+    """
+    Job queue entry point: run the pipeline for one job and record its outcome.
+
+    Args:
+        job_id: personalization_jobs id
+        request: Original enrichment request
+        supabase: Supabase client
+        orchestrator: Shared orchestrator
+        lease: Lease held on the job (distributed mode)
+    """
+    email = request.email.lower().strip()
+    domain = request.domain or email.split("@")[1]
+
+    # Concurrent identical submissions (double-clicks) share one pipeline run;
+    # stage updates go to the job that started it, progress events to every job
+    flight_key = (
+        email, domain, request.firstName, request.lastName, request.company,
+        request.industry, request.goal, request.persona, request.cta,
+        select_fetch_plan(request.fetch_plan, request.cta)
+    )
+    with job_events_scope(job_id):
+        _record_job(supabase, job_id, "processing", lease, stage=JOB_STAGE_ENRICHING, started=True)
+        try:
+            # Enrichment and LLM calls size their timeouts from this budget,
+            # which starts when a worker picks the job up
+            with deadline_scope(settings.REQUEST_BUDGET_SECONDS):
+                with shared_job_events(flight_key) as leader_job_id:
+                    if leader_job_id is not None:
+                        logger.info(f"[{job_id}] Sharing the run of job {leader_job_id}")
+                    result = await personalization_flights.do(
+                        flight_key, lambda: _personalize(job_id, request, supabase, orchestrator, lease)
+                    )
+        except Exception as e:
+            logger.error(f"[{job_id}] Enrichment failed: {e}")
+            error_message = str(e) or type(e).__name__
+            _finish_job(supabase, job_id, lease, "failed", error_message=error_message)
+            emit_job_event("failed", {"error_message": error_message})
+            raise
+        if lease is None:
+            _record_job(supabase, job_id, "completed", stage=JOB_STAGE_DONE, result=result)
+        else:
+            _finish_job(supabase, job_id, lease, "completed", result=result)
+        emit_job_event("completed", {"result": result})
+
+
+async def run_claimed_job(job: dict, lease: JobLease) -> None:
+    """
+    JobPoller handler (JOB_QUEUE_MODE=distributed): run a job claimed from
+    personalization_jobs, rebuilding the request from its stored payload.
+
+    Args:
+        job: Claimed personalization_jobs record
+        lease: Lease this worker holds on it
+    """
+    await run_personalization_job(
+        lease.job_id,
+        EnrichmentRequest(**job["request_payload"]),
+        get_supabase_client(),
+        get_rad_orchestrator(),
+        lease=lease
+    )
+
+
 @router.post(
     "/enrich",
     response_model=EnrichmentResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     responses={
         400: {"model": ErrorResponse},
-        500: {"model": ErrorResponse}
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
     }
 )
 async def enrich_profile(
     request: EnrichmentRequest,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    response: Response,
+    supabase: SupabaseClient = Depends(get_supabase_client),
+    orchestrator: RADOrchestrator = Depends(get_rad_orchestrator)
 ) -> EnrichmentResponse:
     """
     POST /rad/enrich
-    
+
     Kick off enrichment for a given email.
-    Returns immediately with job_id for async tracking.
-    
-    In alpha: We run enrichment synchronously but return job_id for future async support.
-    
+    Records a personalization job, queues it for the worker pool and returns
+    202 with its job_id; progress is reported by GET /rad/jobs/{job_id}.
+    Cached profiles are returned directly (200, status "completed").
+
     Args:
         request: EnrichmentRequest with email and optional domain
+        response: Outgoing response (status code set for cached profiles)
         supabase: Supabase client (injected)
-        
+        orchestrator: Shared RADOrchestrator (injected)
+
     Returns:
         EnrichmentResponse with job_id and status
-        
+
     Raises:
-        HTTPException: 400 if email is invalid, 500 if processing fails
+        HTTPException: 400 if email is invalid, 503 if the job queue is full,
+            500 if the job cannot be created
     """
     try:
-        job_id = str(uuid.uuid4())
-        logger.info(f"[{job_id}] Enrichment request for {request.email}")
-
         # Validate email format (Pydantic EmailStr already validates)
         email = request.email.lower().strip()
         domain = request.domain or email.split("@")[1]
+        logger.info(f"Enrichment request for {email}")
 
         # Check for existing enrichment data (cache)
         existing_record = supabase.get_finalize_data(email)
         if existing_record and not request.force_refresh:
-            logger.info(f"[{job_id}] Using cached data for {email} (use force_refresh=true to re-enrich)")
+            logger.info(f"Using cached data for {email} (use force_refresh=true to re-enrich)")
+            response.status_code = status.HTTP_200_OK
             # Return cached data with cache indicator
             return {
-                "job_id": job_id,
+                "job_id": str(uuid.uuid4()),
                 "email": email,
                 "status": "completed",
                 "created_at": existing_record.get("resolved_at", datetime.utcnow().isoformat()),
@@ -83,122 +378,54 @@ async def enrich_profile(
                 "message": "Using cached enrichment data. Set force_refresh=true to re-enrich."
             }
 
-        # Create services
-        orchestrator = RADOrchestrator(supabase)
-        llm_service = LLMService()
-        compliance_service = ComplianceService()
-
-        # Run enrichment (sync in alpha, could be async/queued later)
-        finalized = await orchestrator.enrich(email, domain)
-
-        # Log which data sources returned real vs mock data
-        logger.info(f"[{job_id}] Data sources used: {orchestrator.data_sources}")
-        logger.info(f"[{job_id}] Quality score: {finalized.get('data_quality_score', 0)}")
-
-        # Override enriched data with user-provided info (more reliable than API data)
-        if request.firstName:
-            finalized["first_name"] = request.firstName
-        if request.lastName:
-            finalized["last_name"] = request.lastName
-        if request.company:
-            finalized["company_name"] = request.company
-        if request.industry:
-            finalized["industry"] = request.industry
-
-        # Add user-provided context to the profile for LLM
-        user_context = {
-            "goal": request.goal,
-            "persona": request.persona,
-            "industry_input": request.industry,  # User-selected industry
-            "company": request.company,  # User-provided company name
-            "first_name": request.firstName,
-            "last_name": request.lastName,
-        }
-
-        # Get company news from Tavily (if available in enrichment)
-        company_news = finalized.get("company_context", "")
-
-        # Generate AMD ebook personalization (3 sections)
-        ebook_personalization = await llm_service.generate_ebook_personalization(
-            profile=finalized,
-            user_context=user_context,
-            company_news=company_news
-        )
-
-        # Also generate legacy personalization for backward compatibility
-        use_opus = llm_service.should_use_opus(finalized)
-        personalization = await llm_service.generate_personalization(
-            finalized,
-            use_opus=use_opus,
-            user_context=user_context
-        )
+        # Reject disposable mailboxes now rather than in the background job
+        if settings.REJECT_DISPOSABLE_EMAILS and orchestrator.domain_classifier.classify(email).is_disposable:
+            raise DisposableEmailError(email)
 
-        intro_hook = personalization.get("intro_hook", "")
-        cta = personalization.get("cta", "")
-
-        # Run compliance check on all personalized content
-        compliance_service = ComplianceService()
-        compliance_result = compliance_service.check(intro_hook, cta, auto_correct=True)
-
-        if not compliance_result.passed and compliance_result.corrected_intro:
-            intro_hook = compliance_result.corrected_intro
-            cta = compliance_result.corrected_cta
-            logger.info(f"[{job_id}] Using compliance-corrected content")
-        elif not compliance_result.passed:
-            intro_hook = compliance_service.get_safe_intro(finalized)
-            cta = compliance_service.get_safe_cta(finalized)
-            logger.warning(f"[{job_id}] Compliance failed, using fallback content")
-
-        # Also check ebook personalization
-        ebook_hook = ebook_personalization.get("personalized_hook", "")
-        ebook_cta = ebook_personalization.get("personalized_cta", "")
-        ebook_compliance = compliance_service.check(ebook_hook, ebook_cta, auto_correct=True)
-        if not ebook_compliance.passed and ebook_compliance.corrected_intro:
-            ebook_personalization["personalized_hook"] = ebook_compliance.corrected_intro
-            ebook_personalization["personalized_cta"] = ebook_compliance.corrected_cta
-
-        # Store ebook personalization in normalized_data for PDF generation
-        finalized["ebook_personalization"] = ebook_personalization
-        finalized["user_context"] = user_context
-
-        # Update finalize_data with personalization
-        supabase.upsert_finalize_data(
+        job = supabase.create_job(
             email=email,
-            normalized_data=finalized,
-            intro=intro_hook,
-            cta=cta,
-            data_sources=orchestrator.data_sources
-        )
-        
-        logger.info(f"[{job_id}] Enrichment completed for {email}")
-        
-        # Build response with data source info
-        response = EnrichmentResponse(
-            job_id=job_id,
-            email=email,
-            status="completed",
-            created_at=datetime.utcnow()
+            domain=domain,
+            cta=request.cta,
+            persona=request.persona,
+            company_name=request.company,
+            industry=request.industry,
+            request_payload=request.model_dump(mode="json")
         )
+        job_id = str(job["id"])
+        if settings.JOB_QUEUE_MODE != "distributed":
+            try:
+                get_job_queue().submit(
+                    job_id, lambda: run_personalization_job(job_id, request, supabase, orchestrator)
+                )
+            except QueueFullError:
+                _record_job(supabase, job_id, "failed", error_message="Job queue full")
+                raise
+            get_job_event_bus().publish(job_id, "stage", {"stage": JOB_STAGE_QUEUED})
+        # Distributed: the pending row is the queue; any worker's JobPoller claims it
+        logger.info(f"[{job_id}] Queued enrichment for {email}")
 
-        # Add extra info about data sources (for debugging)
         return {
-            **response.model_dump(),
-            "data_sources": orchestrator.data_sources,
-            "data_quality_score": finalized.get("data_quality_score", 0),
-            "enriched_fields": {
-                "first_name": finalized.get("first_name"),
-                "company_name": finalized.get("company_name"),
-                "title": finalized.get("title"),
-                "industry": finalized.get("industry"),
-            }
+            "job_id": job_id,
+            "email": email,
+            "status": "queued",
+            "created_at": job.get("created_at") or datetime.utcnow(),
+            "status_url": f"/rad/jobs/{job_id}",
+            "events_url": f"/rad/jobs/{job_id}/events",
         }
-        
+
     except ValueError as e:
         logger.warning(f"Validation error for enrichment: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except QueueFullError as e:
+        logger.warning(f"Rejected enrichment for {request.email}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Enrichment queue is full, retry shortly",
+            headers={"Retry-After": "5"}
+        )
     except Exception as e:
         logger.error(f"Enrichment failed: {e}")
         raise HTTPException(
@@ -207,6 +434,134 @@ async def enrich_profile(
         )
 
 
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    responses={
+        404: {"model": ErrorResponse}
+    }
+)
+async def get_job_status(
+    job_id: str,
+    supabase: SupabaseClient = Depends(get_supabase_client)
+) -> JobStatusResponse:
+    """
+    GET /rad/jobs/{job_id}
+
+    Stage-level status of a queued personalization job.
+
+    Args:
+        job_id: Job ID returned by POST /rad/enrich
+        supabase: Supabase client (injected)
+
+    Returns:
+        JobStatusResponse (result summary once completed)
+
+    Raises:
+        HTTPException: 404 if the job does not exist
+    """
+    job = supabase.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No job found with id {job_id}"
+        )
+    return JobStatusResponse(
+        job_id=str(job["id"]),
+        email=job["email"],
+        status=job.get("status", "pending"),
+        stage=job.get("stage") or (JOB_STAGE_QUEUED if job.get("status") == "pending" else None),
+        created_at=job.get("created_at"),
+        started_at=job.get("started_at"),
+        completed_at=job.get("completed_at"),
+        error_message=job.get("error_message"),
+        result=job.get("result")
+    )
+
+
+async def _poll_job_events(supabase: SupabaseClient, job_id: str) -> AsyncIterator[str]:
+    """
+    SSE messages for a job whose events are not in this process (run by
+    another worker, or finished before a restart): stage changes read from
+    personalization_jobs every JOB_POLL_SECONDS, then its outcome.
+    """
+    event_id, last_stage = 0, None
+    while True:
+        job = supabase.get_job(job_id) or {}
+        job_status = job.get("status")
+        stage = job.get("stage") or (JOB_STAGE_QUEUED if job_status == "pending" else None)
+        if stage and stage != last_stage:
+            event_id += 1
+            last_stage = stage
+            yield JobEvent(id=event_id, event="stage", data={"stage": stage}).to_sse()
+        if job_status == "completed":
+            yield JobEvent(id=event_id + 1, event="completed", data={"result": job.get("result")}).to_sse()
+            return
+        if job_status == "failed":
+            data = {"error_message": job.get("error_message")}
+            yield JobEvent(id=event_id + 1, event="failed", data=data).to_sse()
+            return
+        await asyncio.sleep(settings.JOB_POLL_SECONDS)
+
+
+@router.get(
+    "/jobs/{job_id}/events",
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        404: {"model": ErrorResponse}
+    }
+)
+async def stream_job_events(
+    job_id: str,
+    until: Optional[str] = Query(None, description="End the stream at this event instead of completed (e.g. pdf_ready)"),
+    last_event_id: Optional[str] = Header(None),
+    supabase: SupabaseClient = Depends(get_supabase_client)
+) -> StreamingResponse:
+    """
+    GET /rad/jobs/{job_id}/events
+
+    Server-Sent Events stream of a personalization job's progress:
+    stage, provider (one per enrichment source, with a field preview),
+    profile (resolved name/company/title), ebook_hook, compliance,
+    pdf_ready (when a PDF is generated with ?job_id=) and finally
+    completed or failed. Reconnecting clients resume after Last-Event-ID.
+
+    Args:
+        job_id: Job ID returned by POST /rad/enrich
+        until: Event that ends the stream besides failed (default completed)
+        last_event_id: SSE Last-Event-ID header (sent by EventSource on reconnect)
+        supabase: Supabase client (injected)
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: 404 if the job does not exist
+    """
+    bus = get_job_event_bus()
+    if bus.known(job_id):
+        after = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+        terminal = ("failed", until) if until else TERMINAL_EVENTS
+
+        async def events() -> AsyncIterator[str]:
+            async for message in bus.subscribe(job_id, after, terminal, heartbeat=SSE_KEEPALIVE_SECONDS):
+                yield ": keepalive\n\n" if message is None else message.to_sse()
+
+        stream = events()
+    elif supabase.get_job(job_id):
+        stream = _poll_job_events(supabase, job_id)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No job found with id {job_id}"
+        )
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get(
     "/profile/{email}",
     response_model=ProfileResponse,
@@ -416,6 +771,41 @@ async def api_status() -> dict:
     }
 
 
+@router.get("/metrics")
+async def enrichment_metrics() -> dict:
+    """
+    GET /rad/metrics
+
+    Runtime counters for the enrichment layer.
+    Shows the job queue, company cache, negative cache and news index hit rates, request
+    coalescing counters and per-provider rate limiter, circuit breaker, retry
+    and access token state.
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "jobs": get_job_stats(),
+        "company_cache": get_company_cache().stats(),
+        "negative_cache": get_negative_cache().stats(),
+        "news_index": get_news_index().stats(),
+        "coalescing": get_coalescing_stats(),
+        "rate_limits": get_rate_limit_stats(),
+        "circuit_breakers": get_circuit_breaker_stats(),
+        "retries": get_retry_stats(),
+        "tokens": get_token_stats(),
+        "events": get_job_event_bus().stats(),
+        "pdf_artifacts": get_pdf_artifact_cache().stats(),
+    }
+
+
+def _publish_pdf_ready(job_id: Optional[str], result: dict) -> None:
+    """Tell the enrichment job's event stream that its PDF is available."""
+    if job_id:
+        get_job_event_bus().publish(job_id, "pdf_ready", {
+            "pdf_url": result.get("pdf_url"),
+            "file_size_bytes": result.get("file_size_bytes"),
+        })
+
+
 @router.post(
     "/pdf/{email}",
     responses={
@@ -425,6 +815,7 @@ async def api_status() -> dict:
 )
 async def generate_pdf(
     email: str,
+    events_job_id: Optional[str] = Query(None, alias="job_id"),
     supabase: SupabaseClient = Depends(get_supabase_client)
 ) -> dict:
     """
@@ -435,6 +826,7 @@ async def generate_pdf(
 
     Args:
         email: Email address to generate PDF for
+        events_job_id: Enrichment job to publish pdf_ready to (?job_id=)
         supabase: Supabase client (injected)
 
     Returns:
@@ -462,27 +854,14 @@ async def generate_pdf(
         # Initialize PDF service
         pdf_service = PDFService(supabase)
 
-        # Get profile data
-        normalized_data = finalized_record.get("normalized_data", {})
-        ebook_personalization = normalized_data.get("ebook_personalization", {})
-        user_context = normalized_data.get("user_context", {})
-
-        # Generate AMD ebook PDF with 3 personalization points
-        if ebook_personalization:
-            result = await pdf_service.generate_amd_ebook(
-                job_id=job_id,
-                profile=normalized_data,
-                personalization=ebook_personalization,
-                user_context=user_context
-            )
-        else:
-            # Fallback to legacy template
-            result = await pdf_service.generate_pdf(
-                job_id=job_id,
-                profile=normalized_data,
-                intro_hook=finalized_record.get("personalization_intro", ""),
-                cta=finalized_record.get("personalization_cta", "")
-            )
+        # Render (AMD ebook template, or legacy without ebook personalization)
+        # and upload; reuses the PDF already rendered/uploaded for this content
+        artifact = await pdf_service.render_profile_pdf(
+            finalized_record.get("normalized_data", {}),
+            intro_hook=finalized_record.get("personalization_intro", ""),
+            cta=finalized_record.get("personalization_cta", "")
+        )
+        result = await pdf_service.store_artifact(artifact, job_id, email)
 
         # Store PDF delivery record
         try:
@@ -496,6 +875,7 @@ async def generate_pdf(
             logger.warning(f"Failed to store PDF delivery record: {e}")
 
         logger.info(f"PDF generated for {email}: {result.get('file_size_bytes')} bytes")
+        _publish_pdf_ready(events_job_id, result)
 
         return {
             "email": email,
@@ -525,6 +905,7 @@ async def generate_pdf(
 )
 async def deliver_ebook(
     email: str,
+    events_job_id: Optional[str] = Query(None, alias="job_id"),
     supabase: SupabaseClient = Depends(get_supabase_client)
 ) -> dict:
     """
@@ -535,6 +916,7 @@ async def deliver_ebook(
 
     Args:
         email: Email address to deliver ebook to
+        events_job_id: Enrichment job to publish pdf_ready to (?job_id=)
         supabase: Supabase client (injected)
 
     Returns:
@@ -561,53 +943,27 @@ async def deliver_ebook(
         cta = finalized_record.get("personalization_cta", "")
         job_id = finalized_record.get("id", 0)
         ebook_personalization = profile.get("ebook_personalization", {})
-        user_context = profile.get("user_context", {})
 
         # Initialize services
         pdf_service = PDFService(supabase)
         email_service = EmailService()
 
-        # Generate PDF (get raw bytes for email attachment)
-        if ebook_personalization:
-            html_content = pdf_service._render_amd_ebook_template(
+        # Render once: the same bytes are attached, uploaded and recorded
+        artifact = await pdf_service.render_profile_pdf(profile, intro_hook=intro_hook, cta=cta)
+
+        # Send the email and store the PDF for fallback download concurrently
+        email_result, pdf_result = await asyncio.gather(
+            email_service.send_ebook(
+                to_email=email,
+                pdf_bytes=artifact.pdf_bytes,
                 profile=profile,
-                personalized_hook=ebook_personalization.get("personalized_hook", ""),
-                case_study=pdf_service._get_case_study_for_profile(profile, user_context),
-                case_study_framing=ebook_personalization.get("case_study_framing", ""),
-                personalized_cta=ebook_personalization.get("personalized_cta", ""),
-                user_context=user_context
-            )
-        else:
-            html_content = pdf_service._render_template(profile, intro_hook, cta)
-        pdf_bytes = await pdf_service._html_to_pdf(html_content)
-
-        if not pdf_bytes:
-            raise ValueError("PDF generation returned empty content")
-
-        # Try to send email
-        email_result = await email_service.send_ebook(
-            to_email=email,
-            pdf_bytes=pdf_bytes,
-            profile=profile,
-            intro_hook=ebook_personalization.get("personalized_hook", intro_hook),
-            cta=ebook_personalization.get("personalized_cta", cta)
+                intro_hook=ebook_personalization.get("personalized_hook", intro_hook),
+                cta=ebook_personalization.get("personalized_cta", cta)
+            ),
+            pdf_service.store_artifact(artifact, job_id, email)
         )
 
-        # Also store PDF for fallback download
-        if ebook_personalization:
-            pdf_result = await pdf_service.generate_amd_ebook(
-                job_id=job_id,
-                profile=profile,
-                personalization=ebook_personalization,
-                user_context=user_context
-            )
-        else:
-            pdf_result = await pdf_service.generate_pdf(
-                job_id=job_id,
-                profile=profile,
-                intro_hook=intro_hook,
-                cta=cta
-            )
+        _publish_pdf_ready(events_job_id, pdf_result)
 
         # Store delivery record
         try:
@@ -663,7 +1019,7 @@ async def download_pdf(
     GET /rad/download/{email}
 
     Download personalized PDF directly as a file.
-    No storage required - generates and streams the PDF.
+    No storage required - generates (or reuses a recent render of) and streams the PDF.
 
     Args:
         email: Email address to generate PDF for
@@ -686,32 +1042,17 @@ async def download_pdf(
             )
 
         profile = finalized_record.get("normalized_data", {})
-        intro_hook = finalized_record.get("personalization_intro", "")
-        cta = finalized_record.get("personalization_cta", "")
 
         # Initialize PDF service
         pdf_service = PDFService(supabase)
 
-        # Get ebook personalization if available
-        ebook_personalization = profile.get("ebook_personalization", {})
-        user_context = profile.get("user_context", {})
-
-        # Generate PDF bytes directly
-        if ebook_personalization:
-            html_content = pdf_service._render_amd_ebook_template(
-                profile=profile,
-                personalized_hook=ebook_personalization.get("personalized_hook", ""),
-                case_study=pdf_service._get_case_study_for_profile(profile, user_context),
-                case_study_framing=ebook_personalization.get("case_study_framing", ""),
-                personalized_cta=ebook_personalization.get("personalized_cta", ""),
-                user_context=user_context
-            )
-        else:
-            html_content = pdf_service._render_template(profile, intro_hook, cta)
-        pdf_bytes = await pdf_service._html_to_pdf(html_content)
-
-        if not pdf_bytes:
-            raise ValueError("PDF generation returned empty content")
+        # PDF bytes (reuses a PDF just rendered by /rad/deliver or /rad/pdf)
+        artifact = await pdf_service.render_profile_pdf(
+            profile,
+            intro_hook=finalized_record.get("personalization_intro", ""),
+            cta=finalized_record.get("personalization_cta", "")
+        )
+        pdf_bytes = artifact.pdf_bytes
 
         # Generate filename
         first_name = profile.get("first_name", "user")
@@ -0,0 +1,232 @@
+"""
+Record/replay cassettes for enrichment provider calls.
+In record mode every provider response is written to a gzip-compressed
+cassette with its latency; in replay mode calls are answered from cassettes
+(after the recorded latency, optionally scaled) and never reach the network.
+Cassettes are keyed by provider, endpoint (path below the provider's base URL)
+and normalized parameters with secrets removed. The key's hash is the file
+path (<root>/<provider>/<2 hex>/<hash>.json.gz), so a lookup is one file read
+however many profiles are recorded.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# Request/response JSON keys never written to disk (matched case-insensitively)
+SECRET_KEYS = frozenset({
+    "api_key", "apikey", "token", "access_token", "refresh_token", "id_token", "jwt", "key",
+    "username", "password", "client_secret", "authorization", "x-api-key",
+})
+
+# Response headers kept in cassettes
+RECORDED_HEADERS = ("content-type", "retry-after")
+
+SCRUBBED = "<scrubbed>"
+
+
+def scrub(value: Any) -> Any:
+    """Replace values of secret keys, recursively."""
+    if isinstance(value, dict):
+        return {
+            key: SCRUBBED if str(key).lower() in SECRET_KEYS else scrub(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [scrub(item) for item in value]
+    return value
+
+
+def scrub_body(text: str) -> str:
+    """Scrub secrets (e.g. auth tokens) from a JSON response body; other bodies are kept as-is."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    return json.dumps(scrub(data))
+
+
+class CassetteStore:
+    """On-disk cassette store for one recording session or corpus."""
+
+    def __init__(self, root: str, mode: str = MODE_REPLAY, latency_scale: float = 1.0):
+        """
+        Initialize store.
+
+        Args:
+            root: Cassette directory
+            mode: MODE_RECORD or MODE_REPLAY
+            latency_scale: Factor applied to recorded latencies on replay (0 = no delay)
+        """
+        self.root = Path(root)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.stats_counters = {"recorded": 0, "replayed": 0, "missing": 0}
+
+    @staticmethod
+    def normalize(
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None
+    ) -> Dict[str, Any]:
+        """Canonical, secret-free description of a request."""
+        return {
+            "method": method.upper(),
+            "endpoint": "/" + endpoint.strip("/"),
+            "params": scrub(dict(params or {})),
+            "body": scrub(body),
+        }
+
+    def key(self, provider: str, request: Dict[str, Any]) -> str:
+        """Hash of provider + normalized request."""
+        canonical = json.dumps([provider, request], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def path(self, provider: str, key: str) -> Path:
+        """Cassette file for a key (sharded so no directory gets huge)."""
+        return self.root / provider / key[:2] / f"{key}.json.gz"
+
+    async def record(
+        self,
+        provider: str,
+        request: Dict[str, Any],
+        response: httpx.Response,
+        latency: float
+    ) -> None:
+        """
+        Write a response to its cassette (replacing any earlier recording).
+        Secret keys in JSON bodies (e.g. the JWT from an auth exchange) are scrubbed;
+        replay serves the placeholder.
+
+        Args:
+            provider: Provider name
+            request: normalize() output
+            response: Provider response
+            latency: Seconds the call took
+        """
+        entry = {
+            "provider": provider,
+            "request": request,
+            "status_code": response.status_code,
+            "headers": {h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+            "body": scrub_body(response.text),
+            "latency": round(latency, 4),
+            "recorded_at": datetime.utcnow().isoformat(),
+        }
+        path = self.path(provider, self.key(provider, request))
+        try:
+            await asyncio.to_thread(self._write, path, entry)
+            self.stats_counters["recorded"] += 1
+        except OSError as e:
+            logger.warning(f"Failed to record cassette {path}: {e}")
+
+    @staticmethod
+    def _write(path: Path, entry: Dict[str, Any]) -> None:
+        """Write atomically so concurrent readers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(json.dumps(entry).encode()))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    async def lookup(self, provider: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Load the cassette for a request.
+
+        Returns:
+            Recorded entry, or None if nothing was recorded
+        """
+        path = self.path(provider, self.key(provider, request))
+        try:
+            data = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            self.stats_counters["missing"] += 1
+            return None
+        return json.loads(gzip.decompress(data))
+
+    async def replay(
+        self,
+        provider: str,
+        request: Dict[str, Any],
+        url: str
+    ) -> Optional[httpx.Response]:
+        """
+        Serve a recorded response after its (scaled) recorded latency.
+
+        Args:
+            provider: Provider name
+            request: normalize() output
+            url: Request URL (attached to the response)
+
+        Returns:
+            httpx.Response, or None if nothing was recorded
+        """
+        entry = await self.lookup(provider, request)
+        if entry is None:
+            return None
+        delay = entry.get("latency", 0) * self.latency_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.stats_counters["replayed"] += 1
+        return httpx.Response(
+            entry["status_code"],
+            headers=entry.get("headers", {}),
+            content=entry["body"].encode(),
+            request=httpx.Request(request["method"], url),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get mode and counters."""
+        return {**self.stats_counters, "mode": self.mode, "root": str(self.root)}
+
+
+def request_endpoint(base_url: str, url: str) -> str:
+    """Path of `url` below a provider's base URL (so cassettes survive base URL overrides)."""
+    if url.startswith(base_url):
+        return url[len(base_url):]
+    return httpx.URL(url).path
+
+
+# Global instance (lazy-loaded)
+_cassette_store: Optional[CassetteStore] = None
+
+
+def get_cassette_store() -> Optional[CassetteStore]:
+    """
+    Get the global cassette store.
+
+    Returns:
+        CassetteStore, or None when CASSETTE_MODE is off
+    """
+    global _cassette_store
+    if settings.CASSETTE_MODE not in (MODE_RECORD, MODE_REPLAY):
+        return None
+    if _cassette_store is None or _cassette_store.mode != settings.CASSETTE_MODE:
+        _cassette_store = CassetteStore(
+            settings.CASSETTE_DIR,
+            mode=settings.CASSETTE_MODE,
+            latency_scale=settings.CASSETTE_LATENCY_SCALE
+        )
+    return _cassette_store
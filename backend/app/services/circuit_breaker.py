@@ -0,0 +1,195 @@
+"""
+Circuit breakers for enrichment providers.
+A degraded vendor otherwise costs every enrichment a full request timeout.
+Each provider's breaker watches a rolling window of calls and opens when the
+error rate or slow-call rate is too high; while open, calls fail immediately.
+After a cool-down it goes half-open and lets a few probe requests through to
+decide whether to close again.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker over a rolling time window of calls.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        failure_rate: Optional[float] = None,
+        slow_call_seconds: Optional[float] = None,
+        slow_call_rate: Optional[float] = None,
+        open_seconds: Optional[float] = None,
+        half_open_probes: Optional[int] = None
+    ):
+        """
+        Initialize breaker (unset thresholds default to settings).
+
+        Args:
+            name: Provider name (for logs/metrics)
+            window_seconds: Length of the rolling window
+            min_calls: Calls needed in the window before the breaker may trip
+            failure_rate: Error ratio that opens the breaker
+            slow_call_seconds: Latency above which a call counts as slow
+            slow_call_rate: Slow-call ratio that opens the breaker
+            open_seconds: Cool-down before probing a tripped provider
+            half_open_probes: Successful probes needed to close again
+        """
+        self.name = name
+        self.window_seconds = window_seconds or settings.CIRCUIT_WINDOW_SECONDS
+        self.min_calls = min_calls or settings.CIRCUIT_MIN_CALLS
+        self.failure_rate = failure_rate or settings.CIRCUIT_FAILURE_RATE
+        self.slow_call_seconds = slow_call_seconds or settings.CIRCUIT_SLOW_CALL_SECONDS
+        self.slow_call_rate = slow_call_rate or settings.CIRCUIT_SLOW_CALL_RATE
+        self.open_seconds = open_seconds or settings.CIRCUIT_OPEN_SECONDS
+        self.half_open_probes = half_open_probes or settings.CIRCUIT_HALF_OPEN_PROBES
+
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # (timestamp, failed, slow) per finished call
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        self.stats_counters = {"rejected": 0, "opened": 0}
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may be sent now.
+        In half-open state, admits up to `half_open_probes` concurrent probes.
+
+        Returns:
+            True if the call may proceed
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self.stats_counters["rejected"] += 1
+                return False
+            self._transition(HALF_OPEN)
+
+        if self.state == HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                self.stats_counters["rejected"] += 1
+                return False
+            self._probes_in_flight += 1
+
+        return True
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker will admit a probe."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def record_success(self, latency: float) -> None:
+        """Record a finished call that got a usable response."""
+        slow = latency >= self.slow_call_seconds
+        if self.state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if slow:
+                self._trip(f"slow probe ({latency:.1f}s)")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_probes:
+                self._transition(CLOSED)
+            return
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed call (timeout, connection error, 5xx)."""
+        if self.state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._trip("probe failed")
+            return
+        self._record(failed=True, slow=latency >= self.slow_call_seconds)
+
+    def record_abandoned(self) -> None:
+        """Release a probe slot for a call that was cancelled before finishing."""
+        if self.state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        """Add a call to the rolling window and trip if thresholds are exceeded."""
+        now = time.monotonic()
+        self._calls.append((now, failed, slow))
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+        if self.state != CLOSED or len(self._calls) < self.min_calls:
+            return
+        total = len(self._calls)
+        error_rate = sum(1 for _, f, _ in self._calls if f) / total
+        slow_rate = sum(1 for _, _, s in self._calls if s) / total
+        if error_rate >= self.failure_rate:
+            self._trip(f"error rate {error_rate:.0%} over {total} calls")
+        elif slow_rate >= self.slow_call_rate:
+            self._trip(f"slow-call rate {slow_rate:.0%} over {total} calls")
+
+    def _trip(self, reason: str) -> None:
+        """Open the breaker."""
+        logger.warning(f"Circuit for {self.name} opened: {reason}")
+        self.stats_counters["opened"] += 1
+        self._opened_at = time.monotonic()
+        self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        """Switch state and reset per-state bookkeeping."""
+        if state != self.state:
+            logger.info(f"Circuit for {self.name}: {self.state} -> {state}")
+        self.state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state == CLOSED:
+            self._calls.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get state and window counters."""
+        return {
+            **self.stats_counters,
+            "state": self.state,
+            "window_calls": len(self._calls),
+            "window_failures": sum(1 for _, f, _ in self._calls if f),
+            "retry_in": round(self.retry_in(), 3),
+        }
+
+
+# Global registry (one breaker per provider, lazy-loaded)
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(source: str) -> Optional[CircuitBreaker]:
+    """
+    Get or create the breaker for a provider.
+
+    Args:
+        source: Provider name
+
+    Returns:
+        Shared CircuitBreaker, or None if breakers are disabled
+    """
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+    breaker = _circuit_breakers.get(source)
+    if breaker is None:
+        breaker = CircuitBreaker(source)
+        _circuit_breakers[source] = breaker
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for all providers that have made requests."""
+    return {source: breaker.stats() for source, breaker in _circuit_breakers.items()}
@@ -0,0 +1,94 @@
+"""
+Single-flight request coalescing.
+Concurrent callers asking for the same key share one in-flight call instead
+of each hitting providers/LLMs (double-clicks, bursts from one company).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent async calls by key.
+    The first caller (leader) starts the call; callers arriving while it is in
+    flight await the same task. Results are not cached after completion.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize a flight group.
+
+        Args:
+            name: Group name used in logs and metrics
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.misses = 0      # Calls that started new work
+        self.coalesced = 0   # Calls that joined in-flight work
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() once per key among concurrent callers.
+
+        The shared task is shielded, so a cancelled caller does not cancel
+        the work other callers are waiting on.
+
+        Args:
+            key: Coalescing key (e.g. normalized email)
+            fn: Zero-arg coroutine factory for the actual work
+
+        Returns:
+            Result of the shared call (the same object for all callers)
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.coalesced += 1
+            logger.info(f"[{self.name}] Coalesced request for {key}")
+            return await asyncio.shield(task)
+
+        self.misses += 1
+        task = loop.create_task(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalesce/miss counters."""
+        total = self.misses + self.coalesced
+        return {
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "coalesce_rate": round(self.coalesced / total, 3) if total else 0.0,
+        }
+
+
+# Process-wide flight groups
+personalization_flights = SingleFlight("personalization")  # Full /rad/enrich pipeline
+enrichment_flights = SingleFlight("email")                  # RADOrchestrator.enrich per email
+company_flights = SingleFlight("domain")                    # Company-level sources per domain
+pdf_flights = SingleFlight("pdf")                           # PDF render/upload per content hash
+news_flights = SingleFlight("news")                         # News index refresh per company
+
+
+def get_coalescing_stats() -> Dict[str, Dict[str, Any]]:
+    """Get counters for all flight groups."""
+    return {
+        group.name: group.stats()
+        for group in (
+            personalization_flights, enrichment_flights, company_flights, pdf_flights, news_flights
+        )
+    }
@@ -0,0 +1,88 @@
+"""
+Request-level time budgets.
+A Deadline is set once per request (e.g. 20s for /rad/enrich) and carried in a
+context variable, so the orchestrator and LLM service can size their own
+timeouts from whatever is left instead of each using a fixed worst case.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class Deadline:
+    """A point in time by which work must finish."""
+
+    def __init__(self, budget: float):
+        """
+        Initialize deadline.
+
+        Args:
+            budget: Seconds from now
+        """
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def cap(self, timeout: float) -> float:
+        """
+        Clamp a timeout to the time left.
+
+        Args:
+            timeout: Desired timeout in seconds
+
+        Returns:
+            min(timeout, remaining)
+        """
+        return min(timeout, self.remaining())
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the current request, if any."""
+    return _current_deadline.get()
+
+
+def remaining_budget(timeout: float) -> float:
+    """
+    Clamp a timeout to the current request's deadline (if one is set).
+
+    Args:
+        timeout: Desired timeout in seconds
+
+    Returns:
+        Timeout to use
+    """
+    deadline = current_deadline()
+    return deadline.cap(timeout) if deadline else timeout
+
+
+@contextmanager
+def deadline_scope(budget: float) -> Iterator[Deadline]:
+    """
+    Run a block under a deadline.
+    A nested scope can only shorten the deadline, never extend it.
+
+    Args:
+        budget: Seconds from now
+    """
+    deadline = Deadline(budget)
+    outer = current_deadline()
+    if outer and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
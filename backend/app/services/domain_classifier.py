@@ -0,0 +1,147 @@
+"""
+Email domain classification for RAD pipeline.
+Classifies addresses with the bundled lists in assets/domains (free-mail,
+disposable, education, government domains and role mailbox names) so the
+orchestrator can skip company-level lookups for personal mailboxes and reject
+disposable ones before any paid provider call. Lists are plain text files
+(one entry per line), loaded once into sets; a domain is looked up by walking
+its label suffixes (mail.yahoo.co.uk -> yahoo.co.uk -> co.uk -> uk), so an
+entry also covers its subdomains and suffixes like "ac.uk" cover whole zones.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DOMAIN_LIST_DIR = Path(__file__).parent.parent.parent / "assets" / "domains"
+
+FREEMAIL = "freemail"
+DISPOSABLE = "disposable"
+EDUCATION = "education"
+GOVERNMENT = "government"
+CORPORATE = "corporate"
+
+# Domain list file per category; when lists overlap the first category wins
+DOMAIN_LISTS = {
+    DISPOSABLE: "disposable.txt",
+    FREEMAIL: "freemail.txt",
+    EDUCATION: "education.txt",
+    GOVERNMENT: "government.txt",
+}
+ROLE_LIST = "role.txt"
+
+
+class DisposableEmailError(ValueError):
+    """Raised when enrichment is requested for a disposable mailbox."""
+
+    def __init__(self, email: str):
+        self.email = email
+        super().__init__(f"Disposable email domains are not accepted: {email.split('@')[-1]}")
+
+
+@dataclass(frozen=True)
+class EmailClassification:
+    """Classification of one email address."""
+    domain: str
+    domain_type: str  # freemail, disposable, education, government or corporate
+    role_account: bool = False
+
+    @property
+    def is_personal(self) -> bool:
+        """Mailbox at a free-mail provider (its domain says nothing about the employer)."""
+        return self.domain_type == FREEMAIL
+
+    @property
+    def is_disposable(self) -> bool:
+        """Mailbox at a throwaway provider."""
+        return self.domain_type == DISPOSABLE
+
+
+def _read_list(path: Path) -> Set[str]:
+    """Read one list file (blank lines and # comments ignored)."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        logger.warning(f"Domain list not found: {path}")
+        return set()
+    return {
+        line.split("#", 1)[0].strip().lower()
+        for line in lines
+        if line.split("#", 1)[0].strip()
+    }
+
+
+class DomainClassifier:
+    """Domain/suffix index built from the list files in one directory."""
+
+    def __init__(self, list_dir: Optional[str] = None):
+        """
+        Initialize classifier and load the lists.
+
+        Args:
+            list_dir: Directory with the list files (defaults to DOMAIN_LISTS_DIR or assets/domains)
+        """
+        self.list_dir = Path(list_dir or settings.DOMAIN_LISTS_DIR or DOMAIN_LIST_DIR)
+        self._categories: Dict[str, str] = {}
+        self._role_names: Set[str] = set()
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the list files (e.g. after updating them)."""
+        categories: Dict[str, str] = {}
+        for category, filename in reversed(list(DOMAIN_LISTS.items())):
+            categories.update(dict.fromkeys(_read_list(self.list_dir / filename), category))
+        self._categories = categories
+        self._role_names = _read_list(self.list_dir / ROLE_LIST)
+        logger.info(f"Loaded {len(categories)} classified domains from {self.list_dir}")
+
+    def classify_domain(self, domain: str) -> str:
+        """
+        Classify a domain by its most specific listed suffix.
+
+        Args:
+            domain: Domain (or full email address)
+
+        Returns:
+            Category name, or CORPORATE if no list matches
+        """
+        labels = domain.rsplit("@", 1)[-1].strip().lower().rstrip(".").split(".")
+        for i in range(len(labels)):
+            category = self._categories.get(".".join(labels[i:]))
+            if category:
+                return category
+        return CORPORATE
+
+    def classify(self, email: str) -> EmailClassification:
+        """
+        Classify an email address.
+
+        Args:
+            email: Email address
+
+        Returns:
+            EmailClassification for its domain and local part
+        """
+        local, _, domain = email.strip().lower().rpartition("@")
+        return EmailClassification(
+            domain=domain,
+            domain_type=self.classify_domain(domain),
+            role_account=local.split("+", 1)[0] in self._role_names,
+        )
+
+
+# Global instance (lazy-loaded)
+_domain_classifier: Optional[DomainClassifier] = None
+
+
+def get_domain_classifier() -> DomainClassifier:
+    """Get the global domain classifier (lists are loaded on first use)."""
+    global _domain_classifier
+    if _domain_classifier is None:
+        _domain_classifier = DomainClassifier()
+    return _domain_classifier
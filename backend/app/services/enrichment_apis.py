@@ -6,12 +6,26 @@ All API keys loaded from environment variables.
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+import os
+import time
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import httpx
 from abc import ABC, abstractmethod
 
 from app.config import settings
+from app.services.http_pool import get_http_pool
+from app.services.circuit_breaker import get_circuit_breaker
+from app.services.rate_limiter import get_rate_limiter, parse_retry_after
+from app.services.news_index import get_news_index
+from app.services.news_analytics import analyze_articles
+from app.services.payload_decoding import decode_payload
+from app.services.cassettes import MODE_REPLAY, get_cassette_store, request_endpoint
+from app.services.deadline import remaining_budget
+from app.services.domain_classifier import DISPOSABLE, FREEMAIL, get_domain_classifier
+from app.services.retry_policy import RetryPolicy, deadline_allows, get_retry_budget
+from app.services.token_manager import get_token_manager, jwt_lifetime
 
 logger = logging.getLogger(__name__)
 
@@ -22,35 +36,228 @@ DEFAULT_TIMEOUT = 45.0
 DEEP_ENRICHMENT_TIMEOUT = 60.0
 
 
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most `size` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def provider_base_url(source: str, default: str) -> str:
+    """
+    Resolve a provider's base URL.
+    `<SOURCE>_BASE_URL` wins, then PROVIDER_BASE_URL + "/<source>" (the local
+    stand-in server, scripts/fake_provider_server.py), then the vendor URL.
+
+    Args:
+        source: Provider name
+        default: Vendor base URL
+
+    Returns:
+        Base URL without trailing slash
+    """
+    override = os.getenv(f"{source.upper()}_BASE_URL")
+    if override:
+        return override.rstrip("/")
+    if settings.PROVIDER_BASE_URL:
+        return f"{settings.PROVIDER_BASE_URL.rstrip('/')}/{source}"
+    return default
+
+
 class EnrichmentAPIError(Exception):
     """Base exception for enrichment API errors."""
 
-    def __init__(self, source: str, message: str, status_code: Optional[int] = None):
+    def __init__(
+        self,
+        source: str,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None
+    ):
         self.source = source
         self.message = message
         self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(f"{source}: {message}")
 
 
+class CircuitOpenError(EnrichmentAPIError):
+    """Raised without sending a request while a provider's circuit is open."""
+
+    def __init__(self, source: str, retry_in: float = 0.0):
+        super().__init__(source, f"Circuit open, retry in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
 class BaseEnrichmentAPI(ABC):
     """Base class for enrichment API integrations."""
 
     source_name: str = "unknown"
+    retry_policy: RetryPolicy = RetryPolicy()
 
     @abstractmethod
     async def enrich(self, email: str, domain: Optional[str] = None) -> Dict[str, Any]:
         """Enrich data for given email/domain."""
         pass
 
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request through this provider's pooled HTTP client.
+        Fails fast while the provider's circuit breaker is open, waits for its
+        rate limiter, and feeds the outcome back into both
+        (see app.services.circuit_breaker and app.services.rate_limiter).
+        Transient failures are retried per `retry_policy` while the request
+        deadline and the provider's retry budget allow
+        (see app.services.retry_policy).
+        With CASSETTE_MODE=record responses are also saved to cassettes; with
+        CASSETTE_MODE=replay they are served from cassettes instead
+        (see app.services.cassettes).
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            timeout: Request timeout in seconds
+            **kwargs: Passed through to httpx (params, json, headers)
+
+        Returns:
+            httpx.Response (status is not checked; see _handle_error)
+
+        Raises:
+            CircuitOpenError: If the provider's circuit is open
+            EnrichmentAPIError: In replay mode, if no cassette matches
+        """
+        cassettes = get_cassette_store()
+        recorded_request = None
+        if cassettes:
+            recorded_request = cassettes.normalize(
+                method, request_endpoint(self.base_url, url), kwargs.get("params"), kwargs.get("json")
+            )
+            if cassettes.mode == MODE_REPLAY:
+                response = await cassettes.replay(self.source_name, recorded_request, url)
+                if response is None:
+                    raise EnrichmentAPIError(
+                        self.source_name, f"No cassette for {method} {recorded_request['endpoint']}"
+                    )
+                return response
+
+        policy = self.retry_policy
+        budget = get_retry_budget(self.source_name)
+        if budget:
+            budget.record_request()
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(
+                    method, url, remaining_budget(timeout), recorded_request, **kwargs
+                )
+                error = None
+            except CircuitOpenError:
+                if attempt == 1:
+                    raise
+                # Circuit opened while backing off: report the last failure instead
+                if error is not None:
+                    raise error
+                return response
+            except policy.retry_exceptions as e:
+                response, error = None, e
+
+            if error is None and response.status_code not in policy.retry_statuses:
+                if attempt > 1:
+                    budget.stats_counters["recovered"] += 1
+                return response
+
+            retry_after = None if response is None else parse_retry_after(response.headers.get("Retry-After"))
+            delay = policy.backoff(attempt, retry_after)
+            if not budget or delay is None:
+                give_up = True
+            elif attempt >= policy.attempts:
+                budget.stats_counters["exhausted"] += 1
+                give_up = True
+            elif not deadline_allows(delay):
+                budget.stats_counters["deadline_denied"] += 1
+                give_up = True
+            else:
+                give_up = not budget.try_spend()
+
+            if give_up:
+                if error is not None:
+                    raise error
+                return response
+
+            outcome = type(error).__name__ if error is not None else response.status_code
+            logger.info(
+                f"{self.source_name}: retrying {method} after {outcome} "
+                f"(attempt {attempt + 1} in {delay:.2f}s)"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        recorded_request: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Send one attempt (breaker, limiter, pooled client, cassette recording)."""
+        breaker = get_circuit_breaker(self.source_name)
+        if breaker and not breaker.allow_request():
+            raise CircuitOpenError(self.source_name, breaker.retry_in())
+
+        client = get_http_pool().get(self.source_name)
+        limiter = get_rate_limiter(self.source_name)
+        started = time.monotonic()
+        try:
+            async with limiter.slot() if limiter else nullcontext():
+                started = time.monotonic()  # Latency excludes time queued in the limiter
+                response = await client.request(method, url, timeout=timeout, **kwargs)
+                latency = time.monotonic() - started
+        except Exception:
+            if breaker:
+                breaker.record_failure(time.monotonic() - started)
+            raise
+        except BaseException:
+            if breaker:
+                breaker.record_abandoned()
+            raise
+
+        if limiter:
+            if response.status_code == 429:
+                limiter.on_throttle(parse_retry_after(response.headers.get("Retry-After")))
+            elif response.status_code < 500:
+                limiter.on_success()
+        if breaker:
+            if response.status_code >= 500:
+                breaker.record_failure(latency)
+            else:
+                breaker.record_success(latency)
+        if recorded_request is not None:
+            await get_cassette_store().record(self.source_name, recorded_request, response, latency)
+        return response
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle API error response."""
         if response.status_code >= 400:
             raise EnrichmentAPIError(
                 source=self.source_name,
                 message=f"API returned {response.status_code}: {response.text[:200]}",
-                status_code=response.status_code
+                status_code=response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After"))
             )
 
+    def _not_found(self, key: str) -> Dict[str, Any]:
+        """Result for a lookup the provider had no match for (negative-cached upstream)."""
+        return {"_error": f"No {self.source_name} match for {key}", "_not_found": True}
+
+    def _decode(self, response: httpx.Response, schema: str) -> Any:
+        """Decode a JSON response, keeping only the fields PAYLOAD_SCHEMAS[schema] declares."""
+        return decode_payload(schema, response.content)
+
 
 class ApolloAPI(BaseEnrichmentAPI):
     """
@@ -60,9 +267,11 @@ class ApolloAPI(BaseEnrichmentAPI):
 
     source_name = "apollo"
     base_url = "https://api.apollo.io/v1"
+    bulk_size = 10  # Max records per people/bulk_match call
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.APOLLO_API_KEY
+        self.base_url = provider_base_url(self.source_name, self.base_url)
         if not self.api_key:
             logger.warning("Apollo API key not configured")
 
@@ -81,40 +290,23 @@ class ApolloAPI(BaseEnrichmentAPI):
             return self._mock_response(email, domain)
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                response = await client.post(
-                    f"{self.base_url}/people/match",
-                    headers={"Content-Type": "application/json"},
-                    json={
-                        "api_key": self.api_key,
-                        "email": email,
-                        "reveal_personal_emails": False
-                    }
-                )
-
-                self._handle_error(response)
-                data = response.json()
-
-                person = data.get("person", {})
-                return {
+            response = await self._request(
+                "POST",
+                f"{self.base_url}/people/match",
+                headers={"Content-Type": "application/json"},
+                json={
+                    "api_key": self.api_key,
                     "email": email,
-                    "first_name": person.get("first_name"),
-                    "last_name": person.get("last_name"),
-                    "title": person.get("title"),
-                    "linkedin_url": person.get("linkedin_url"),
-                    "company_name": person.get("organization", {}).get("name"),
-                    "domain": person.get("organization", {}).get("primary_domain"),
-                    "industry": person.get("organization", {}).get("industry"),
-                    "company_size": self._map_employee_count(
-                        person.get("organization", {}).get("estimated_num_employees")
-                    ),
-                    "city": person.get("city"),
-                    "state": person.get("state"),
-                    "country": person.get("country"),
-                    "seniority": person.get("seniority"),
-                    "departments": person.get("departments", []),
-                    "fetched_at": datetime.utcnow().isoformat()
+                    "reveal_personal_emails": False
                 }
+            )
+
+            self._handle_error(response)
+            person = self._decode(response, "apollo.match").get("person")
+            if not person:
+                return self._not_found(email)
+
+            return self._parse_person(email, person)
 
         except httpx.TimeoutException:
             logger.error(f"Apollo API timeout for {email}")
@@ -123,6 +315,72 @@ class ApolloAPI(BaseEnrichmentAPI):
             logger.error(f"Apollo API request error for {email}: {e}")
             raise EnrichmentAPIError(self.source_name, str(e))
 
+    async def enrich_many(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich many people via Apollo bulk match (up to 10 per call).
+
+        Args:
+            emails: Email addresses to look up
+
+        Returns:
+            Dict mapping email to enriched person data. Emails whose chunk
+            failed are left out so callers can fall back to enrich().
+        """
+        if not self.api_key:
+            return {email: self._mock_response(email, None) for email in emails}
+
+        async def match_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            try:
+                response = await self._request(
+                    "POST",
+                    f"{self.base_url}/people/bulk_match",
+                    headers={"Content-Type": "application/json"},
+                    json={
+                        "api_key": self.api_key,
+                        "details": [{"email": email} for email in chunk],
+                        "reveal_personal_emails": False
+                    }
+                )
+                self._handle_error(response)
+                matches = self._decode(response, "apollo.bulk_match").get("matches") or []
+            except (EnrichmentAPIError, httpx.RequestError) as e:
+                logger.warning(f"Apollo bulk match failed for {len(chunk)} emails: {e}")
+                return {}
+
+            # Matches are returned in request order (null when not found)
+            return {
+                email: self._parse_person(email, person) if person else self._not_found(email)
+                for email, person in zip(chunk, matches + [None] * (len(chunk) - len(matches)))
+            }
+
+        results = await asyncio.gather(*[
+            match_chunk(chunk) for chunk in chunked(emails, self.bulk_size)
+        ])
+        return {email: data for result in results for email, data in result.items()}
+
+    def _parse_person(self, email: str, person: Dict[str, Any]) -> Dict[str, Any]:
+        """Map an Apollo person record to our enrichment fields."""
+        organization = person.get("organization") or {}
+        return {
+            "email": email,
+            "first_name": person.get("first_name"),
+            "last_name": person.get("last_name"),
+            "title": person.get("title"),
+            "linkedin_url": person.get("linkedin_url"),
+            "company_name": organization.get("name"),
+            "domain": organization.get("primary_domain"),
+            "industry": organization.get("industry"),
+            "company_size": self._map_employee_count(
+                organization.get("estimated_num_employees")
+            ),
+            "city": person.get("city"),
+            "state": person.get("state"),
+            "country": person.get("country"),
+            "seniority": person.get("seniority"),
+            "departments": person.get("departments", []),
+            "fetched_at": datetime.utcnow().isoformat()
+        }
+
     def _mock_response(self, email: str, domain: Optional[str]) -> Dict[str, Any]:
         """Return mock data when API key not configured."""
         logger.info(f"Apollo: Using mock data for {email} (no API key)")
@@ -168,9 +426,11 @@ class PDLAPI(BaseEnrichmentAPI):
 
     source_name = "pdl"
     base_url = "https://api.peopledatalabs.com/v5"
+    bulk_size = 100  # Max records per person/bulk call
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.PDL_API_KEY
+        self.base_url = provider_base_url(self.source_name, self.base_url)
         if not self.api_key:
             logger.warning("PDL API key not configured")
 
@@ -189,34 +449,19 @@ class PDLAPI(BaseEnrichmentAPI):
             return self._mock_response(email, domain)
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                response = await client.get(
-                    f"{self.base_url}/person/enrich",
-                    headers={"X-Api-Key": self.api_key},
-                    params={"email": email}
-                )
+            response = await self._request(
+                "GET",
+                f"{self.base_url}/person/enrich",
+                headers={"X-Api-Key": self.api_key},
+                params={"email": email}
+            )
 
-                self._handle_error(response)
-                data = response.json()
+            if response.status_code == 404:
+                return self._not_found(email)
+            self._handle_error(response)
+            data = self._decode(response, "pdl.person")
 
-                return {
-                    "email": email,
-                    "first_name": data.get("first_name"),
-                    "last_name": data.get("last_name"),
-                    "full_name": data.get("full_name"),
-                    "linkedin_url": data.get("linkedin_url"),
-                    "job_title": data.get("job_title"),
-                    "job_company_name": data.get("job_company_name"),
-                    "job_company_industry": data.get("job_company_industry"),
-                    "job_company_size": data.get("job_company_size"),
-                    "location_country": data.get("location_country"),
-                    "location_region": data.get("location_region"),
-                    "location_locality": data.get("location_locality"),
-                    "skills": data.get("skills", [])[:10],  # Limit skills
-                    "interests": data.get("interests", [])[:10],
-                    "experience": self._extract_recent_experience(data.get("experience", [])),
-                    "fetched_at": datetime.utcnow().isoformat()
-                }
+            return self._parse_person(email, data)
 
         except httpx.TimeoutException:
             logger.error(f"PDL API timeout for {email}")
@@ -225,6 +470,72 @@ class PDLAPI(BaseEnrichmentAPI):
             logger.error(f"PDL API request error for {email}: {e}")
             raise EnrichmentAPIError(self.source_name, str(e))
 
+    async def enrich_many(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich many people via PDL bulk person enrichment (up to 100 per call).
+
+        Args:
+            emails: Email addresses to look up
+
+        Returns:
+            Dict mapping email to enriched person data (or an error dict for
+            records PDL could not match). Emails whose chunk failed are left
+            out so callers can fall back to enrich().
+        """
+        if not self.api_key:
+            return {email: self._mock_response(email, None) for email in emails}
+
+        async def enrich_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            try:
+                response = await self._request(
+                    "POST",
+                    f"{self.base_url}/person/bulk",
+                    headers={"X-Api-Key": self.api_key},
+                    json={"requests": [{"params": {"email": [email]}} for email in chunk]}
+                )
+                self._handle_error(response)
+                records = self._decode(response, "pdl.person_bulk")
+            except (EnrichmentAPIError, httpx.RequestError) as e:
+                logger.warning(f"PDL bulk enrichment failed for {len(chunk)} emails: {e}")
+                return {}
+
+            # One record per request, in request order, each with its own status
+            results = {}
+            for email, record in zip(chunk, records):
+                if record.get("status") == 200 and record.get("data"):
+                    results[email] = self._parse_person(email, record["data"])
+                elif record.get("status") == 404:
+                    results[email] = self._not_found(email)
+                else:
+                    results[email] = {"_error": f"API returned {record.get('status')}"}
+            return results
+
+        results = await asyncio.gather(*[
+            enrich_chunk(chunk) for chunk in chunked(emails, self.bulk_size)
+        ])
+        return {email: data for result in results for email, data in result.items()}
+
+    def _parse_person(self, email: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a PDL person record to our enrichment fields."""
+        return {
+            "email": email,
+            "first_name": data.get("first_name"),
+            "last_name": data.get("last_name"),
+            "full_name": data.get("full_name"),
+            "linkedin_url": data.get("linkedin_url"),
+            "job_title": data.get("job_title"),
+            "job_company_name": data.get("job_company_name"),
+            "job_company_industry": data.get("job_company_industry"),
+            "job_company_size": data.get("job_company_size"),
+            "location_country": data.get("location_country"),
+            "location_region": data.get("location_region"),
+            "location_locality": data.get("location_locality"),
+            "skills": (data.get("skills") or [])[:10],  # Limit skills
+            "interests": (data.get("interests") or [])[:10],
+            "experience": self._extract_recent_experience(data.get("experience", [])),
+            "fetched_at": datetime.utcnow().isoformat()
+        }
+
     def _mock_response(self, email: str, domain: Optional[str]) -> Dict[str, Any]:
         """Return mock data when API key not configured."""
         logger.info(f"PDL: Using mock data for {email} (no API key)")
@@ -257,52 +568,55 @@ class PDLAPI(BaseEnrichmentAPI):
             return self._mock_company_response(domain)
 
         try:
-            async with httpx.AsyncClient(timeout=DEEP_ENRICHMENT_TIMEOUT) as client:
-                response = await client.get(
-                    f"{self.base_url}/company/enrich",
-                    headers={"X-Api-Key": self.api_key},
-                    params={"website": domain}
-                )
+            response = await self._request(
+                "GET",
+                f"{self.base_url}/company/enrich",
+                timeout=DEEP_ENRICHMENT_TIMEOUT,
+                headers={"X-Api-Key": self.api_key},
+                params={"website": domain}
+            )
 
-                self._handle_error(response)
-                data = response.json()
-
-                return {
-                    "domain": domain,
-                    "name": data.get("name"),
-                    "display_name": data.get("display_name"),
-                    "size": data.get("size"),
-                    "employee_count": data.get("employee_count"),
-                    "employee_count_range": data.get("employee_count_range"),
-                    "founded": data.get("founded"),
-                    "industry": data.get("industry"),
-                    "naics": data.get("naics", []),
-                    "sic": data.get("sic", []),
-                    "location": data.get("location"),
-                    "locality": data.get("locality"),
-                    "region": data.get("region"),
-                    "country": data.get("country"),
-                    "type": data.get("type"),  # private, public, nonprofit, etc.
-                    "ticker": data.get("ticker"),
-                    "linkedin_url": data.get("linkedin_url"),
-                    "linkedin_id": data.get("linkedin_id"),
-                    "facebook_url": data.get("facebook_url"),
-                    "twitter_url": data.get("twitter_url"),
-                    "profiles": data.get("profiles", []),
-                    "tags": data.get("tags", [])[:15],  # Industry tags
-                    "headline": data.get("headline"),
-                    "summary": data.get("summary"),
-                    "alternative_names": data.get("alternative_names", []),
-                    "affiliated_profiles": data.get("affiliated_profiles", [])[:5],
-                    "total_funding_raised": data.get("total_funding_raised"),
-                    "latest_funding_stage": data.get("latest_funding_stage"),
-                    "last_funding_date": data.get("last_funding_date"),
-                    "number_funding_rounds": data.get("number_funding_rounds"),
-                    "inferred_revenue": data.get("inferred_revenue"),
-                    "direct_phone_numbers": len(data.get("direct_phone_numbers", [])),  # Count only, not actual numbers
-                    "employee_growth_rate": data.get("employee_growth_rate"),
-                    "fetched_at": datetime.utcnow().isoformat()
-                }
+            if response.status_code == 404:
+                return self._not_found(domain)
+            self._handle_error(response)
+            data = self._decode(response, "pdl.company")
+
+            return {
+                "domain": domain,
+                "name": data.get("name"),
+                "display_name": data.get("display_name"),
+                "size": data.get("size"),
+                "employee_count": data.get("employee_count"),
+                "employee_count_range": data.get("employee_count_range"),
+                "founded": data.get("founded"),
+                "industry": data.get("industry"),
+                "naics": data.get("naics", []),
+                "sic": data.get("sic", []),
+                "location": data.get("location"),
+                "locality": data.get("locality"),
+                "region": data.get("region"),
+                "country": data.get("country"),
+                "type": data.get("type"),  # private, public, nonprofit, etc.
+                "ticker": data.get("ticker"),
+                "linkedin_url": data.get("linkedin_url"),
+                "linkedin_id": data.get("linkedin_id"),
+                "facebook_url": data.get("facebook_url"),
+                "twitter_url": data.get("twitter_url"),
+                "profiles": data.get("profiles", []),
+                "tags": data.get("tags", [])[:15],  # Industry tags
+                "headline": data.get("headline"),
+                "summary": data.get("summary"),
+                "alternative_names": data.get("alternative_names", []),
+                "affiliated_profiles": data.get("affiliated_profiles", [])[:5],
+                "total_funding_raised": data.get("total_funding_raised"),
+                "latest_funding_stage": data.get("latest_funding_stage"),
+                "last_funding_date": data.get("last_funding_date"),
+                "number_funding_rounds": data.get("number_funding_rounds"),
+                "inferred_revenue": data.get("inferred_revenue"),
+                "direct_phone_numbers": len(data.get("direct_phone_numbers", [])),  # Count only, not actual numbers
+                "employee_growth_rate": data.get("employee_growth_rate"),
+                "fetched_at": datetime.utcnow().isoformat()
+            }
 
         except httpx.TimeoutException:
             logger.error(f"PDL Company API timeout for {domain}")
@@ -340,6 +654,7 @@ class HunterAPI(BaseEnrichmentAPI):
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.HUNTER_API_KEY
+        self.base_url = provider_base_url(self.source_name, self.base_url)
         if not self.api_key:
             logger.warning("Hunter API key not configured")
 
@@ -358,34 +673,34 @@ class HunterAPI(BaseEnrichmentAPI):
             return self._mock_response(email, domain)
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                response = await client.get(
-                    f"{self.base_url}/email-verifier",
-                    params={
-                        "email": email,
-                        "api_key": self.api_key
-                    }
-                )
-
-                self._handle_error(response)
-                data = response.json().get("data", {})
-
-                return {
+            response = await self._request(
+                "GET",
+                f"{self.base_url}/email-verifier",
+                params={
                     "email": email,
-                    "status": data.get("status"),  # valid, invalid, accept_all, webmail, disposable, unknown
-                    "result": data.get("result"),  # deliverable, undeliverable, risky, unknown
-                    "score": data.get("score"),  # 0-100
-                    "regexp": data.get("regexp"),
-                    "gibberish": data.get("gibberish"),
-                    "disposable": data.get("disposable"),
-                    "webmail": data.get("webmail"),
-                    "mx_records": data.get("mx_records"),
-                    "smtp_server": data.get("smtp_server"),
-                    "smtp_check": data.get("smtp_check"),
-                    "accept_all": data.get("accept_all"),
-                    "block": data.get("block"),
-                    "fetched_at": datetime.utcnow().isoformat()
+                    "api_key": self.api_key
                 }
+            )
+
+            self._handle_error(response)
+            data = self._decode(response, "hunter.email_verifier").get("data", {})
+
+            return {
+                "email": email,
+                "status": data.get("status"),  # valid, invalid, accept_all, webmail, disposable, unknown
+                "result": data.get("result"),  # deliverable, undeliverable, risky, unknown
+                "score": data.get("score"),  # 0-100
+                "regexp": data.get("regexp"),
+                "gibberish": data.get("gibberish"),
+                "disposable": data.get("disposable"),
+                "webmail": data.get("webmail"),
+                "mx_records": data.get("mx_records"),
+                "smtp_server": data.get("smtp_server"),
+                "smtp_check": data.get("smtp_check"),
+                "accept_all": data.get("accept_all"),
+                "block": data.get("block"),
+                "fetched_at": datetime.utcnow().isoformat()
+            }
 
         except httpx.TimeoutException:
             logger.error(f"Hunter API timeout for {email}")
@@ -397,13 +712,14 @@ class HunterAPI(BaseEnrichmentAPI):
     def _mock_response(self, email: str, domain: Optional[str]) -> Dict[str, Any]:
         """Return mock data when API key not configured."""
         logger.info(f"Hunter: Using mock data for {email} (no API key)")
+        domain_type = get_domain_classifier().classify_domain(email)
         return {
             "email": email,
             "status": "valid",
             "result": "deliverable",
             "score": 90,
-            "disposable": False,
-            "webmail": "@gmail" in email or "@yahoo" in email or "@hotmail" in email,
+            "disposable": domain_type == DISPOSABLE,
+            "webmail": domain_type == FREEMAIL,
             "fetched_at": datetime.utcnow().isoformat(),
             "_mock": True
         }
@@ -414,28 +730,37 @@ class GNewsAPI(BaseEnrichmentAPI):
     GNews API for company news and context.
     Docs: https://gnews.io/docs/v4
 
-    Enhanced to run multiple search queries for comprehensive news coverage:
+    One search per company feeds a cached per-company news index
+    (see app.services.news_index); articles are categorized locally into:
     - Company general news
-    - Company + AI/technology news
-    - Company + industry trends
-    - Company + leadership/strategy
+    - AI/technology news
+    - Leadership/strategy
+    - Growth/partnerships
     """
 
     source_name = "gnews"
     base_url = "https://gnews.io/api/v4"
+    max_results = 10  # Articles per search (plan limit)
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.GNEWS_API_KEY
+        self.base_url = provider_base_url(self.source_name, self.base_url)
         if not self.api_key:
             logger.warning("GNews API key not configured")
 
-    async def enrich(self, email: str, domain: Optional[str] = None) -> Dict[str, Any]:
+    async def enrich(
+        self,
+        email: str,
+        domain: Optional[str] = None,
+        company_name: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Search for company news using GNews with multiple queries.
+        Get company news from the per-company news index.
 
         Args:
             email: Email address (used to extract domain if not provided)
             domain: Company domain
+            company_name: Resolved company name (derived from the domain if not provided)
 
         Returns:
             News articles and company context from multiple angles
@@ -444,37 +769,25 @@ class GNewsAPI(BaseEnrichmentAPI):
             return self._mock_response(email, domain)
 
         domain = domain or email.split("@")[1]
-        # Extract company name from domain (e.g., microsoft.com -> microsoft)
-        company_name = domain.split(".")[0]
+        # Fall back to the domain label (e.g., microsoft.com -> microsoft)
+        company_name = company_name or domain.split(".")[0]
 
         try:
-            # Run multiple search queries in parallel for comprehensive coverage
-            all_articles = await self._fetch_multi_query_news(company_name)
-
-            # Deduplicate articles by URL
-            seen_urls = set()
-            unique_articles = []
-            for article in all_articles:
-                url = article.get("url")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_articles.append(article)
-
-            # Build comprehensive summary
-            answer = self._build_news_summary(company_name, unique_articles)
-
-            # Categorize articles
-            categorized = self._categorize_articles(unique_articles)
+            news_index = get_news_index()
+            articles = await news_index.get_articles(company_name, self._search_news)
+            # Computed once per index refresh, not per enrichment
+            analytics = news_index.get_analytics(company_name) or analyze_articles(articles)
 
             return {
                 "domain": domain,
                 "company_name": company_name,
-                "answer": answer,
-                "results": unique_articles[:10],  # Top 10 unique articles
-                "categorized": categorized,
-                "result_count": len(unique_articles),
-                "themes": self._extract_themes(unique_articles),
-                "sentiment_indicators": self._analyze_sentiment_keywords(unique_articles),
+                "answer": self._build_news_summary(company_name, articles),
+                "results": articles[:10],  # Top 10 most recent articles
+                "categorized": self._categorize_articles(articles),
+                "result_count": len(articles),
+                "themes": analytics["themes"],
+                "theme_scores": analytics["theme_scores"],
+                "sentiment_indicators": analytics["sentiment"],
                 "fetched_at": datetime.utcnow().isoformat()
             }
 
@@ -485,78 +798,48 @@ class GNewsAPI(BaseEnrichmentAPI):
             logger.error(f"GNews API request error for {domain}: {e}")
             raise EnrichmentAPIError(self.source_name, str(e))
 
-    async def _fetch_multi_query_news(self, company_name: str) -> List[Dict[str, Any]]:
+    async def _search_news(self, company_name: str, since: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Fetch news from multiple search queries in parallel.
+        Search news for a company (exact name match, newest first).
 
         Args:
             company_name: Company name to search for
+            since: Only return articles published after this ISO timestamp
 
         Returns:
-            Combined list of articles from all queries
+            List of articles
         """
-        search_queries = [
-            f'"{company_name}"',  # Exact company name match
-            f"{company_name} AI artificial intelligence",
-            f"{company_name} technology innovation",
-            f"{company_name} strategy leadership CEO",
-            f"{company_name} expansion growth partnership",
-        ]
-
-        async with httpx.AsyncClient(timeout=DEEP_ENRICHMENT_TIMEOUT) as client:
-            tasks = []
-            for query in search_queries:
-                tasks.append(
-                    client.get(
-                        f"{self.base_url}/search",
-                        params={
-                            "token": self.api_key,
-                            "q": query,
-                            "lang": "en",
-                            "max": 5,
-                            "sortby": "relevance"
-                        }
-                    )
-                )
-
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-            all_articles = []
-            for i, response in enumerate(responses):
-                if isinstance(response, Exception):
-                    logger.warning(f"GNews query {i} failed: {response}")
-                    continue
-                try:
-                    if response.status_code == 200:
-                        data = response.json()
-                        articles = data.get("articles", [])
-                        for article in articles:
-                            all_articles.append({
-                                "title": article.get("title"),
-                                "url": article.get("url"),
-                                "content": article.get("description", "")[:800],
-                                "full_content": article.get("content", "")[:1500],
-                                "published_at": article.get("publishedAt"),
-                                "source": article.get("source", {}).get("name"),
-                                "source_url": article.get("source", {}).get("url"),
-                                "image": article.get("image"),
-                                "query_category": self._get_query_category(i)
-                            })
-                except Exception as e:
-                    logger.warning(f"Failed to parse GNews response {i}: {e}")
-
-            return all_articles
-
-    def _get_query_category(self, query_index: int) -> str:
-        """Map query index to category name."""
-        categories = [
-            "general",
-            "ai_technology",
-            "innovation",
-            "leadership",
-            "growth"
+        params = {
+            "token": self.api_key,
+            "q": f'"{company_name}"',
+            "lang": "en",
+            "max": self.max_results,
+            "sortby": "publishedAt"
+        }
+        if since:
+            params["from"] = since
+
+        response = await self._request(
+            "GET",
+            f"{self.base_url}/search",
+            timeout=DEEP_ENRICHMENT_TIMEOUT,
+            params=params
+        )
+        self._handle_error(response)
+
+        return [
+            {
+                "title": article.get("title"),
+                "url": article.get("url"),
+                "content": (article.get("description") or "")[:800],
+                "full_content": (article.get("content") or "")[:1500],
+                "published_at": article.get("publishedAt"),
+                "source": (article.get("source") or {}).get("name"),
+                "source_url": (article.get("source") or {}).get("url"),
+                "image": article.get("image"),
+            }
+            for article in self._decode(response, "gnews.search").get("articles", [])
         ]
-        return categories[query_index] if query_index < len(categories) else "other"
 
     def _build_news_summary(self, company_name: str, articles: List[Dict]) -> str:
         """Build a comprehensive news summary from articles."""
@@ -603,48 +886,12 @@ class GNewsAPI(BaseEnrichmentAPI):
         return categorized
 
     def _extract_themes(self, articles: List[Dict]) -> List[str]:
-        """Extract key themes from article titles and content."""
-        themes = set()
-        theme_keywords = {
-            "AI adoption": ["ai", "artificial intelligence", "machine learning", "ml"],
-            "Cloud transformation": ["cloud", "aws", "azure", "gcp", "saas"],
-            "Digital transformation": ["digital", "transformation", "modernization"],
-            "Data strategy": ["data", "analytics", "insights", "big data"],
-            "Growth & expansion": ["growth", "expansion", "revenue", "market"],
-            "Partnership": ["partnership", "collaboration", "joint venture"],
-            "Innovation": ["innovation", "r&d", "research", "breakthrough"],
-            "Sustainability": ["sustainability", "esg", "green", "carbon"],
-            "Security": ["security", "cybersecurity", "privacy", "compliance"],
-            "Workforce": ["hiring", "workforce", "talent", "employees"]
-        }
-
-        combined_text = " ".join([
-            (a.get("title", "") + " " + a.get("content", "")).lower()
-            for a in articles
-        ])
-
-        for theme, keywords in theme_keywords.items():
-            if any(kw in combined_text for kw in keywords):
-                themes.add(theme)
-
-        return list(themes)[:5]
+        """Extract key themes (ranked by weight) from article titles and content."""
+        return analyze_articles(articles)["themes"]
 
     def _analyze_sentiment_keywords(self, articles: List[Dict]) -> Dict[str, int]:
-        """Analyze sentiment indicators from articles."""
-        positive = ["growth", "success", "expansion", "innovation", "award", "leading", "record"]
-        negative = ["layoff", "decline", "lawsuit", "investigation", "loss", "struggling"]
-        neutral = ["announce", "report", "update", "release", "partner"]
-
-        combined_text = " ".join([
-            (a.get("title", "") + " " + a.get("content", "")).lower()
-            for a in articles
-        ])
-
-        return {
-            "positive": sum(1 for word in positive if word in combined_text),
-            "negative": sum(1 for word in negative if word in combined_text),
-            "neutral": sum(1 for word in neutral if word in combined_text)
-        }
+        """Count sentiment keyword hits across articles."""
+        return analyze_articles(articles)["sentiment"]
 
     def _mock_response(self, email: str, domain: Optional[str]) -> Dict[str, Any]:
         """Return mock data when API key not configured."""
@@ -694,11 +941,63 @@ class ZoomInfoAPI(BaseEnrichmentAPI):
     source_name = "zoominfo"
     base_url = "https://api.zoominfo.com"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None
+    ):
         self.api_key = api_key or settings.ZOOMINFO_API_KEY
-        if not self.api_key:
+        self.base_url = provider_base_url(self.source_name, self.base_url)
+        username = username or settings.ZOOMINFO_USERNAME
+        password = password or settings.ZOOMINFO_PASSWORD
+        # Username/password go through /authenticate (shared, cached JWT);
+        # a bare API key is sent as a static bearer token
+        self.tokens = None
+        if username and password:
+            self._credentials = {"username": username, "password": password}
+            self.tokens = get_token_manager(self.source_name, self._authenticate)
+        if not self.api_key and not self.tokens:
             logger.warning("ZoomInfo API key not configured")
 
+    async def _authenticate(self) -> Tuple[str, float]:
+        """
+        Exchange username/password for a JWT.
+
+        Returns:
+            (token, lifetime in seconds)
+        """
+        response = await self._request(
+            "POST",
+            f"{self.base_url}/authenticate",
+            headers={"Content-Type": "application/json"},
+            json=self._credentials
+        )
+        self._handle_error(response)
+        token = self._decode(response, "zoominfo.authenticate").get("jwt")
+        if not token:
+            raise EnrichmentAPIError(self.source_name, "Authentication returned no token")
+        return token, jwt_lifetime(token) or settings.ZOOMINFO_TOKEN_TTL_SECONDS
+
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """POST with the current bearer token; re-authenticates once if it is rejected."""
+        token = await self.tokens.get_token() if self.tokens else self.api_key
+
+        async def send(token: str) -> httpx.Response:
+            return await self._request(
+                "POST",
+                url,
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+                **kwargs
+            )
+
+        response = await send(token)
+        if response.status_code == 401 and self.tokens:
+            logger.info("ZoomInfo token rejected, re-authenticating")
+            self.tokens.invalidate(token)
+            response = await send(await self.tokens.get_token())
+        return response
+
     async def enrich(self, email: str, domain: Optional[str] = None) -> Dict[str, Any]:
         """
         Enrich company data from ZoomInfo.
@@ -710,50 +1009,46 @@ class ZoomInfoAPI(BaseEnrichmentAPI):
         Returns:
             Company data from ZoomInfo
         """
-        if not self.api_key:
+        if not self.api_key and not self.tokens:
             return self._mock_response(email, domain)
 
         domain = domain or email.split("@")[1]
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                # ZoomInfo requires OAuth token, simplified here
-                response = await client.post(
-                    f"{self.base_url}/search/company",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "matchCompanyInput": [{"companyWebsite": domain}],
-                        "outputFields": [
-                            "id", "name", "website", "industry", "subIndustry",
-                            "employeeCount", "revenue", "city", "state", "country",
-                            "description", "foundedYear", "techStackIds"
-                        ]
-                    }
-                )
-
-                self._handle_error(response)
-                data = response.json()
-                company = data.get("data", [{}])[0] if data.get("data") else {}
-
-                return {
-                    "domain": domain,
-                    "company_name": company.get("name"),
-                    "website": company.get("website"),
-                    "industry": company.get("industry"),
-                    "sub_industry": company.get("subIndustry"),
-                    "employee_count": company.get("employeeCount"),
-                    "revenue": company.get("revenue"),
-                    "city": company.get("city"),
-                    "state": company.get("state"),
-                    "country": company.get("country"),
-                    "description": company.get("description"),
-                    "founded_year": company.get("foundedYear"),
-                    "tech_stack": company.get("techStackIds", []),
-                    "fetched_at": datetime.utcnow().isoformat()
+            response = await self._post(
+                f"{self.base_url}/search/company",
+                json={
+                    "matchCompanyInput": [{"companyWebsite": domain}],
+                    "outputFields": [
+                        "id", "name", "website", "industry", "subIndustry",
+                        "employeeCount", "revenue", "city", "state", "country",
+                        "description", "foundedYear", "techStackIds"
+                    ]
                 }
+            )
+
+            self._handle_error(response)
+            data = self._decode(response, "zoominfo.company")
+            if not data.get("data"):
+                return self._not_found(domain)
+            company = data["data"][0]
+
+            return {
+                "domain": domain,
+                "company_name": company.get("name"),
+                "website": company.get("website"),
+                "industry": company.get("industry"),
+                "sub_industry": company.get("subIndustry"),
+                "employee_count": company.get("employeeCount"),
+                "revenue": company.get("revenue"),
+                "city": company.get("city"),
+                "state": company.get("state"),
+                "country": company.get("country"),
+                "description": company.get("description"),
+                "founded_year": company.get("foundedYear"),
+                "tech_stack": company.get("techStackIds", []),
+                "fetched_at": datetime.utcnow().isoformat()
+            }
 
         except httpx.TimeoutException:
             logger.error(f"ZoomInfo API timeout for {domain}")
@@ -792,3 +1087,18 @@ def get_enrichment_apis() -> Dict[str, BaseEnrichmentAPI]:
         "gnews": GNewsAPI(),
         "zoominfo": ZoomInfoAPI()
     }
+
+
+def get_warmup_targets() -> Dict[str, str]:
+    """
+    Get base URLs of providers that will make real HTTP calls.
+    Used to pre-open pooled connections at startup (mocked providers are skipped).
+
+    Returns:
+        Dict mapping source name to base URL
+    """
+    return {
+        name: api.base_url
+        for name, api in get_enrichment_apis().items()
+        if getattr(api, "api_key", None) or getattr(api, "tokens", None)
+    }
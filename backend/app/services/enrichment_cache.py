@@ -0,0 +1,285 @@
+"""
+Company enrichment cache for RAD pipeline.
+Company-level sources (PDL company, ZoomInfo, GNews) return the same data for
+every employee at a domain, so their responses are cached per domain:
+  - L1: in-process LRU (no I/O on hit)
+  - L2: Supabase enrichment_cache table (shared across processes/restarts)
+Each source has its own TTL; expired entries are swept in the background.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# TTL per company-level source in seconds (override with e.g. COMPANY_CACHE_TTL_GNEWS=3600)
+COMPANY_CACHE_TTLS = {
+    "pdl_company": 7 * 24 * 3600,  # Firmographics change slowly
+    "zoominfo": 7 * 24 * 3600,
+    "gnews": 6 * 3600,             # News goes stale quickly
+}
+
+# How long an L1 row loaded from Supabase is trusted before re-reading it (seconds)
+L2_REFRESH_SECONDS = 60
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalize a domain for use as a cache key."""
+    domain = (domain or "").strip().lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def _to_epoch(value: str) -> float:
+    """Parse an ISO timestamp (naive values are UTC) to epoch seconds."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class CompanyCache:
+    """
+    Two-tier, domain-keyed cache for company-level enrichment sources.
+    Only successful real responses are cached (never errors or mock data).
+    """
+
+    def __init__(
+        self,
+        supabase_client=None,
+        max_entries: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            supabase_client: SupabaseClient for the L2 table (None = L1 only)
+            max_entries: Max domains kept in the in-process LRU
+            ttls: TTL per source in seconds (defaults to COMPANY_CACHE_TTLS + env)
+        """
+        self.supabase = supabase_client
+        self.max_entries = max_entries or settings.COMPANY_CACHE_MAX_ENTRIES
+        self.ttls = ttls or {
+            source: int(os.getenv(f"COMPANY_CACHE_TTL_{source.upper()}", ttl))
+            for source, ttl in COMPANY_CACHE_TTLS.items()
+        }
+        # domain -> {"sources": {source: {"data", "cached_at", "expires_at"}}, "loaded_at": float}
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # domain -> L1 hits not yet written to the cache_hits column
+        self._pending_hits: Dict[str, int] = {}
+        self.stats_counters = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+    def is_cacheable(self, source: str) -> bool:
+        """Check whether a source is company-level (cached per domain)."""
+        return settings.COMPANY_CACHE_ENABLED and source in self.ttls
+
+    def get(self, domain: str, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached data for a domain/source.
+
+        Args:
+            domain: Company domain
+            source: Source name (pdl_company, zoominfo, gnews)
+
+        Returns:
+            Copy of the cached response, or None on miss/expiry
+        """
+        if not self.is_cacheable(source):
+            return None
+
+        domain = normalize_domain(domain)
+        now = time.time()
+        row = self._lru.get(domain)
+
+        if row is None or now - row["loaded_at"] > L2_REFRESH_SECONDS:
+            row = self._load_from_table(domain, now) or row
+
+        entry = row["sources"].get(source) if row else None
+        if entry and _to_epoch(entry["expires_at"]) > now:
+            self._lru.move_to_end(domain)
+            if source in row.get("from_table", ()):
+                self.stats_counters["l2_hits"] += 1
+                row["from_table"].discard(source)
+            else:
+                self.stats_counters["l1_hits"] += 1
+            self._pending_hits[domain] = self._pending_hits.get(domain, 0) + 1
+            logger.info(f"Company cache hit for {domain} ({source})")
+            return dict(entry["data"])
+
+        self.stats_counters["misses"] += 1
+        return None
+
+    def set(self, domain: str, source: str, data: Dict[str, Any]) -> None:
+        """
+        Store a company-level response in both tiers.
+        Errors and mock responses are ignored.
+
+        Args:
+            domain: Company domain
+            source: Source name
+            data: Provider response
+        """
+        if not self.is_cacheable(source) or not data:
+            return
+        if data.get("_error") or data.get("_mock"):
+            return
+
+        domain = normalize_domain(domain)
+        now = datetime.utcnow()
+        entry = {
+            "data": data,
+            "cached_at": now.isoformat(),
+            "expires_at": (now + timedelta(seconds=self.ttls[source])).isoformat(),
+        }
+
+        # Merge with sources already cached for this domain (the table keeps one row per domain)
+        row = self._lru.get(domain) or self._load_from_table(domain, time.time())
+        if row is None:
+            row = {"sources": {}, "loaded_at": time.time()}
+        row["sources"][source] = entry
+        self._put(domain, row)
+        self.stats_counters["writes"] += 1
+
+        if self.supabase:
+            try:
+                row_expires_at = max(
+                    (e["expires_at"] for e in row["sources"].values()),
+                    key=_to_epoch
+                )
+                self.supabase.upsert_enrichment_cache(
+                    domain=domain,
+                    enriched_data=row["sources"],
+                    expires_at=row_expires_at
+                )
+            except Exception as e:
+                logger.warning(f"Failed to persist company cache for {domain}: {e}")
+
+    def _load_from_table(self, domain: str, now: float) -> Optional[Dict[str, Any]]:
+        """Load a domain's row from Supabase into the LRU."""
+        if not self.supabase:
+            return None
+        try:
+            record = self.supabase.get_enrichment_cache(domain)
+        except Exception as e:
+            logger.warning(f"Company cache lookup failed for {domain}: {e}")
+            return None
+
+        sources = {}
+        if record:
+            sources = {
+                source: entry
+                for source, entry in (record.get("enriched_data") or {}).items()
+                if isinstance(entry, dict) and entry.get("expires_at")
+                and _to_epoch(entry["expires_at"]) > now
+            }
+        row = {"sources": sources, "loaded_at": now, "from_table": set(sources)}
+        self._put(domain, row)
+        return row
+
+    def _put(self, domain: str, row: Dict[str, Any]) -> None:
+        """Insert/refresh a row in the LRU, evicting the oldest if full."""
+        self._lru[domain] = row
+        self._lru.move_to_end(domain)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+            self.stats_counters["evictions"] += 1
+
+    def purge_expired(self) -> int:
+        """
+        Drop expired source entries (and empty rows) from the LRU.
+
+        Returns:
+            Number of source entries removed
+        """
+        now = time.time()
+        removed = 0
+        for domain in list(self._lru.keys()):
+            sources = self._lru[domain]["sources"]
+            for source in [s for s, e in sources.items() if _to_epoch(e["expires_at"]) <= now]:
+                del sources[source]
+                removed += 1
+            if not sources and now - self._lru[domain]["loaded_at"] > L2_REFRESH_SECONDS:
+                del self._lru[domain]
+        self.stats_counters["expired"] += removed
+        return removed
+
+    def flush_hits(self) -> None:
+        """Write accumulated hit counts to the cache_hits column."""
+        pending, self._pending_hits = self._pending_hits, {}
+        if not self.supabase:
+            return
+        for domain, hits in pending.items():
+            try:
+                self.supabase.record_enrichment_cache_hits(domain, hits)
+            except Exception as e:
+                logger.warning(f"Failed to record cache hits for {domain}: {e}")
+
+    def sweep(self) -> None:
+        """One maintenance pass: purge L1, flush hit counts, clean the table."""
+        removed = self.purge_expired()
+        self.flush_hits()
+        deleted = 0
+        if self.supabase:
+            try:
+                deleted = self.supabase.clean_expired_enrichment_cache()
+            except Exception as e:
+                logger.warning(f"Failed to clean expired enrichment_cache rows: {e}")
+        if removed or deleted:
+            logger.info(f"Company cache sweep: {removed} L1 entries, {deleted} table rows expired")
+
+    async def run_expiry_loop(self, interval: Optional[float] = None) -> None:
+        """
+        Background task: sweep expired entries periodically until cancelled.
+
+        Args:
+            interval: Seconds between sweeps (defaults to settings)
+        """
+        interval = interval or settings.COMPANY_CACHE_SWEEP_SECONDS
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.warning(f"Company cache sweep failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        lookups = sum(self.stats_counters[k] for k in ("l1_hits", "l2_hits", "misses"))
+        hits = self.stats_counters["l1_hits"] + self.stats_counters["l2_hits"]
+        return {
+            **self.stats_counters,
+            "entries": len(self._lru),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all L1 entries (does not touch the table)."""
+        self._lru.clear()
+        self._pending_hits.clear()
+
+
+# Global instance (lazy-loaded)
+_company_cache: Optional[CompanyCache] = None
+
+
+def get_company_cache() -> CompanyCache:
+    """Get or create the global company cache (backed by the global Supabase client)."""
+    global _company_cache
+    if _company_cache is None:
+        from app.services.supabase_client import get_supabase_client
+        _company_cache = CompanyCache(get_supabase_client())
+    return _company_cache
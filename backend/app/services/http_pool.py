@@ -0,0 +1,190 @@
+"""
+Pooled HTTP clients for enrichment providers.
+Keeps one long-lived httpx.AsyncClient per provider so TCP+TLS connections
+are reused across enrichments instead of re-handshaking on every call.
+Created and closed by app.main.lifespan; lazily created elsewhere (tests, scripts).
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, Optional, Set
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (pip install h2)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Per-provider connection caps (override with e.g. APOLLO_MAX_CONNECTIONS=40)
+PROVIDER_MAX_CONNECTIONS = {
+    "apollo": 20,
+    "pdl": 20,
+    "hunter": 10,
+    "gnews": 10,   # One search per company refresh (see app.services.news_index)
+    "zoominfo": 10,
+}
+
+# Timeout for warm-up requests at startup (seconds)
+WARMUP_TIMEOUT = 5.0
+
+
+class HTTPClientPool:
+    """
+    Registry of long-lived httpx.AsyncClient instances, one per provider.
+    Each client has its own connection cap and keep-alive limits.
+    """
+
+    def __init__(
+        self,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize the pool (clients are created on first use).
+
+        Args:
+            http2: Enable HTTP/2 (defaults to settings.HTTP2_ENABLED; needs `h2`)
+            transport: Custom transport for all clients (tests)
+        """
+        http2 = settings.HTTP2_ENABLED if http2 is None else http2
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but `h2` is not installed, using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        # Strong references to closes of clients replaced for another loop
+        self._closing: Set[asyncio.Task] = set()
+
+    def _max_connections(self, source: str) -> int:
+        """Get the connection cap for a provider (env override wins)."""
+        env_value = os.getenv(f"{source.upper()}_MAX_CONNECTIONS")
+        if env_value:
+            return int(env_value)
+        return PROVIDER_MAX_CONNECTIONS.get(source, settings.HTTP_MAX_CONNECTIONS)
+
+    def _create_client(self, source: str) -> httpx.AsyncClient:
+        """Create a pooled client for a provider."""
+        max_connections = self._max_connections(source)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(settings.HTTP_MAX_KEEPALIVE, max_connections),
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+        )
+        logger.info(
+            f"Creating pooled HTTP client for {source} "
+            f"(max_connections={max_connections}, http2={self.http2})"
+        )
+        return httpx.AsyncClient(limits=limits, http2=self.http2, transport=self.transport)
+
+    def get(self, source: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for a provider, creating it on first use.
+
+        Connections are bound to the event loop they were opened on, so a
+        client is recreated if it is requested from a different loop (the
+        old one is closed, see _retire).
+
+        Args:
+            source: Provider name (apollo, pdl, hunter, gnews, zoominfo)
+
+        Returns:
+            Shared httpx.AsyncClient for that provider
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        client = self._clients.get(source)
+        if client is None or client.is_closed or self._loops.get(source) is not loop:
+            if client is not None and not client.is_closed:
+                self._retire(source, client, self._loops.get(source), loop)
+            client = self._create_client(source)
+            self._clients[source] = client
+            self._loops[source] = loop
+        return client
+
+    def _retire(
+        self,
+        source: str,
+        client: httpx.AsyncClient,
+        old_loop: Optional[asyncio.AbstractEventLoop],
+        loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Close a client replaced for another event loop: on its own loop if
+        that is still running, else on the current one (best effort).
+        """
+        if old_loop is not None and old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_quietly(source, client), old_loop)
+        elif loop is not None:
+            task = loop.create_task(self._close_quietly(source, client))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            logger.debug(f"Dropping HTTP client for {source} without an event loop to close it on")
+
+    async def _close_quietly(self, source: str, client: httpx.AsyncClient) -> None:
+        """Close a retired client, ignoring errors from connections of a closed loop."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing retired HTTP client for {source}: {e}")
+
+    async def warm_up(self, base_urls: Dict[str, str]) -> None:
+        """
+        Open a connection to each provider ahead of the first request.
+        Any response (even 4xx) means the TCP+TLS handshake is done and the
+        connection is parked in the keep-alive pool. Failures are ignored.
+
+        Args:
+            base_urls: Dict mapping provider name to its base URL
+        """
+        async def _warm(source: str, url: str) -> None:
+            try:
+                await self.get(source).head(url, timeout=WARMUP_TIMEOUT)
+                logger.info(f"Warmed up connection to {source}")
+            except httpx.HTTPError as e:
+                logger.warning(f"Connection warm-up failed for {source}: {e}")
+
+        await asyncio.gather(*[_warm(source, url) for source, url in base_urls.items()])
+
+    async def aclose(self) -> None:
+        """Close all pooled clients."""
+        for source, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client for {source}: {e}")
+        self._clients.clear()
+        self._loops.clear()
+
+
+# Global instance (created in app lifespan, lazy-loaded elsewhere)
+_http_pool: Optional[HTTPClientPool] = None
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Get or create the global HTTP client pool."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HTTPClientPool()
+    return _http_pool
+
+
+async def close_http_pool() -> None:
+    """Close and discard the global HTTP client pool."""
+    global _http_pool
+    if _http_pool is not None:
+        await _http_pool.aclose()
+        _http_pool = None
@@ -0,0 +1,239 @@
+"""
+In-process pub/sub of personalization job progress (GET /rad/jobs/{id}/events).
+The job runner opens a job_events_scope(job_id); code running inside it (the
+orchestrator's provider stages, LLMService, compliance) calls emit_job_event()
+without knowing the job id, much like deadline_scope. Subscribers receive the
+job's events so far, then live ones until the job completes or fails. Events
+only reach subscribers in the process running the job. Jobs that join another
+job's in-flight run (shared_job_events) also receive that run's events.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Events after which a job's stream ends
+TERMINAL_EVENTS = ("completed", "failed")
+
+# How long a finished job's events stay available to late subscribers
+EVENT_RETENTION_SECONDS = 300
+
+
+@dataclass
+class JobEvent:
+    """One progress event of a job."""
+    id: int
+    event: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_sse(self) -> str:
+        """Format as a Server-Sent Events message."""
+        payload = json.dumps({**self.data, "timestamp": self.timestamp}, default=str)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+class JobEventBus:
+    """Per-job event history plus live subscriber queues."""
+
+    def __init__(self, retention_seconds: float = EVENT_RETENTION_SECONDS):
+        """
+        Initialize bus.
+
+        Args:
+            retention_seconds: Seconds a finished job's events are kept
+        """
+        self.retention_seconds = retention_seconds
+        self._history: Dict[str, List[JobEvent]] = {}
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._finished_at: Dict[str, float] = {}
+        self.published = 0
+
+    def publish(self, job_id: str, event: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record an event and hand it to the job's subscribers.
+
+        Args:
+            job_id: Job ID
+            event: Event name (e.g. provider, profile, ebook_hook, completed)
+            data: JSON-serializable payload
+        """
+        self._expire()
+        history = self._history.setdefault(job_id, [])
+        message = JobEvent(id=len(history) + 1, event=event, data=data or {})
+        history.append(message)
+        self.published += 1
+        for queue in self._subscribers.get(job_id, ()):
+            queue.put_nowait(message)
+        if event in TERMINAL_EVENTS:
+            self._finished_at[job_id] = time.monotonic()
+
+    def known(self, job_id: str) -> bool:
+        """Whether this process has events for the job."""
+        return job_id in self._history
+
+    async def subscribe(
+        self,
+        job_id: str,
+        after: int = 0,
+        terminal: Tuple[str, ...] = TERMINAL_EVENTS,
+        heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[JobEvent]]:
+        """
+        Yield the job's events (past, then live) until a terminal event.
+
+        Args:
+            job_id: Job ID
+            after: Skip events up to this id (SSE Last-Event-ID)
+            terminal: Events that end the subscription
+            heartbeat: Yield None after this many idle seconds (SSE keepalive)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        try:
+            # Registered before replaying, so nothing published in between is lost
+            backlog = list(self._history.get(job_id, ()))
+            for message in backlog:
+                queue.put_nowait(message)
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if message.id <= after:
+                    continue
+                after = message.id
+                yield message
+                if message.event in terminal:
+                    return
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+    def _expire(self) -> None:
+        """Drop finished jobs older than the retention period."""
+        cutoff = time.monotonic() - self.retention_seconds
+        for job_id in [j for j, finished in self._finished_at.items() if finished < cutoff]:
+            del self._finished_at[job_id]
+            self._history.pop(job_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters."""
+        return {
+            "published": self.published,
+            "jobs": len(self._history),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+        }
+
+
+@dataclass
+class SharedRun:
+    """Events of one job's run, also published to the jobs that joined it."""
+    job_id: str
+    followers: List[str] = field(default_factory=list)
+    history: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+
+
+_current_job: ContextVar[Optional[str]] = ContextVar("job_id", default=None)
+_current_run: ContextVar[Optional[SharedRun]] = ContextVar("shared_run", default=None)
+
+# Coalescing key -> run currently publishing for it
+_shared_runs: Dict[Hashable, SharedRun] = {}
+
+# Global instance (lazy-loaded)
+_job_event_bus: Optional[JobEventBus] = None
+
+
+def get_job_event_bus() -> JobEventBus:
+    """Get or create the global job event bus."""
+    global _job_event_bus
+    if _job_event_bus is None:
+        _job_event_bus = JobEventBus()
+    return _job_event_bus
+
+
+@contextmanager
+def job_events_scope(job_id: str) -> Iterator[None]:
+    """Send emit_job_event() calls in this context (and tasks started from it) to job_id."""
+    token = _current_job.set(job_id)
+    try:
+        yield
+    finally:
+        _current_job.reset(token)
+
+
+@contextmanager
+def shared_job_events(key: Hashable) -> Iterator[Optional[str]]:
+    """
+    Share the current job's events with jobs that join its run (SingleFlight).
+
+    The first job to enter for `key` yields None; events it emits inside the
+    scope (and in tasks started from it) are also published to jobs entering
+    while it runs. Those get a "coalesced" event naming that job, then the
+    run's events so far and live ones, and yield the id of the job they joined.
+
+    Args:
+        key: Coalescing key of the run
+    """
+    job_id = _current_job.get()
+    run = _shared_runs.get(key)
+    if job_id is None or (run is not None and run.job_id == job_id):
+        yield None
+        return
+
+    if run is not None:
+        bus = get_job_event_bus()
+        bus.publish(job_id, "coalesced", {"leader_job_id": run.job_id})
+        for event, data in run.history:
+            bus.publish(job_id, event, data)
+        run.followers.append(job_id)
+        try:
+            yield run.job_id
+        finally:
+            run.followers.remove(job_id)
+        return
+
+    run = SharedRun(job_id=job_id)
+    _shared_runs[key] = run
+    token = _current_run.set(run)
+    try:
+        yield None
+    finally:
+        _current_run.reset(token)
+        if _shared_runs.get(key) is run:
+            del _shared_runs[key]
+
+
+def emit_job_event(event: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Publish an event for the current job (no-op outside a job_events_scope).
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+    """
+    job_id = _current_job.get()
+    if job_id is None:
+        return
+    try:
+        bus = get_job_event_bus()
+        bus.publish(job_id, event, data)
+        run = _current_run.get()
+        if run is not None and run.job_id == job_id:
+            run.history.append((event, data))
+            for follower in run.followers:
+                bus.publish(follower, event, data)
+    except Exception as e:
+        # Progress events never break the pipeline
+        logger.warning(f"[{job_id}] Could not publish {event} event: {e}")
@@ -0,0 +1,247 @@
+"""
+In-process job queue for the personalization pipeline.
+POST /rad/enrich records a personalization_jobs row, enqueues the work here and
+returns 202 straight away; a bounded pool of worker tasks drains the queue, so
+HTTP worker slots are no longer held for the whole enrichment + LLM run.
+Each job reports its own progress (status/stage) in personalization_jobs.
+
+With JOB_QUEUE_MODE=distributed the accepting process only records the job;
+a JobPoller in every process claims jobs from the table with leases (see
+migration 20261016000002_add_job_leases.sql) and feeds them to its local
+workers, heartbeating while they run. A job whose worker dies is reclaimed
+once its lease expires; a worker that loses its lease stops the job.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+JobRunner = Callable[[], Awaitable[Any]]
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobQueue:
+    """Bounded FIFO of jobs drained by a fixed number of worker tasks."""
+
+    def __init__(self, workers: Optional[int] = None, max_size: Optional[int] = None):
+        """
+        Initialize queue (workers start on first submit or start()).
+
+        Args:
+            workers: Concurrent jobs (defaults to JOB_WORKERS)
+            max_size: Queued jobs accepted before submit() fails (defaults to JOB_QUEUE_MAX_SIZE)
+        """
+        self.workers = workers or settings.JOB_WORKERS
+        self.max_size = max_size if max_size is not None else settings.JOB_QUEUE_MAX_SIZE
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active = 0
+        self.stats_counters = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    def start(self) -> None:
+        """Start the worker tasks on the running loop (no-op if already running there)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [loop.create_task(self._worker(n)) for n in range(self.workers)]
+        logger.info(f"Job queue started with {self.workers} workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers (queued jobs are dropped; running ones are cancelled)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+
+    def submit(self, job_id: str, run: JobRunner) -> None:
+        """
+        Enqueue a job.
+
+        Args:
+            job_id: Job ID (for logs)
+            run: Zero-arg coroutine factory doing the work and recording its status
+
+        Raises:
+            QueueFullError: If max_size jobs are already waiting
+        """
+        self.start()
+        try:
+            self._queue.put_nowait((job_id, run))
+        except asyncio.QueueFull:
+            self.stats_counters["rejected"] += 1
+            raise QueueFullError(f"Job queue full ({self.max_size} waiting)")
+        self.stats_counters["submitted"] += 1
+
+    async def _worker(self, n: int) -> None:
+        while True:
+            job_id, run = await self._queue.get()
+            self.active += 1
+            try:
+                await run()
+                self.stats_counters["completed"] += 1
+            except Exception as e:
+                # The runner records job failures itself; this only keeps the worker alive
+                self.stats_counters["failed"] += 1
+                logger.error(f"[{job_id}] Job failed in worker {n}: {e}")
+            finally:
+                self.active -= 1
+                self._queue.task_done()
+
+    def free_slots(self) -> int:
+        """Workers that would be idle after taking every queued job."""
+        queued = self._queue.qsize() if self._queue else 0
+        return max(0, self.workers - self.active - queued)
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth, busy workers and counters."""
+        return {
+            **self.stats_counters,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "active": self.active,
+            "workers": self.workers,
+        }
+
+
+@dataclass(frozen=True)
+class JobLease:
+    """A personalization job claimed by this worker."""
+    job_id: str
+    worker_id: str
+
+
+# handler(job record, lease) runs one claimed job and records its outcome
+LeasedJobHandler = Callable[[Dict[str, Any], JobLease], Awaitable[Any]]
+
+
+def default_worker_id() -> str:
+    """Worker identity used as lease owner (JOB_WORKER_ID or host:pid)."""
+    return settings.JOB_WORKER_ID or f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobPoller:
+    """Claims leased jobs from personalization_jobs into a local JobQueue."""
+
+    def __init__(
+        self,
+        supabase: Any,
+        handler: LeasedJobHandler,
+        queue: Optional[JobQueue] = None,
+        worker_id: Optional[str] = None,
+        poll_seconds: Optional[float] = None,
+        heartbeat_seconds: Optional[float] = None
+    ):
+        """
+        Initialize poller.
+
+        Args:
+            supabase: SupabaseClient (claim_jobs/heartbeat_job)
+            handler: Runs one claimed job
+            queue: Local worker pool (defaults to the global queue)
+            worker_id: Lease owner name (defaults to default_worker_id())
+            poll_seconds: Wait between claims when idle (defaults to JOB_POLL_SECONDS)
+            heartbeat_seconds: Lease extension interval (defaults to JOB_HEARTBEAT_SECONDS)
+        """
+        self.supabase = supabase
+        self.handler = handler
+        self.queue = queue or get_job_queue()
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_seconds = settings.JOB_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self.heartbeat_seconds = settings.JOB_HEARTBEAT_SECONDS if heartbeat_seconds is None else heartbeat_seconds
+        self.stats_counters = {"claimed": 0, "heartbeats": 0, "leases_lost": 0}
+
+    async def run(self) -> None:
+        """Claim jobs whenever local workers are free (runs until cancelled)."""
+        self.queue.start()
+        logger.info(f"Job poller started as {self.worker_id}")
+        while True:
+            free = self.queue.free_slots()
+            jobs = self.supabase.claim_jobs(self.worker_id, free) if free else []
+            for job in jobs:
+                self.stats_counters["claimed"] += 1
+                self.queue.submit(str(job["id"]), lambda job=job: self._run_leased(job))
+            if len(jobs) < free or not free:
+                # Queue drained (or workers busy): wait before polling again
+                await asyncio.sleep(self.poll_seconds)
+            else:
+                await asyncio.sleep(0)
+
+    async def _run_leased(self, job: Dict[str, Any]) -> Any:
+        """Run a claimed job, extending its lease until it finishes."""
+        lease = JobLease(str(job["id"]), self.worker_id)
+        task = asyncio.ensure_future(self.handler(job, lease))
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.heartbeat_seconds)
+                if done:
+                    return task.result()
+                if not self.supabase.heartbeat_job(lease.job_id, lease.worker_id):
+                    # Lease expired and the job went to another worker: stop spending on it
+                    self.stats_counters["leases_lost"] += 1
+                    logger.warning(f"[{lease.job_id}] Lease lost by {self.worker_id}, stopping job")
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    return None
+                self.stats_counters["heartbeats"] += 1
+        finally:
+            if not task.done():
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get claim/heartbeat counters."""
+        return {"worker_id": self.worker_id, **self.stats_counters}
+
+
+# Global instances (lazy-loaded)
+_job_queue: Optional[JobQueue] = None
+_job_poller: Optional[JobPoller] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the global job queue."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
+
+
+def start_job_poller(supabase: Any, handler: LeasedJobHandler) -> asyncio.Task:
+    """
+    Start the global poller (JOB_QUEUE_MODE=distributed).
+
+    Args:
+        supabase: SupabaseClient
+        handler: Runs one claimed job
+
+    Returns:
+        Polling task (cancel it on shutdown)
+    """
+    global _job_poller
+    _job_poller = JobPoller(supabase, handler)
+    return asyncio.create_task(_job_poller.run())
+
+
+def get_job_stats() -> Dict[str, Any]:
+    """Get queue counters, plus lease counters when polling."""
+    stats = {"mode": settings.JOB_QUEUE_MODE, **get_job_queue().stats()}
+    if _job_poller is not None:
+        stats["leases"] = _job_poller.stats()
+    return stats
@@ -4,6 +4,7 @@ Multi-provider support with fallback: Anthropic → OpenAI → Gemini → mock.
 Implements structured output, validation, and retry logic.
 """
 
+import asyncio
 import logging
 import json
 import time
@@ -15,6 +16,8 @@ import anthropic
 from anthropic import APIError as AnthropicAPIError, APITimeoutError as AnthropicTimeoutError, RateLimitError as AnthropicRateLimitError
 
 from app.config import settings
+from app.services.deadline import current_deadline, remaining_budget
+from app.services.job_events import emit_job_event
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,11 @@ GEMINI_MODEL = "gemini-1.5-flash"
 MAX_INTRO_LENGTH = 200  # characters
 MAX_CTA_LENGTH = 150  # characters
 
+# Fields of the combined (legacy + ebook) structured output
+LEGACY_FIELDS = ("intro_hook", "cta")
+EBOOK_FIELDS = ("personalized_hook", "case_study_framing", "personalized_cta")
+COMBINED_FIELDS = LEGACY_FIELDS + EBOOK_FIELDS
+
 
 @dataclass
 class PersonalizationResult:
@@ -119,7 +127,7 @@ class LLMService:
         else:
             logger.info(f"LLM service initialized with providers: {[p['name'] for p in self.providers]}")
 
-    def _call_provider(
+    async def _call_provider(
         self,
         provider: Dict[str, Any],
         system_prompt: str,
@@ -128,6 +136,8 @@ class LLMService:
     ) -> Optional[str]:
         """
         Call a specific LLM provider and return the response text.
+        The SDK calls are blocking, so they run in a worker thread and never
+        stall the event loop shared with job workers and API requests.
 
         Args:
             provider: Provider config dict with name, client, model
@@ -139,44 +149,68 @@ class LLMService:
             Response text or None if failed
         """
         name = provider["name"]
-        client = provider["client"]
-        model = provider["model"]
-
-        try:
-            if name == "anthropic":
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=max_tokens,
-                    messages=[{"role": "user", "content": user_prompt}],
-                    system=system_prompt
-                )
-                return response.content[0].text
-
-            elif name == "openai":
-                response = client.chat.completions.create(
-                    model=model,
-                    max_tokens=max_tokens,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                )
-                return response.choices[0].message.content
 
-            elif name == "gemini":
-                model_instance = client.GenerativeModel(model)
-                # Gemini combines system + user in one prompt
-                combined = f"{system_prompt}\n\n{user_prompt}"
-                response = model_instance.generate_content(combined)
-                return response.text
+        # LLM_TIMEOUT, shortened to whatever is left of the request budget
+        timeout = remaining_budget(settings.LLM_TIMEOUT)
+        if timeout <= 0:
+            logger.warning(f"Request deadline exceeded, skipping {name}")
+            return None
 
+        try:
+            return await asyncio.to_thread(
+                self._request_completion, provider, system_prompt, user_prompt, max_tokens, timeout
+            )
         except Exception as e:
             logger.warning(f"{name} provider failed: {type(e).__name__}: {e}")
             return None
 
+    @staticmethod
+    def _request_completion(
+        provider: Dict[str, Any],
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        timeout: float
+    ) -> Optional[str]:
+        """Blocking SDK call for one provider (run via asyncio.to_thread)."""
+        name = provider["name"]
+        client = provider["client"]
+        model = provider["model"]
+
+        if name == "anthropic":
+            response = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": user_prompt}],
+                system=system_prompt,
+                timeout=timeout
+            )
+            return response.content[0].text
+
+        elif name == "openai":
+            response = client.chat.completions.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                timeout=timeout
+            )
+            return response.choices[0].message.content
+
+        elif name == "gemini":
+            model_instance = client.GenerativeModel(model)
+            # Gemini combines system + user in one prompt
+            combined = f"{system_prompt}\n\n{user_prompt}"
+            response = model_instance.generate_content(
+                combined, request_options={"timeout": timeout}
+            )
+            return response.text
+
         return None
 
-    def _call_with_fallback(
+    async def _call_with_fallback(
         self,
         system_prompt: str,
         user_prompt: str,
@@ -184,6 +218,7 @@ class LLMService:
     ) -> Tuple[Optional[str], str]:
         """
         Try each provider in order until one succeeds.
+        Stops early once the request deadline has passed.
 
         Args:
             system_prompt: System prompt
@@ -193,13 +228,17 @@ class LLMService:
         Returns:
             Tuple of (response_text, provider_name) or (None, "none")
         """
+        deadline = current_deadline()
         for provider in self.providers:
             for attempt in range(MAX_RETRIES):
-                result = self._call_provider(provider, system_prompt, user_prompt, max_tokens)
+                if deadline and deadline.expired:
+                    logger.warning("Request deadline exceeded, falling back to mock response")
+                    return None, "none"
+                result = await self._call_provider(provider, system_prompt, user_prompt, max_tokens)
                 if result:
                     return result, provider["name"]
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY_SECONDS)
+                    await asyncio.sleep(remaining_budget(RETRY_DELAY_SECONDS))
 
         return None, "none"
 
@@ -229,7 +268,7 @@ class LLMService:
         system_prompt = self._get_system_prompt()
 
         # Try with fallback
-        content, provider_name = self._call_with_fallback(system_prompt, prompt, max_tokens=500)
+        content, provider_name = await self._call_with_fallback(system_prompt, prompt, max_tokens=500)
 
         if content:
             parsed = self._parse_response(content)
@@ -591,7 +630,7 @@ No other text."""
             Dict with personalized_hook, case_study_framing, personalized_cta
         """
         if not self.providers:
-            return self._mock_ebook_response(profile, user_context)
+            return self._ebook_ready(self._mock_ebook_response(profile, user_context))
 
         user_context = user_context or {}
         start_time = time.time()
@@ -600,7 +639,7 @@ No other text."""
         system_prompt = self._get_ebook_system_prompt()
 
         # Try with fallback
-        content, provider_name = self._call_with_fallback(system_prompt, prompt, max_tokens=1000)
+        content, provider_name = await self._call_with_fallback(system_prompt, prompt, max_tokens=1000)
 
         if content:
             parsed = self._parse_ebook_response(content)
@@ -611,11 +650,167 @@ No other text."""
                 parsed["tokens_used"] = 0
                 parsed["latency_ms"] = latency_ms
                 logger.info(f"Generated ebook personalization: provider={provider_name}, latency={latency_ms}ms")
-                return parsed
+                return self._ebook_ready(parsed)
 
         # All providers failed
         logger.warning("All LLM providers failed for ebook personalization, using mock")
-        return self._mock_ebook_response(profile, user_context)
+        return self._ebook_ready(self._mock_ebook_response(profile, user_context))
+
+    def _ebook_ready(self, personalization: Dict[str, Any]) -> Dict[str, Any]:
+        """Publish the generated hook to the current job's event stream."""
+        emit_job_event("ebook_hook", {
+            "personalized_hook": personalization.get("personalized_hook"),
+            "model_used": personalization.get("model_used"),
+        })
+        return personalization
+
+    async def generate_combined_personalization(
+        self,
+        profile: Dict[str, Any],
+        user_context: Optional[Dict[str, Any]] = None,
+        company_news: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate ebook and landing page personalization with one LLM call.
+        Replaces generate_ebook_personalization + generate_personalization:
+        one prompt (the ebook prompt plus intro/CTA rules), one JSON output.
+        Use split_combined_personalization() to get the two result dicts.
+
+        Args:
+            profile: Normalized enrichment data
+            user_context: User-provided context (goal, persona, industry)
+            company_news: Recent company news from Tavily
+
+        Returns:
+            Dict with intro_hook, cta, personalized_hook, case_study_framing,
+            personalized_cta and metadata
+        """
+        if not self.providers:
+            return self._ebook_ready(self._mock_combined_response(profile, user_context))
+
+        user_context = user_context or {}
+        start_time = time.time()
+
+        prompt = self._build_ebook_prompt(profile, user_context, company_news, extra_requirements=[
+            f"4. intro_hook: 1-2 sentence landing page intro, under {MAX_INTRO_LENGTH} characters",
+            f"5. cta: Landing page call to action, under {MAX_CTA_LENGTH} characters",
+        ])
+        system_prompt = self._get_combined_system_prompt()
+
+        # Try with fallback
+        content, provider_name = await self._call_with_fallback(system_prompt, prompt, max_tokens=1200)
+
+        if content:
+            parsed = self._parse_combined_response(content)
+
+            if parsed:
+                latency_ms = int((time.time() - start_time) * 1000)
+                parsed["model_used"] = provider_name
+                parsed["tokens_used"] = 0
+                parsed["latency_ms"] = latency_ms
+                parsed["raw_response"] = {"content": content}
+                logger.info(f"Generated combined personalization: provider={provider_name}, latency={latency_ms}ms")
+                return self._ebook_ready(parsed)
+
+        # All providers failed
+        logger.warning("All LLM providers failed for combined personalization, using mock")
+        return self._ebook_ready(self._mock_combined_response(profile, user_context))
+
+    @staticmethod
+    def split_combined_personalization(
+        combined: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Split a combined result into (ebook_personalization, personalization),
+        shaped like generate_ebook_personalization / generate_personalization.
+
+        Args:
+            combined: Result of generate_combined_personalization
+
+        Returns:
+            Tuple of (ebook dict, legacy intro_hook/cta dict)
+        """
+        metadata = {
+            "model_used": combined.get("model_used"),
+            "tokens_used": combined.get("tokens_used", 0),
+            "latency_ms": combined.get("latency_ms", 0),
+        }
+        ebook = {k: v for k, v in combined.items() if k not in LEGACY_FIELDS and k != "raw_response"}
+        legacy = {
+            "intro_hook": combined["intro_hook"],
+            "cta": combined["cta"],
+            **metadata,
+            "raw_response": combined.get("raw_response", {}),
+        }
+        return ebook, legacy
+
+    def _get_combined_system_prompt(self) -> str:
+        """System prompt for combined ebook + landing page personalization."""
+        ebook_rules = self._get_ebook_system_prompt().rsplit("Output ONLY valid JSON:", 1)[0]
+        return ebook_rules + f"""ALSO generate the landing page copy:
+
+4. INTRO_HOOK (1-2 sentences, under {MAX_INTRO_LENGTH} characters) - conversational, specific to their role/company
+5. CTA (under {MAX_CTA_LENGTH} characters) - helpful, not salesy
+
+Output ONLY valid JSON with all five fields:
+{{
+  "intro_hook": "Short landing page intro...",
+  "cta": "Short landing page call to action...",
+  "personalized_hook": "Your personalized opening with explicit data references...",
+  "case_study_framing": "Case study connection with specific metrics and company comparison...",
+  "personalized_cta": "Stage-appropriate CTA with company name..."
+}}"""
+
+    def _parse_combined_response(self, content: str) -> Optional[Dict[str, str]]:
+        """
+        Parse combined personalization response.
+
+        Args:
+            content: Raw LLM response text
+
+        Returns:
+            Dict with all COMBINED_FIELDS (intro/CTA trimmed to length limits),
+            or None if any field is missing or empty
+        """
+        # Outermost object (handles markdown code blocks and surrounding text)
+        start, end = content.find("{"), content.rfind("}")
+        if start < 0 or end < start:
+            return None
+        try:
+            data = json.loads(content[start:end + 1])
+        except json.JSONDecodeError as e:
+            logger.warning(f"JSON parse error for combined response: {e}")
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        parsed = {}
+        for name in COMBINED_FIELDS:
+            value = data.get(name)
+            if not isinstance(value, str) or not value.strip():
+                logger.warning(f"Combined response missing {name}")
+                return None
+            parsed[name] = value.strip()
+
+        if len(parsed["intro_hook"]) > MAX_INTRO_LENGTH:
+            parsed["intro_hook"] = parsed["intro_hook"][:MAX_INTRO_LENGTH - 3] + "..."
+        if len(parsed["cta"]) > MAX_CTA_LENGTH:
+            parsed["cta"] = parsed["cta"][:MAX_CTA_LENGTH - 3] + "..."
+        return parsed
+
+    def _mock_combined_response(
+        self,
+        profile: Dict[str, Any],
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Combined mock: the ebook mock plus the legacy intro/CTA mock."""
+        legacy = self._mock_response(profile, user_context)
+        return {
+            **self._mock_ebook_response(profile, user_context),
+            "intro_hook": legacy["intro_hook"],
+            "cta": legacy["cta"],
+            "raw_response": legacy["raw_response"],
+        }
 
     def _get_ebook_system_prompt(self) -> str:
         """System prompt for AMD ebook personalization."""
@@ -674,7 +869,8 @@ Output ONLY valid JSON:
         self,
         profile: Dict[str, Any],
         user_context: Dict[str, Any],
-        company_news: Optional[str]
+        company_news: Optional[str],
+        extra_requirements: Optional[List[str]] = None
     ) -> str:
         """Build prompt for ebook personalization with deep enrichment data from all APIs."""
         parts = ["Generate DEEPLY personalized AMD ebook content for this prospect.\n"]
@@ -1037,6 +1233,7 @@ Output ONLY valid JSON:
         parts.append(f"1. personalized_hook: Start with \"{company_name}\" or reference their news/growth")
         parts.append("2. case_study_framing: Name the case study company AND cite a specific metric")
         parts.append(f"3. personalized_cta: Include \"{company_name}\" and match the {goal or 'awareness'} stage")
+        parts.extend(extra_requirements or [])
         parts.append("\nGENERATE THE JSON NOW:")
 
         return "\n".join(parts)
@@ -0,0 +1,139 @@
+"""
+Negative cache for enrichment providers.
+PDL answers 404 and Apollo an empty `person` for many addresses, and every
+re-submission (or colleague at an unknown domain) would pay for the same miss
+again. "No match" results are remembered per provider and key (email for
+person sources, domain for company-level ones) with a shorter TTL than
+positive hits, and checked in-process before any HTTP call.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_not_found(data: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a provider result is a "no match" marker (see BaseEnrichmentAPI._not_found)."""
+    return bool(data) and bool(data.get("_not_found"))
+
+
+def cached_not_found(source: str, key: str) -> Dict[str, Any]:
+    """Result for a call skipped because the provider recently had no match."""
+    return {"_error": f"No {source} match for {key} (cached)", "_not_found": True, "_skipped": "not_found"}
+
+
+class NegativeCache:
+    """
+    In-process LRU of (source, key) pairs a provider had no match for.
+    Entries expire after the source's TTL (NEGATIVE_CACHE_TTL_<SOURCE> or
+    NEGATIVE_CACHE_TTL_SECONDS).
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[int] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Max (source, key) pairs kept
+            ttl: Default TTL in seconds for sources without an override
+        """
+        self.max_entries = max_entries or settings.NEGATIVE_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.NEGATIVE_CACHE_TTL_SECONDS
+        # (source, key) -> expiry (epoch seconds)
+        self._entries: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._ttls: Dict[str, int] = {}
+        self.stats_counters = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+    def ttl_for(self, source: str) -> int:
+        """Get the TTL for a source in seconds."""
+        ttl = self._ttls.get(source)
+        if ttl is None:
+            ttl = int(os.getenv(f"NEGATIVE_CACHE_TTL_{source.upper()}", self.ttl))
+            self._ttls[source] = ttl
+        return ttl
+
+    def contains(self, source: str, key: str) -> bool:
+        """
+        Check whether a provider recently had no match for a key.
+
+        Args:
+            source: Source name
+            key: Normalized email or domain
+
+        Returns:
+            True if the call can be skipped
+        """
+        if not settings.NEGATIVE_CACHE_ENABLED:
+            return False
+
+        entry = (source, key)
+        expires_at = self._entries.get(entry)
+        if expires_at is None:
+            self.stats_counters["misses"] += 1
+            return False
+        if expires_at <= time.time():
+            del self._entries[entry]
+            self.stats_counters["expired"] += 1
+            self.stats_counters["misses"] += 1
+            return False
+
+        self._entries.move_to_end(entry)
+        self.stats_counters["hits"] += 1
+        return True
+
+    def add(self, source: str, key: str) -> None:
+        """
+        Remember that a provider had no match for a key.
+
+        Args:
+            source: Source name
+            key: Normalized email or domain
+        """
+        if not settings.NEGATIVE_CACHE_ENABLED:
+            return
+
+        entry = (source, key)
+        self._entries[entry] = time.time() + self.ttl_for(source)
+        self._entries.move_to_end(entry)
+        self.stats_counters["writes"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats_counters["evictions"] += 1
+        logger.info(f"Negative cache: no {source} match for {key}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and size."""
+        lookups = self.stats_counters["hits"] + self.stats_counters["misses"]
+        return {
+            **self.stats_counters,
+            "entries": len(self._entries),
+            "hit_rate": round(self.stats_counters["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Global instance (lazy-loaded)
+_negative_cache: Optional[NegativeCache] = None
+
+
+def get_negative_cache() -> NegativeCache:
+    """Get the global negative cache."""
+    global _negative_cache
+    if _negative_cache is None:
+        _negative_cache = NegativeCache()
+    return _negative_cache
@@ -0,0 +1,192 @@
+"""
+News analytics: themes, sentiment and topic category for news articles.
+All keyword lists are compiled at import into one lookup table. Text is
+tokenized once and counted with a Counter; matching is a set intersection
+against the table, plus one precompiled regex for multi-word phrases (whole
+words only, so "ai" never matches "said" nor "data center" "data centerpiece"),
+and each hit is attributed to every theme/sentiment/category it belongs to.
+"""
+
+import re
+import string
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+THEME_KEYWORDS = {
+    "AI adoption": ["ai", "artificial intelligence", "machine learning", "ml"],
+    "Cloud transformation": ["cloud", "aws", "azure", "gcp", "saas"],
+    "Digital transformation": ["digital", "transformation", "modernization"],
+    "Data strategy": ["data", "analytics", "insights", "big data"],
+    "Growth & expansion": ["growth", "expansion", "revenue", "market"],
+    "Partnership": ["partnership", "collaboration", "joint venture"],
+    "Innovation": ["innovation", "r&d", "research", "breakthrough"],
+    "Sustainability": ["sustainability", "esg", "green", "carbon"],
+    "Security": ["security", "cybersecurity", "privacy", "compliance"],
+    "Workforce": ["hiring", "workforce", "talent", "employees"],
+}
+
+SENTIMENT_KEYWORDS = {
+    "positive": ["growth", "success", "expansion", "innovation", "award", "leading", "record"],
+    "negative": ["layoff", "decline", "lawsuit", "investigation", "loss", "struggling"],
+    "neutral": ["announce", "report", "update", "release", "partner"],
+}
+
+# Topic rules, checked in order; the first category with a hit wins (otherwise "general")
+CATEGORY_KEYWORDS = {
+    "ai_technology": [
+        "ai", "artificial intelligence", "machine learning", "generative", "llm",
+        "gpu", "data center", "cloud", "chip", "semiconductor",
+    ],
+    "leadership": [
+        "ceo", "cfo", "cto", "cio", "executive", "appoints", "appointed", "names",
+        "board", "leadership", "strategy",
+    ],
+    "growth": [
+        "growth", "expansion", "expands", "acquisition", "acquires", "partnership",
+        "partners", "revenue", "earnings", "funding", "raises",
+    ],
+    "innovation": [
+        "innovation", "launch", "launches", "unveils", "research", "patent", "breakthrough",
+    ],
+}
+
+# Hits in a title count this much more than hits in the body
+TITLE_WEIGHT = 2.0
+
+# Max themes returned by analyze_articles
+MAX_THEMES = 5
+
+
+def _build_matcher() -> Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, List[Tuple[str, str]]]]:
+    """
+    Build hit lookups for single words (and plurals) and for multi-word phrases.
+    A phrase only carries the hits its words don't already produce, so
+    "big data" counts once for Data strategy via "data".
+    """
+    words: Dict[str, List[Tuple[str, str]]] = {}
+    phrases: Dict[str, List[Tuple[str, str]]] = {}
+    groups = (
+        ("theme", THEME_KEYWORDS),
+        ("sentiment", SENTIMENT_KEYWORDS),
+        ("category", CATEGORY_KEYWORDS),
+    )
+    for kind, table in groups:
+        for label, keywords in table.items():
+            for keyword in keywords:
+                # Phrase counts already include plurals ("data center" in "data centers")
+                variants = [keyword] if " " in keyword else [keyword, keyword + "s"]
+                for variant in variants:
+                    hits = (phrases if " " in variant else words).setdefault(variant, [])
+                    if (kind, label) not in hits:
+                        hits.append((kind, label))
+
+    for phrase in list(phrases):
+        implied = {hit for word in phrase.split() for hit in words.get(word, [])}
+        phrases[phrase] = [hit for hit in phrases[phrase] if hit not in implied]
+        if not phrases[phrase]:
+            del phrases[phrase]
+    return words, phrases
+
+
+_WORD_HITS, _PHRASE_HITS = _build_matcher()
+_WORD_KEYS = frozenset(_WORD_HITS)
+# Phrases (and their plurals) on word boundaries of the space-joined tokens
+_PHRASE_PATTERN = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(_PHRASE_HITS, key=len, reverse=True))) + r")s?\b"
+)
+_CATEGORY_ORDER = list(CATEGORY_KEYWORDS)
+
+# Sentence/clause punctuation and line breaks end a phrase: they become a "|"
+# token, so phrases never match across them ("data. Center" is not "data center")
+_BOUNDARIES = ".,;:!?()[]{}\"\n"
+# Other punctuation becomes whitespace before splitting; "&" is kept so "r&d" stays one word
+_SEPARATORS = str.maketrans({
+    **{c: " " for c in string.punctuation if c != "&"},
+    **{c: " | " for c in _BOUNDARIES},
+})
+
+
+def _tally(text: str, weight: float, scores: Dict[str, Any]) -> None:
+    """
+    Add all keyword hits in `text` to `scores`.
+    Words are counted with one tokenize + Counter pass and a set intersection
+    against the keyword table; phrases with one regex scan of the joined
+    tokens, which keep "|" boundary tokens. Both match whole words only.
+    """
+    tokens = text.translate(_SEPARATORS).split()
+    counts = Counter(tokens)
+    matches = [(_WORD_HITS[word], counts[word]) for word in counts.keys() & _WORD_KEYS]
+    phrase_counts = Counter(_PHRASE_PATTERN.findall(" ".join(tokens)))
+    matches += [(_PHRASE_HITS[phrase], found) for phrase, found in phrase_counts.items()]
+
+    for hits, count in matches:
+        for kind, label in hits:
+            if kind == "theme":
+                theme = scores["theme_scores"].setdefault(label, {"count": 0, "weight": 0.0})
+                theme["count"] += count
+                theme["weight"] += weight * count
+            elif kind == "sentiment":
+                scores["sentiment"][label] += count
+            else:
+                scores["categories"].add(label)
+
+
+def _empty_scores() -> Dict[str, Any]:
+    return {
+        "theme_scores": {},
+        "sentiment": {label: 0 for label in SENTIMENT_KEYWORDS},
+        "categories": set(),
+    }
+
+
+def _ranked_themes(theme_scores: Dict[str, Dict[str, float]]) -> List[str]:
+    """Theme names by weight (ties by name)."""
+    return sorted(theme_scores, key=lambda t: (-theme_scores[t]["weight"], t))[:MAX_THEMES]
+
+
+def analyze_article(article: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score one article (title hits weighted by TITLE_WEIGHT).
+
+    Args:
+        article: Article with `title` and `content`
+
+    Returns:
+        Dict with themes, theme_scores ({theme: {"count", "weight"}}),
+        sentiment counts and topic category
+    """
+    scores = _empty_scores()
+    _tally((article.get("title") or "").lower(), TITLE_WEIGHT, scores)
+    _tally((article.get("content") or "").lower(), 1.0, scores)
+
+    return {
+        "themes": _ranked_themes(scores["theme_scores"]),
+        "theme_scores": scores["theme_scores"],
+        "sentiment": scores["sentiment"],
+        "category": next((c for c in _CATEGORY_ORDER if c in scores["categories"]), "general"),
+    }
+
+
+def analyze_articles(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Score a batch of articles in one pass over all titles and one over all bodies.
+
+    Args:
+        articles: Articles with `title` and `content`
+
+    Returns:
+        Dict with:
+          - themes: Top theme names by weight
+          - theme_scores: {theme: {"count", "weight"}} for every theme hit
+          - sentiment: {"positive", "negative", "neutral"} hit counts
+    """
+    scores = _empty_scores()
+    # "\n" becomes a boundary token, so phrases never span two articles
+    _tally("\n".join(a.get("title") or "" for a in articles).lower(), TITLE_WEIGHT, scores)
+    _tally("\n".join(a.get("content") or "" for a in articles).lower(), 1.0, scores)
+
+    return {
+        "themes": _ranked_themes(scores["theme_scores"]),
+        "theme_scores": scores["theme_scores"],
+        "sentiment": scores["sentiment"],
+    }
@@ -0,0 +1,188 @@
+"""
+Per-company news index for GNews.
+Instead of five topic searches per enrichment, each company gets one search
+whose articles are kept in an in-process index keyed by canonical company
+name. Refreshes only ask for articles published since the newest one already
+indexed, and topics are assigned locally from article text.
+"""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.config import settings
+from app.services.coalescing import news_flights
+from app.services.news_analytics import analyze_article, analyze_articles
+
+logger = logging.getLogger(__name__)
+
+# Legal suffixes dropped from company names to build the index key
+_COMPANY_SUFFIXES = re.compile(
+    r"\b(inc|incorporated|corp|corporation|co|company|ltd|limited|llc|plc|gmbh|ag|sa|group|holdings)\b\.?"
+)
+
+
+def canonical_company_name(company_name: str) -> str:
+    """
+    Normalize a company name for use as the index key.
+    "Acme, Inc." and "ACME Corporation" both map to "acme".
+    """
+    name = (company_name or "").lower()
+    name = _COMPANY_SUFFIXES.sub(" ", name)
+    name = re.sub(r"[^a-z0-9&]+", " ", name)
+    return " ".join(name.split())
+
+
+def categorize_article(article: Dict[str, Any]) -> str:
+    """Assign a topic category from an article's title and description."""
+    return analyze_article(article)["category"]
+
+
+class NewsIndex:
+    """
+    In-process LRU of company news.
+    Entry per company: {"articles": {url: article}, "analytics": dict,
+    "newest": iso str, "refreshed_at": float}. Analytics are recomputed only
+    when the articles change, so index hits cost no text scanning.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: Optional[int] = None,
+        max_companies: Optional[int] = None,
+        max_articles: int = 50,
+        max_age_days: int = 30
+    ):
+        """
+        Initialize index.
+
+        Args:
+            refresh_seconds: How long an entry is served before an incremental refresh
+            max_companies: Companies kept in memory
+            max_articles: Articles kept per company (newest first)
+            max_age_days: Articles older than this are dropped
+        """
+        self.refresh_seconds = refresh_seconds or settings.NEWS_INDEX_REFRESH_SECONDS
+        self.max_companies = max_companies or settings.NEWS_INDEX_MAX_COMPANIES
+        self.max_articles = max_articles
+        self.max_age_days = max_age_days
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats_counters = {"hits": 0, "full_fetches": 0, "incremental_fetches": 0, "stale_served": 0}
+
+    async def get_articles(
+        self,
+        company_name: str,
+        search: Callable[[str, Optional[str]], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get indexed articles for a company, refreshing when due.
+        Concurrent refreshes of one company share a single search.
+
+        Args:
+            company_name: Company name as searched
+            search: search(company_name, since_iso) -> articles published after
+                `since_iso` (None = full search)
+
+        Returns:
+            Articles newest first, each with a `query_category`
+        """
+        key = canonical_company_name(company_name)
+        entry = self._entries.get(key)
+
+        if entry and time.time() - entry["refreshed_at"] < self.refresh_seconds:
+            self._entries.move_to_end(key)
+            self.stats_counters["hits"] += 1
+            return self._snapshot(entry)
+
+        articles = await news_flights.do(key, lambda: self._refresh(key, company_name, search))
+        return list(articles)
+
+    async def _refresh(
+        self,
+        key: str,
+        company_name: str,
+        search: Callable[[str, Optional[str]], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Search for a company's new articles and merge them into its entry."""
+        entry = self._entries.get(key)
+        since = entry["newest"] if entry else None
+        try:
+            fetched = await search(company_name, since)
+        except Exception:
+            if entry:
+                # Provider trouble: serve what we have rather than nothing
+                logger.warning(f"News refresh failed for {key}, serving indexed articles")
+                self.stats_counters["stale_served"] += 1
+                return self._snapshot(entry)
+            raise
+
+        self.stats_counters["incremental_fetches" if entry else "full_fetches"] += 1
+        entry = entry or {"articles": {}, "newest": None}
+        self._merge(entry, fetched)
+        entry["refreshed_at"] = time.time()
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_companies:
+            self._entries.popitem(last=False)
+
+        return self._snapshot(entry)
+
+    def _merge(self, entry: Dict[str, Any], articles: List[Dict[str, Any]]) -> None:
+        """Add new articles (deduped by URL), then prune by age and count."""
+        for article in articles:
+            url = article.get("url")
+            if not url or url in entry["articles"]:
+                continue
+            entry["articles"][url] = {**article, "query_category": categorize_article(article)}
+
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.max_age_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        kept = sorted(
+            (a for a in entry["articles"].values()
+             if not a.get("published_at") or a["published_at"] >= cutoff),
+            key=lambda a: a.get("published_at") or "",
+            reverse=True
+        )[:self.max_articles]
+        entry["articles"] = {a["url"]: a for a in kept}
+        entry["analytics"] = analyze_articles(kept)
+        if kept:
+            entry["newest"] = kept[0].get("published_at")
+
+    def _snapshot(self, entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Articles newest first (copies, so callers can't mutate the index)."""
+        return [dict(a) for a in entry["articles"].values()]
+
+    def get_analytics(self, company_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get themes/sentiment computed over a company's indexed articles.
+
+        Args:
+            company_name: Company name as searched
+
+        Returns:
+            analyze_articles() result, or None if the company is not indexed
+        """
+        entry = self._entries.get(canonical_company_name(company_name))
+        return entry.get("analytics") if entry else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters and size."""
+        return {**self.stats_counters, "companies": len(self._entries)}
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Global instance (lazy-loaded)
+_news_index: Optional[NewsIndex] = None
+
+
+def get_news_index() -> NewsIndex:
+    """Get or create the global news index."""
+    global _news_index
+    if _news_index is None:
+        _news_index = NewsIndex()
+    return _news_index
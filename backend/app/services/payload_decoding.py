@@ -0,0 +1,238 @@
+"""
+Field-projecting JSON decoding for provider payloads.
+PDL person and company records carry hundreds of fields, most of which our
+mappers never read. Each provider endpoint declares the fields its mapper uses
+in PAYLOAD_SCHEMAS; with msgspec installed, responses are decoded straight into
+structs holding only those fields, so unused subtrees are skipped by the parser
+instead of being built as dicts. Without msgspec, payloads are parsed with
+orjson (or json) and projected afterwards.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Typed projections need the optional `msgspec` package (pip install msgspec)
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Schema notation: {"key": subschema} keeps only the listed keys of an object,
+# [subschema] is a list of such objects, and ANY keeps a value as-is.
+ANY = None
+
+_APOLLO_PERSON = {
+    "first_name": ANY,
+    "last_name": ANY,
+    "title": ANY,
+    "linkedin_url": ANY,
+    "city": ANY,
+    "state": ANY,
+    "country": ANY,
+    "seniority": ANY,
+    "departments": ANY,
+    "organization": {
+        "name": ANY,
+        "primary_domain": ANY,
+        "industry": ANY,
+        "estimated_num_employees": ANY,
+    },
+}
+
+_PDL_PERSON = {
+    "first_name": ANY,
+    "last_name": ANY,
+    "full_name": ANY,
+    "linkedin_url": ANY,
+    "job_title": ANY,
+    "job_company_name": ANY,
+    "job_company_industry": ANY,
+    "job_company_size": ANY,
+    "location_country": ANY,
+    "location_region": ANY,
+    "location_locality": ANY,
+    "skills": ANY,
+    "interests": ANY,
+    # Kept whole: the recent positions are stored in raw/finalize data and
+    # returned by the profile endpoints, so their shape must not change
+    "experience": ANY,
+}
+
+_PDL_COMPANY = {
+    key: ANY for key in (
+        "name", "display_name", "size", "employee_count", "employee_count_range",
+        "founded", "industry", "naics", "sic", "location", "locality", "region",
+        "country", "type", "ticker", "linkedin_url", "linkedin_id", "facebook_url",
+        "twitter_url", "profiles", "tags", "headline", "summary", "alternative_names",
+        "affiliated_profiles", "total_funding_raised", "latest_funding_stage",
+        "last_funding_date", "number_funding_rounds", "inferred_revenue",
+        "direct_phone_numbers", "employee_growth_rate",
+    )
+}
+
+# Fields each provider mapper reads, by "<source>.<endpoint>"
+PAYLOAD_SCHEMAS: Dict[str, Any] = {
+    "apollo.match": {"person": _APOLLO_PERSON},
+    "apollo.bulk_match": {"matches": [_APOLLO_PERSON]},
+    "pdl.person": _PDL_PERSON,
+    "pdl.person_bulk": [{"status": ANY, "data": _PDL_PERSON}],
+    "pdl.company": _PDL_COMPANY,
+    "hunter.email_verifier": {
+        "data": {
+            key: ANY for key in (
+                "status", "result", "score", "regexp", "gibberish", "disposable",
+                "webmail", "mx_records", "smtp_server", "smtp_check", "accept_all", "block",
+            )
+        }
+    },
+    "gnews.search": {
+        "articles": [{
+            "title": ANY,
+            "url": ANY,
+            "description": ANY,
+            "content": ANY,
+            "publishedAt": ANY,
+            "image": ANY,
+            "source": {"name": ANY, "url": ANY},
+        }]
+    },
+    "zoominfo.authenticate": {"jwt": ANY},
+    "zoominfo.company": {
+        "data": [{
+            key: ANY for key in (
+                "name", "website", "industry", "subIndustry", "employeeCount", "revenue",
+                "city", "state", "country", "description", "foundedYear", "techStackIds",
+            )
+        }]
+    },
+}
+
+
+def _loads(content: Union[bytes, str]) -> Any:
+    """Parse a full JSON document with the fastest available parser."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def project(value: Any, schema: Any) -> Any:
+    """
+    Keep only the parts of an already-parsed value that `schema` declares.
+    Values whose type doesn't match the schema are returned unchanged.
+
+    Args:
+        value: Parsed JSON value
+        schema: Schema in PAYLOAD_SCHEMAS notation
+
+    Returns:
+        Projected value
+    """
+    if schema is ANY:
+        return value
+    if isinstance(schema, dict) and isinstance(value, dict):
+        return {key: project(value[key], sub) for key, sub in schema.items() if key in value}
+    if isinstance(schema, list) and isinstance(value, list):
+        return [project(item, schema[0]) for item in value]
+    return value
+
+
+def _msgspec_type(schema: Any, name: str) -> Any:
+    """Build the msgspec type for a schema (objects become nullable Structs)."""
+    if schema is ANY:
+        return Any
+    if isinstance(schema, list):
+        return List[_msgspec_type(schema[0], name)]
+    # Missing keys stay UNSET and are dropped again by to_builtins()
+    struct = msgspec.defstruct(
+        name,
+        [
+            (key, _msgspec_type(sub, f"{name}_{key}"), msgspec.UNSET)
+            for key, sub in schema.items()
+        ],
+    )
+    return Optional[struct]
+
+
+class PayloadDecoder:
+    """Decodes one endpoint's JSON responses into projected plain dicts/lists."""
+
+    def __init__(self, schema: Any, name: str = "payload", use_msgspec: bool = MSGSPEC_AVAILABLE):
+        """
+        Initialize decoder.
+
+        Args:
+            schema: Schema in PAYLOAD_SCHEMAS notation
+            name: Name used for the generated struct types
+            use_msgspec: Decode into typed structs (falls back to parse + project)
+        """
+        self.schema = schema
+        self._decoder = None
+        if use_msgspec and MSGSPEC_AVAILABLE:
+            self._decoder = msgspec.json.Decoder(_msgspec_type(schema, name))
+
+    def decode(self, content: Union[bytes, str]) -> Any:
+        """
+        Decode a response body.
+
+        Args:
+            content: Raw JSON body
+
+        Returns:
+            Projected value as plain dicts/lists
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if self._decoder is not None:
+            try:
+                return msgspec.to_builtins(self._decoder.decode(content))
+            except msgspec.ValidationError as e:
+                # Valid JSON in an unexpected shape: keep the legacy behavior
+                logger.debug(f"Typed decode failed ({e}), projecting parsed payload")
+        return project(_loads(content), self.schema)
+
+
+# Global decoders (one per schema, lazy-loaded)
+_decoders: Dict[str, PayloadDecoder] = {}
+
+
+def get_payload_decoder(schema_name: str) -> PayloadDecoder:
+    """
+    Get or create the decoder for a PAYLOAD_SCHEMAS entry.
+
+    Args:
+        schema_name: Key in PAYLOAD_SCHEMAS, e.g. "pdl.person"
+
+    Returns:
+        Shared PayloadDecoder
+    """
+    decoder = _decoders.get(schema_name)
+    if decoder is None:
+        struct_name = "".join(part.title() for part in schema_name.replace(".", "_").split("_"))
+        decoder = PayloadDecoder(PAYLOAD_SCHEMAS[schema_name], name=struct_name)
+        _decoders[schema_name] = decoder
+    return decoder
+
+
+def decode_payload(schema_name: str, content: Union[bytes, str]) -> Any:
+    """
+    Decode a provider response, keeping only the fields its mapper reads.
+
+    Args:
+        schema_name: Key in PAYLOAD_SCHEMAS
+        content: Raw JSON body
+
+    Returns:
+        Projected value as plain dicts/lists
+    """
+    return get_payload_decoder(schema_name).decode(content)
@@ -2,16 +2,23 @@
 PDF Service: Generates personalized ebook PDFs.
 Uses HTML templates with personalization slots.
 Stores PDFs in Supabase Storage, returns signed URLs.
+Rendered PDFs are cached per content (PDFArtifact) so delivery, storage upload
+and download share one WeasyPrint layout pass.
 """
 
+import asyncio
 import logging
 import io
 import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from string import Template
 
 from app.config import settings
+from app.services.coalescing import pdf_flights
 from app.services.ebook_content import (
     EBOOK_SECTIONS,
     CASE_STUDIES,
@@ -26,6 +33,73 @@ logger = logging.getLogger(__name__)
 PDF_EXPIRY_HOURS = 24 * 7  # 7 days
 
 
+@dataclass
+class PDFArtifact:
+    """One rendered PDF, shared by email attachment, storage upload and download."""
+    key: str  # sha256 of the rendered HTML
+    pdf_bytes: bytes
+    case_study_used: Optional[str] = None
+    created_at: float = field(default_factory=time.monotonic)
+    stored: Dict[Any, Dict[str, Any]] = field(default_factory=dict)  # job_id -> upload result
+
+
+class PDFArtifactCache:
+    """In-process LRU of rendered PDFs keyed by the hash of their HTML."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Max PDFs kept in memory
+            ttl_seconds: Seconds a rendered PDF is reused
+        """
+        self.max_entries = max_entries or settings.PDF_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.PDF_CACHE_TTL_SECONDS
+        self._lru: "OrderedDict[str, PDFArtifact]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[PDFArtifact]:
+        """Get a fresh artifact, or None."""
+        artifact = self._lru.get(key)
+        if artifact is not None and time.monotonic() - artifact.created_at < self.ttl_seconds:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return artifact
+        self._lru.pop(key, None)
+        self.misses += 1
+        return None
+
+    def put(self, artifact: PDFArtifact) -> None:
+        """Store an artifact, evicting the least recently used past max_entries."""
+        self._lru[artifact.key] = artifact
+        self._lru.move_to_end(artifact.key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters."""
+        return {
+            "entries": len(self._lru),
+            "bytes": sum(len(a.pdf_bytes) for a in self._lru.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global instance (lazy-loaded)
+_pdf_artifact_cache: Optional[PDFArtifactCache] = None
+
+
+def get_pdf_artifact_cache() -> PDFArtifactCache:
+    """Get or create the global PDF artifact cache."""
+    global _pdf_artifact_cache
+    if _pdf_artifact_cache is None:
+        _pdf_artifact_cache = PDFArtifactCache()
+    return _pdf_artifact_cache
+
+
 class PDFService:
     """
     Generates personalized PDF ebooks.
@@ -74,28 +148,7 @@ class PDFService:
             if not pdf_bytes:
                 raise ValueError("PDF generation returned empty content")
 
-            # Generate unique filename
-            email = profile.get("email", "unknown")
-            filename = self._generate_filename(email, job_id)
-
-            # Store in Supabase Storage (if available)
-            if self.supabase:
-                storage_path, pdf_url = await self._store_pdf(
-                    pdf_bytes, filename
-                )
-            else:
-                # Return base64 for testing
-                import base64
-                storage_path = f"local/{filename}"
-                pdf_url = f"data:application/pdf;base64,{base64.b64encode(pdf_bytes).decode()}"
-
-            result = {
-                "pdf_url": pdf_url,
-                "storage_path": storage_path,
-                "file_size_bytes": len(pdf_bytes),
-                "generated_at": datetime.utcnow().isoformat(),
-                "expires_at": (datetime.utcnow() + timedelta(hours=PDF_EXPIRY_HOURS)).isoformat()
-            }
+            result = await self._publish_pdf(pdf_bytes, profile.get("email", "unknown"), job_id)
 
             logger.info(f"Generated PDF for job {job_id}: {len(pdf_bytes)} bytes")
             return result
@@ -146,26 +199,8 @@ class PDFService:
             if not pdf_bytes:
                 raise ValueError("PDF generation returned empty content")
 
-            # Generate unique filename
-            email = profile.get("email", "unknown")
-            filename = self._generate_filename(email, job_id)
-
-            # Store in Supabase Storage (if available)
-            if self.supabase:
-                storage_path, pdf_url = await self._store_pdf(pdf_bytes, filename)
-            else:
-                import base64
-                storage_path = f"local/{filename}"
-                pdf_url = f"data:application/pdf;base64,{base64.b64encode(pdf_bytes).decode()}"
-
-            result = {
-                "pdf_url": pdf_url,
-                "storage_path": storage_path,
-                "file_size_bytes": len(pdf_bytes),
-                "generated_at": datetime.utcnow().isoformat(),
-                "expires_at": (datetime.utcnow() + timedelta(hours=PDF_EXPIRY_HOURS)).isoformat(),
-                "case_study_used": case_study["title"]
-            }
+            result = await self._publish_pdf(pdf_bytes, profile.get("email", "unknown"), job_id)
+            result["case_study_used"] = case_study["title"]
 
             logger.info(f"Generated AMD ebook for job {job_id}: {len(pdf_bytes)} bytes, case study: {case_study['title']}")
             return result
@@ -174,6 +209,117 @@ class PDFService:
             logger.error(f"AMD ebook generation failed for job {job_id}: {e}")
             raise
 
+    async def render_profile_pdf(
+        self,
+        profile: Dict[str, Any],
+        intro_hook: str = "",
+        cta: str = ""
+    ) -> PDFArtifact:
+        """
+        Render a profile's ebook PDF, reusing an identical earlier render.
+        Uses the AMD ebook template when the profile has ebook_personalization,
+        else the legacy template. Concurrent renders of the same content share
+        one layout pass.
+
+        Args:
+            profile: Normalized profile (finalize_data.normalized_data)
+            intro_hook: Legacy intro (used without ebook_personalization)
+            cta: Legacy CTA (used without ebook_personalization)
+
+        Returns:
+            PDFArtifact with the PDF bytes
+        """
+        ebook_personalization = profile.get("ebook_personalization") or {}
+        user_context = profile.get("user_context") or {}
+        case_study = None
+        if ebook_personalization:
+            case_study = self._get_case_study_for_profile(profile, user_context)
+            html_content = self._render_amd_ebook_template(
+                profile=profile,
+                personalized_hook=ebook_personalization.get("personalized_hook", ""),
+                case_study=case_study,
+                case_study_framing=ebook_personalization.get("case_study_framing", ""),
+                personalized_cta=ebook_personalization.get("personalized_cta", ""),
+                user_context=user_context
+            )
+        else:
+            html_content = self._render_template(profile, intro_hook, cta)
+
+        # Rendering the template is cheap; the HTML identifies the PDF exactly
+        key = hashlib.sha256(html_content.encode()).hexdigest()
+        artifact = get_pdf_artifact_cache().get(key)
+        if artifact is not None:
+            return artifact
+        return await pdf_flights.do(key, lambda: self._render_artifact(key, html_content, case_study))
+
+    async def _render_artifact(
+        self,
+        key: str,
+        html_content: str,
+        case_study: Optional[Dict[str, Any]]
+    ) -> PDFArtifact:
+        """Run the PDF layout and cache the result."""
+        pdf_bytes = await self._html_to_pdf(html_content)
+        if not pdf_bytes:
+            raise ValueError("PDF generation returned empty content")
+        artifact = PDFArtifact(
+            key=key,
+            pdf_bytes=pdf_bytes,
+            case_study_used=case_study["title"] if case_study else None
+        )
+        get_pdf_artifact_cache().put(artifact)
+        return artifact
+
+    async def store_artifact(
+        self,
+        artifact: PDFArtifact,
+        job_id: int,
+        email: str
+    ) -> Dict[str, Any]:
+        """
+        Upload a rendered PDF once per job; later calls for the job reuse the
+        stored copy. Each job gets its own file, path and expiry.
+
+        Args:
+            artifact: Rendered PDF
+            job_id: Job ID for the filename
+            email: Email for the filename
+
+        Returns:
+            Dict with pdf_url, storage_path, file_size_bytes, generated_at, expires_at
+        """
+        if job_id not in artifact.stored:
+            result = await pdf_flights.do(
+                ("store", artifact.key, job_id),
+                lambda: self._publish_pdf(artifact.pdf_bytes, email, job_id)
+            )
+            if artifact.case_study_used:
+                result["case_study_used"] = artifact.case_study_used
+            artifact.stored[job_id] = result
+        return artifact.stored[job_id]
+
+    async def _publish_pdf(self, pdf_bytes: bytes, email: str, job_id: int) -> Dict[str, Any]:
+        """Store PDF bytes (Supabase Storage, else a data URL) and describe the result."""
+        # Generate unique filename
+        filename = self._generate_filename(email, job_id)
+
+        # Store in Supabase Storage (if available)
+        if self.supabase:
+            storage_path, pdf_url = await self._store_pdf(pdf_bytes, filename)
+        else:
+            # Return base64 for testing
+            import base64
+            storage_path = f"local/{filename}"
+            pdf_url = f"data:application/pdf;base64,{base64.b64encode(pdf_bytes).decode()}"
+
+        return {
+            "pdf_url": pdf_url,
+            "storage_path": storage_path,
+            "file_size_bytes": len(pdf_bytes),
+            "generated_at": datetime.utcnow().isoformat(),
+            "expires_at": (datetime.utcnow() + timedelta(hours=PDF_EXPIRY_HOURS)).isoformat()
+        }
+
     def _render_amd_ebook_template(
         self,
         profile: Dict[str, Any],
@@ -1340,7 +1486,8 @@ class PDFService:
         try:
             # Try weasyprint first (preferred for production)
             from weasyprint import HTML
-            pdf_bytes = HTML(string=html_content).write_pdf()
+            # Layout is CPU-bound; keep the event loop free (e.g. for a concurrent upload)
+            pdf_bytes = await asyncio.to_thread(HTML(string=html_content).write_pdf)
             logger.info("Generated PDF using weasyprint")
             return pdf_bytes
         except ImportError:
@@ -1628,17 +1775,19 @@ startxref
             return storage_path, mock_url
 
         try:
-            # Upload to Supabase Storage
-            self.supabase.client.storage.from_(self.storage_bucket).upload(
+            bucket = self.supabase.client.storage.from_(self.storage_bucket)
+
+            # Upload to Supabase Storage (blocking client; run off the event loop)
+            await asyncio.to_thread(
+                bucket.upload,
                 filename,
                 pdf_bytes,
                 {"content-type": "application/pdf"}
             )
 
             # Generate signed URL
-            signed_url = self.supabase.client.storage.from_(
-                self.storage_bucket
-            ).create_signed_url(
+            signed_url = await asyncio.to_thread(
+                bucket.create_signed_url,
                 filename,
                 PDF_EXPIRY_HOURS * 3600  # Convert to seconds
             )
@@ -7,14 +7,25 @@ RAD Orchestrator: Coordinates enrichment workflow.
 
 import logging
 import asyncio
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable, Awaitable
 
 from app.config import settings
-from app.services.supabase_client import SupabaseClient
+from app.services.supabase_client import SupabaseClient, get_supabase_client
+from app.services.enrichment_cache import COMPANY_CACHE_TTLS, CompanyCache, get_company_cache, normalize_domain
+from app.services.news_index import canonical_company_name
+from app.services.domain_classifier import DisposableEmailError, EmailClassification, FREEMAIL, get_domain_classifier
+from app.services.negative_cache import NegativeCache, cached_not_found, get_negative_cache, is_not_found
+from app.services.coalescing import enrichment_flights, company_flights
+from app.services.deadline import remaining_budget
+from app.services.job_events import emit_job_event
 from app.services.enrichment_apis import (
     get_enrichment_apis,
     EnrichmentAPIError,
+    CircuitOpenError,
+    DEEP_ENRICHMENT_TIMEOUT,
     ApolloAPI,
     PDLAPI,
     HunterAPI,
@@ -24,6 +35,31 @@ from app.services.enrichment_apis import (
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class FetchStage:
+    """One fetch in the enrichment graph; runs once all `inputs` stages resolve."""
+    name: str
+    run: Callable[[Dict[str, Dict[str, Any]]], Awaitable[Dict[str, Any]]]
+    inputs: Tuple[str, ...] = ()
+
+
+# Upper bound on how long late sources may keep running after the budget (seconds).
+# A safety net only: late provider calls inherit the request deadline, so their
+# HTTP timeouts already end them within REQUEST_BUDGET_SECONDS.
+LATE_RESULT_TIMEOUT = DEEP_ENRICHMENT_TIMEOUT
+
+# How long a backfill waits for its request to persist the profile (seconds). The
+# request writes finalize_data before its own deadline or not at all.
+FINALIZE_WAIT_TIMEOUT = settings.REQUEST_BUDGET_SECONDS
+
+# email -> one event per pending backfill, set once a request has written
+# finalize_data (gates backfills; overlapping runs for an email each get their own)
+_finalized_events: Dict[str, Set[asyncio.Event]] = {}
+
+# Strong references to background backfill tasks
+_background_tasks: Set[asyncio.Task] = set()
+
 # Source trust priority (higher = more trusted)
 SOURCE_PRIORITY = {
     "apollo": 5,
@@ -34,35 +70,279 @@ SOURCE_PRIORITY = {
     "gnews": 1
 }
 
+# Fetch plans: call every provider, or provider tiers only while fields are missing
+FETCH_PLAN_FULL = "full"
+FETCH_PLAN_WATERFALL = "waterfall"
+FETCH_PLANS = (FETCH_PLAN_FULL, FETCH_PLAN_WATERFALL)
+
+
+@dataclass
+class EnrichmentContext:
+    """
+    State of one enrich() call. The orchestrator itself only holds shared
+    clients and caches, so one instance can serve concurrent requests.
+    """
+    email: str
+    domain: str
+    classification: EmailClassification
+    fetch_plan: str = FETCH_PLAN_FULL
+    known_fields: Dict[str, Any] = field(default_factory=dict)
+    prefetched: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    data_sources: List[str] = field(default_factory=list)
+    stage_timings: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+# Sources that describe the company behind the email domain (skipped for free-mail domains)
+COMPANY_LEVEL_SOURCES = ("pdl_company", "zoominfo", "gnews")
+
+# Skip reasons that don't count against source coverage in the quality score
+UNSCORED_SKIPS = ("waterfall", "personal_domain")
+
+# Normalized field -> (source, source_field) candidates, including PDL company data
+# for richer company insights. Listing order breaks ties between equal priorities.
+FIELD_MAPPINGS: Dict[str, List[Tuple[str, str]]] = {
+    "first_name": [
+        ("apollo", "first_name"),
+        ("pdl", "first_name"),
+    ],
+    "last_name": [
+        ("apollo", "last_name"),
+        ("pdl", "last_name"),
+    ],
+    "full_name": [
+        ("pdl", "full_name"),
+    ],
+    "title": [
+        ("apollo", "title"),
+        ("pdl", "job_title"),
+    ],
+    "company_name": [
+        ("pdl_company", "name"),
+        ("apollo", "company_name"),
+        ("zoominfo", "company_name"),
+        ("pdl", "job_company_name"),
+    ],
+    "company_display_name": [
+        ("pdl_company", "display_name"),
+    ],
+    "industry": [
+        ("pdl_company", "industry"),
+        ("apollo", "industry"),
+        ("zoominfo", "industry"),
+        ("pdl", "job_company_industry"),
+    ],
+    "company_size": [
+        ("pdl_company", "size"),
+        ("apollo", "company_size"),
+        ("pdl", "job_company_size"),
+    ],
+    "employee_count": [
+        ("pdl_company", "employee_count"),
+        ("zoominfo", "employee_count"),
+    ],
+    "employee_count_range": [
+        ("pdl_company", "employee_count_range"),
+    ],
+    "linkedin_url": [
+        ("apollo", "linkedin_url"),
+        ("pdl", "linkedin_url"),
+    ],
+    "city": [
+        ("pdl_company", "locality"),
+        ("apollo", "city"),
+        ("zoominfo", "city"),
+        ("pdl", "location_locality"),
+    ],
+    "state": [
+        ("pdl_company", "region"),
+        ("apollo", "state"),
+        ("zoominfo", "state"),
+        ("pdl", "location_region"),
+    ],
+    "country": [
+        ("pdl_company", "country"),
+        ("apollo", "country"),
+        ("zoominfo", "country"),
+        ("pdl", "location_country"),
+    ],
+    "seniority": [
+        ("apollo", "seniority"),
+    ],
+    "skills": [
+        ("pdl", "skills"),
+    ],
+    "interests": [
+        ("pdl", "interests"),
+    ],
+    "experience": [
+        ("pdl", "experience"),
+    ],
+    "company_description": [
+        ("pdl_company", "summary"),
+        ("zoominfo", "description"),
+    ],
+    "founded_year": [
+        ("pdl_company", "founded"),
+        ("zoominfo", "founded_year"),
+    ],
+    "company_type": [
+        ("pdl_company", "type"),
+    ],
+    "ticker": [
+        ("pdl_company", "ticker"),
+    ],
+    "naics_codes": [
+        ("pdl_company", "naics"),
+    ],
+    "sic_codes": [
+        ("pdl_company", "sic"),
+    ],
+}
+
+
+def compile_resolution_plan(
+    field_mappings: Dict[str, List[Tuple[str, str]]]
+) -> Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]:
+    """
+    Compile field mappings into a resolution plan: each field's candidates sorted
+    once by SOURCE_PRIORITY (highest first; listing order breaks ties), so
+    resolving a field is a scan that stops at the first non-empty value.
+
+    Args:
+        field_mappings: Normalized field -> list of (source, source_field)
+
+    Returns:
+        Tuple of (field, ((source, source_field), ...)) pairs
+    """
+    return tuple(
+        (field_name, tuple(sorted(sources, key=lambda pair: -SOURCE_PRIORITY.get(pair[0], 0))))
+        for field_name, sources in field_mappings.items()
+    )
+
+
+RESOLUTION_PLAN = compile_resolution_plan(FIELD_MAPPINGS)
+
+
+def resolve_planned_fields(
+    raw_data: Dict[str, Dict[str, Any]],
+    plan: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = RESOLUTION_PLAN
+) -> Dict[str, Any]:
+    """
+    Resolve every mapped field of one profile with a compiled plan.
+
+    Args:
+        raw_data: Raw data per source (error dicts are ignored)
+        plan: Compiled resolution plan
+
+    Returns:
+        Normalized field -> value, for fields some source filled
+    """
+    usable = {source: data for source, data in raw_data.items() if data and not data.get("_error")}
+    resolved = {}
+    for field_name, sources in plan:
+        for source, source_field in sources:
+            data = usable.get(source)
+            if data is not None:
+                value = data.get(source_field)
+                if value is not None and value != "":
+                    resolved[field_name] = value
+                    break
+    return resolved
+
+
+# Fields sent to job event subscribers as soon as a provider returns
+PREVIEW_FIELDS = ("first_name", "last_name", "full_name", "title", "company_name", "industry")
+
+# Normalized fields _resolve_profile fills from a source outside FIELD_MAPPINGS
+SOURCE_EXTRA_FIELDS = {
+    "hunter": ("email_verified", "email_score", "email_deliverable"),
+    "gnews": ("company_context", "recent_news", "news_themes", "news_sentiment", "news_by_category"),
+    "pdl_company": (
+        "company_summary", "company_headline", "company_type", "company_tags", "total_funding",
+        "latest_funding_stage", "employee_growth_rate", "inferred_revenue", "company_linkedin",
+    ),
+}
+
+
+def select_fetch_plan(requested: Optional[str] = None, campaign: Optional[str] = None) -> str:
+    """
+    Pick the fetch plan for a request.
+    An explicit plan wins, then the campaign's plan (CAMPAIGN_FETCH_PLANS, keyed
+    by cta), then ENRICHMENT_FETCH_PLAN.
+
+    Args:
+        requested: Plan named in the request
+        campaign: Campaign key (the request's cta)
+
+    Returns:
+        One of FETCH_PLANS
+    """
+    plan = requested
+    if not plan and campaign:
+        for entry in settings.CAMPAIGN_FETCH_PLANS.split(","):
+            name, _, campaign_plan = entry.partition(":")
+            if name.strip() == campaign:
+                plan = campaign_plan.strip()
+                break
+    plan = plan or settings.ENRICHMENT_FETCH_PLAN
+    if plan not in FETCH_PLANS:
+        logger.warning(f"Unknown fetch plan {plan!r}, using {FETCH_PLAN_FULL}")
+        return FETCH_PLAN_FULL
+    return plan
+
+
+def waterfall_tiers() -> List[Tuple[str, ...]]:
+    """
+    Group sources into waterfall tiers by SOURCE_PRIORITY, most trusted first.
+    The cheaper per-domain company sources (cached) share the second tier.
+    """
+    tiers: Dict[int, List[str]] = {}
+    for source, priority in SOURCE_PRIORITY.items():
+        tiers.setdefault(priority, []).append(source)
+    return [tuple(tiers[priority]) for priority in sorted(tiers, reverse=True)]
+
 
 class RADOrchestrator:
     """
     Orchestrates the full enrichment pipeline for a given email.
     Fetches from multiple APIs in parallel, merges data with conflict resolution.
+    Holds no per-call state (see EnrichmentContext): one shared instance
+    (get_rad_orchestrator) serves all concurrent requests.
     """
 
-    def __init__(self, supabase_client: SupabaseClient):
+    def __init__(
+        self,
+        supabase_client: SupabaseClient,
+        company_cache: Optional[CompanyCache] = None,
+        negative_cache: Optional[NegativeCache] = None
+    ):
         """
         Initialize orchestrator.
 
         Args:
             supabase_client: Supabase data access layer
+            company_cache: Domain-keyed cache for company-level sources (defaults to global)
+            negative_cache: Cache of provider "no match" results (defaults to global)
         """
         self.supabase = supabase_client
-        self.data_sources: List[str] = []
         self.apis = get_enrichment_apis()
+        self.company_cache = company_cache or get_company_cache()
+        self.negative_cache = negative_cache or get_negative_cache()
+        self.domain_classifier = get_domain_classifier()
 
     async def enrich(
         self,
         email: str,
         domain: Optional[str] = None,
-        job_id: Optional[int] = None
+        prefetched: Optional[Dict[str, Dict[str, Any]]] = None,
+        fetch_plan: str = FETCH_PLAN_FULL,
+        known_fields: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Execute full enrichment pipeline for an email.
 
         Flow:
-          1. Fetch raw data from external APIs (parallel)
+          1. Fetch raw data from external APIs (parallel, within the enrichment budget)
           2. Store raw data in Supabase
           3. Apply resolution logic (merge with priority)
           4. Return normalized profile (personalization added by LLM service)
@@ -70,27 +350,76 @@ class RADOrchestrator:
         Args:
             email: Email address to enrich
             domain: Company domain (optional, extracted from email if not provided)
-            job_id: Optional job ID for tracking
+            prefetched: Source name -> data already fetched for this email
+                (bulk calls in enrich_batch); those sources are not called again
+            fetch_plan: "full" or "waterfall" (see select_fetch_plan)
+            known_fields: Normalized fields the user already supplied; the
+                waterfall plan counts them as filled
+
+        Concurrent calls for the same email share one in-flight enrichment.
 
         Returns:
             Normalized profile dict with metadata
+
+        Raises:
+            DisposableEmailError: If the email is at a disposable mailbox provider
         """
+        email = email.strip().lower()
+        classification = self.domain_classifier.classify(email)
+        if settings.REJECT_DISPOSABLE_EMAILS and classification.is_disposable:
+            raise DisposableEmailError(email)
+
+        ctx = EnrichmentContext(
+            email=email,
+            # Extract domain from email if not provided
+            domain=domain or email.split("@")[1],
+            classification=classification,
+            fetch_plan=fetch_plan,
+            known_fields={name: value for name, value in (known_fields or {}).items() if value},
+            prefetched=dict(prefetched or {}),
+        )
+        flight_key = (email, normalize_domain(ctx.domain))
+        if fetch_plan != FETCH_PLAN_FULL:
+            # Waterfall results depend on which fields the caller already has
+            flight_key += (fetch_plan, tuple(sorted(ctx.known_fields)))
+
+        result = await enrichment_flights.do(flight_key, lambda: self._enrich_uncoalesced(ctx))
+
+        # Each caller gets its own copy (routes mutate the profile)
+        normalized = dict(result)
+        normalized["data_sources"] = list(result.get("data_sources", []))
+        normalized["skipped_sources"] = list(result.get("skipped_sources", []))
+        normalized["skipped_reasons"] = dict(result.get("skipped_reasons", {}))
+        normalized["pending_sources"] = list(result.get("pending_sources", []))
+        return normalized
+
+    async def _enrich_uncoalesced(self, ctx: EnrichmentContext) -> Dict[str, Any]:
+        """Run the enrichment pipeline for one email (see enrich)."""
+        email, domain = ctx.email, ctx.domain
         try:
             logger.info(f"Starting enrichment for {email}")
-            self.data_sources = []
 
-            # Extract domain from email if not provided
-            if not domain:
-                domain = email.split("@")[1]
+            # A free-mail domain says nothing about the employer: don't look it up
+            if self.domain_classifier.classify_domain(domain) == FREEMAIL:
+                ctx.prefetched = {
+                    **{
+                        source: {"_error": f"Personal email domain: {domain}", "_skipped": "personal_domain"}
+                        for source in COMPANY_LEVEL_SOURCES
+                    },
+                    **ctx.prefetched,
+                }
 
-            # Step 1: Fetch raw data from all APIs in parallel
-            raw_data = await self._fetch_all_sources(email, domain)
+            # Step 1: Fetch raw data from all APIs (stage graph, within budget)
+            raw_data = await self._fetch_all_sources(
+                email, domain, prefetched=ctx.prefetched, timings=ctx.stage_timings,
+                fetch_plan=ctx.fetch_plan, known_fields=ctx.known_fields
+            )
 
             # Step 2: Store raw data in Supabase
             for source, data in raw_data.items():
                 if data and not data.get("_error"):
                     self.supabase.store_raw_data(email, source, data)
-                    self.data_sources.append(source)
+                    ctx.data_sources.append(source)
 
             # Step 3: Apply resolution logic
             normalized = self._resolve_profile(email, domain, raw_data)
@@ -99,74 +428,447 @@ class RADOrchestrator:
             normalized["email"] = email
             normalized["domain"] = domain
             normalized["resolved_at"] = datetime.utcnow().isoformat()
-            normalized["data_sources"] = self.data_sources
+            normalized["domain_type"] = ctx.classification.domain_type
+            normalized["role_account"] = ctx.classification.role_account
+            normalized["data_sources"] = ctx.data_sources
+            # Sources not called: circuit open, known miss, personal domain, or not
+            # needed/out of budget in a waterfall
+            normalized["skipped_reasons"] = {
+                source: data["_skipped"] for source, data in raw_data.items()
+                if data and data.get("_skipped")
+            }
+            normalized["skipped_sources"] = list(normalized["skipped_reasons"])
+            normalized["fetch_plan"] = ctx.fetch_plan
+            # Sources still running after the budget (backfilled into finalize_data)
+            normalized["pending_sources"] = [
+                source for source, data in raw_data.items() if data and data.get("_pending")
+            ]
+            normalized["stage_timings"] = ctx.stage_timings
             normalized["data_quality_score"] = self._calculate_quality_score(raw_data)
+            emit_job_event("profile", {
+                **{name: normalized.get(name) for name in PREVIEW_FIELDS},
+                "data_sources": ctx.data_sources,
+                "pending_sources": normalized["pending_sources"],
+                "data_quality_score": normalized["data_quality_score"],
+            })
 
-            logger.info(f"Enrichment complete for {email}: {len(self.data_sources)} sources")
+            logger.info(f"Enrichment complete for {email}: {len(ctx.data_sources)} sources")
             return normalized
 
         except Exception as e:
             logger.error(f"Enrichment failed for {email}: {e}")
             raise
 
+    def _build_stages(
+        self,
+        email: str,
+        domain: str,
+        company_name: Optional[str] = None
+    ) -> List[FetchStage]:
+        """
+        Describe the fetches for one email as a dependency graph.
+
+        Person sources and the PDL company lookup only need the email/domain
+        and start immediately; GNews waits for the company name from PDL
+        company so it searches for the real name rather than the domain label.
+
+        Args:
+            email: Email address
+            domain: Company domain
+            company_name: Company name GNews falls back to when PDL company has none
+
+        Returns:
+            List of stages (inputs must name other stages)
+        """
+        def fetch(source: str) -> Callable[[Dict[str, Dict[str, Any]]], Awaitable[Dict[str, Any]]]:
+            return lambda inputs: self._fetch_with_fallback(source, email, domain)
+
+        def fetch_news(inputs: Dict[str, Dict[str, Any]]) -> Awaitable[Dict[str, Any]]:
+            company = inputs.get("pdl_company") or {}
+            resolved_name = None if company.get("_error") or company.get("_mock") else company.get("name")
+            return self._fetch_with_fallback(
+                "gnews", email, domain, company_name=resolved_name or company_name
+            )
+
+        return [
+            FetchStage("apollo", fetch("apollo")),
+            FetchStage("pdl", fetch("pdl")),
+            FetchStage("hunter", fetch("hunter")),
+            FetchStage("zoominfo", fetch("zoominfo")),
+            FetchStage("pdl_company", lambda inputs: self._fetch_pdl_company(domain)),
+            FetchStage("gnews", fetch_news, inputs=("pdl_company",)),
+        ]
+
+    def _start_stages(
+        self,
+        stages: List[FetchStage],
+        resolved: Dict[str, Dict[str, Any]],
+        timings: Dict[str, Dict[str, int]]
+    ) -> Dict[str, asyncio.Task]:
+        """
+        Start every stage as a task; each awaits its inputs, then runs.
+
+        Args:
+            stages: Stages from _build_stages
+            resolved: Stage name -> data already available (not re-run)
+            timings: Filled with per-stage start offset (i.e. input wait) and duration (ms)
+
+        Returns:
+            Stage name -> task
+        """
+        origin = time.monotonic()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(stage: FetchStage) -> Dict[str, Any]:
+            # Shielded so cancelling a late dependent never cancels its inputs
+            inputs = {
+                name: resolved[name] if name in resolved else await asyncio.shield(tasks[name])
+                for name in stage.inputs
+            }
+            started = time.monotonic()
+            result: Dict[str, Any] = {}
+            try:
+                result = await stage.run(inputs)
+                return result
+            except Exception as e:
+                result = {"_error": str(e)}
+                raise
+            finally:
+                finished = time.monotonic()
+                timings[stage.name] = {
+                    "start_ms": int((started - origin) * 1000),
+                    "duration_ms": int((finished - started) * 1000),
+                }
+                emit_job_event("provider", {
+                    "source": stage.name,
+                    "ok": bool(result) and not result.get("_error"),
+                    "duration_ms": timings[stage.name]["duration_ms"],
+                    # Fields the UI can show before the profile is resolved
+                    "preview": {
+                        name: value for name, value in resolve_planned_fields({stage.name: result}).items()
+                        if name in PREVIEW_FIELDS
+                    },
+                })
+
+        for stage in stages:
+            if stage.name not in resolved:
+                tasks[stage.name] = asyncio.create_task(run(stage))
+        return tasks
+
     async def _fetch_all_sources(
         self,
         email: str,
-        domain: str
+        domain: str,
+        budget: Optional[float] = None,
+        prefetched: Optional[Dict[str, Dict[str, Any]]] = None,
+        timings: Optional[Dict[str, Dict[str, int]]] = None,
+        fetch_plan: str = FETCH_PLAN_FULL,
+        known_fields: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch data from all sources in parallel.
+        Fetch data from all sources within the enrichment budget.
         Enhanced to include PDL company enrichment for deeper company insights.
 
+        Fetches run as a stage graph (see _build_stages): independent stages
+        start at once, dependent ones as soon as their inputs resolve.
+        Sources that miss the budget are marked `_pending` and keep running in
+        the background; their results are merged into finalize_data later
+        (see _backfill_late_sources).
+
         Args:
             email: Email address
             domain: Company domain
+            budget: Seconds to wait (defaults to ENRICHMENT_BUDGET_SECONDS,
+                capped by the request deadline)
+            prefetched: Source name -> data already fetched (skips those calls)
+            timings: Optional dict filled with per-stage timings (ms)
+            fetch_plan: "waterfall" fetches provider tiers (see _fetch_waterfall)
+            known_fields: User-supplied normalized fields (waterfall only)
 
         Returns:
             Dict mapping source name to response data
         """
-        # Phase 1: Fetch person data and news in parallel
-        person_tasks = [
-            self._fetch_with_fallback("apollo", email, domain),
-            self._fetch_with_fallback("pdl", email, domain),
-            self._fetch_with_fallback("hunter", email, domain),
-            self._fetch_with_fallback("gnews", email, domain),
-            self._fetch_with_fallback("zoominfo", email, domain),
-        ]
+        prefetched = prefetched or {}
+        timings = {} if timings is None else timings
+        if fetch_plan == FETCH_PLAN_WATERFALL:
+            return await self._fetch_waterfall(email, domain, budget, prefetched, timings, known_fields)
 
-        results = await asyncio.gather(*person_tasks, return_exceptions=True)
+        tasks = self._start_stages(self._build_stages(email, domain), prefetched, timings)
 
-        raw_data = {}
-        source_names = ["apollo", "pdl", "hunter", "gnews", "zoominfo"]
+        budget = remaining_budget(settings.ENRICHMENT_BUDGET_SECONDS if budget is None else budget)
+        done, _ = await asyncio.wait(tasks.values(), timeout=budget) if tasks else (set(), set())
 
-        for source_name, result in zip(source_names, results):
-            if isinstance(result, Exception):
-                logger.warning(f"{source_name} failed: {result}")
-                raw_data[source_name] = {"_error": str(result)}
+        raw_data = dict(prefetched)
+        late = {}
+        for source, task in tasks.items():
+            if task in done:
+                raw_data[source] = self._task_result(source, task)
             else:
-                raw_data[source_name] = result
+                raw_data[source] = {"_error": "Enrichment budget exceeded", "_pending": True}
+                late[source] = task
+
+        if late:
+            logger.warning(
+                f"Enrichment budget ({budget:.1f}s) exceeded for {email}, "
+                f"continuing in background: {list(late)}"
+            )
+            self._schedule_backfill(email, domain, raw_data, late)
+
+        logger.info(f"Stage timings for {email}: {timings}")
+        return raw_data
+
+    async def _fetch_waterfall(
+        self,
+        email: str,
+        domain: str,
+        budget: Optional[float],
+        prefetched: Dict[str, Dict[str, Any]],
+        timings: Dict[str, Dict[str, int]],
+        known_fields: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch provider tiers in waterfall order within the enrichment budget.
+
+        Before each tier (see waterfall_tiers), the fields filled so far by
+        earlier tiers and by the user are compared with WATERFALL_REQUIRED_FIELDS.
+        Only sources in the tier that can fill a missing field are called; the
+        rest are marked `_skipped: "waterfall"`. Sources in a tier still
+        running at the budget are backfilled like in the full plan.
+
+        Args:
+            email: Email address
+            domain: Company domain
+            budget: Seconds for all tiers together (see _fetch_all_sources)
+            prefetched: Source name -> data already fetched
+            timings: Filled with per-stage timings (ms)
+            known_fields: User-supplied normalized fields (count as filled)
+
+        Returns:
+            Dict mapping source name to response data (or skip/error markers)
+        """
+        known_fields = known_fields or {}
+        required = {field.strip() for field in settings.WATERFALL_REQUIRED_FIELDS.split(",") if field.strip()}
+        provides = self._source_fields()
+        budget = remaining_budget(settings.ENRICHMENT_BUDGET_SECONDS if budget is None else budget)
+        expires_at = time.monotonic() + budget
+
+        raw_data = dict(prefetched)
+        late: Dict[str, asyncio.Task] = {}
+        for tier in waterfall_tiers():
+            pending = [source for source in tier if source not in raw_data]
+            if not pending:
+                continue
+            missing = required - self._filled_fields(email, domain, raw_data, known_fields)
+            wanted = [source for source in pending if provides.get(source, set()) & missing]
+            for source in pending:
+                if source not in wanted:
+                    raw_data[source] = {"_error": "Not needed: required fields filled", "_skipped": "waterfall"}
+            if not wanted:
+                continue
+
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                for source in wanted:
+                    raw_data[source] = {"_error": "Enrichment budget exceeded", "_skipped": "budget"}
+                continue
+
+            company_name = known_fields.get("company_name") or self._resolve_field(
+                "company_name", FIELD_MAPPINGS["company_name"], raw_data
+            )
+            stages = [
+                stage for stage in self._build_stages(email, domain, company_name)
+                if stage.name in wanted
+            ]
+            tasks = self._start_stages(stages, raw_data, timings)
+            done, _ = await asyncio.wait(tasks.values(), timeout=remaining)
+            for source, task in tasks.items():
+                if task in done:
+                    raw_data[source] = self._task_result(source, task)
+                else:
+                    raw_data[source] = {"_error": "Enrichment budget exceeded", "_pending": True}
+                    late[source] = task
+
+        if late:
+            logger.warning(
+                f"Enrichment budget ({budget:.1f}s) exceeded for {email}, "
+                f"continuing in background: {list(late)}"
+            )
+            self._schedule_backfill(email, domain, raw_data, late)
+
+        logger.info(f"Waterfall for {email} called {list(timings)}, stage timings: {timings}")
+        return raw_data
+
+    def _source_fields(self) -> Dict[str, Set[str]]:
+        """Normalized fields each source can fill."""
+        provides: Dict[str, Set[str]] = {}
+        for field, sources in FIELD_MAPPINGS.items():
+            for source, _ in sources:
+                provides.setdefault(source, set()).add(field)
+        for source, fields in SOURCE_EXTRA_FIELDS.items():
+            provides.setdefault(source, set()).update(fields)
+        return provides
+
+    def _filled_fields(
+        self,
+        email: str,
+        domain: str,
+        raw_data: Dict[str, Dict[str, Any]],
+        known_fields: Dict[str, Any]
+    ) -> Set[str]:
+        """Normalized fields with a value from the sources fetched so far or the user."""
+        profile = self._resolve_profile(email, domain, raw_data)
+        filled = {field for field, value in profile.items() if value not in (None, "", [], {})}
+        return filled | {field for field, value in known_fields.items() if value}
+
+    async def _fetch_pdl_company(self, domain: str) -> Dict[str, Any]:
+        """
+        Fetch deep company data from PDL (cached per domain).
+
+        Args:
+            domain: Company domain
+
+        Returns:
+            Response data or error dict
+        """
+        pdl_api = self.apis.get("pdl")
+        if not pdl_api or not hasattr(pdl_api, "enrich_company"):
+            return {"_error": "PDL company enrichment unavailable"}
 
-        # Phase 2: Fetch deep company data from PDL
-        # This provides much richer company context
         try:
-            pdl_api = self.apis.get("pdl")
-            if pdl_api and hasattr(pdl_api, 'enrich_company'):
-                logger.info(f"Fetching deep company enrichment for {domain}")
-                company_data = await pdl_api.enrich_company(domain)
-                raw_data["pdl_company"] = company_data
-                if not company_data.get("_error"):
-                    self.data_sources.append("pdl_company")
+            logger.info(f"Fetching deep company enrichment for {domain}")
+            return await self._fetch_unless_not_found(
+                "pdl_company", normalize_domain(domain),
+                lambda: self._fetch_company_cached(
+                    "pdl_company", domain, lambda: pdl_api.enrich_company(domain)
+                )
+            )
+        except CircuitOpenError as e:
+            logger.info(f"Skipping pdl_company: {e}")
+            return {"_error": str(e), "_skipped": "circuit_open"}
         except Exception as e:
             logger.warning(f"PDL company enrichment failed: {e}")
-            raw_data["pdl_company"] = {"_error": str(e)}
+            return {"_error": str(e)}
 
-        return raw_data
+    def _task_result(self, source: str, task: asyncio.Task) -> Dict[str, Any]:
+        """Get a finished source task's data, turning failures into error dicts."""
+        if task.cancelled():
+            return {"_error": "Cancelled"}
+        if task.exception() is not None:
+            logger.warning(f"{source} failed: {task.exception()}")
+            return {"_error": str(task.exception())}
+        return task.result()
+
+    def _schedule_backfill(
+        self,
+        email: str,
+        domain: str,
+        raw_data: Dict[str, Dict[str, Any]],
+        late: Dict[str, asyncio.Task]
+    ) -> None:
+        """Start the background merge of sources that missed the budget."""
+        finalized = asyncio.Event()
+        _finalized_events.setdefault(email, set()).add(finalized)
+        task = asyncio.create_task(
+            self._backfill_late_sources(email, domain, dict(raw_data), late, finalized)
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def _backfill_late_sources(
+        self,
+        email: str,
+        domain: str,
+        raw_data: Dict[str, Dict[str, Any]],
+        late: Dict[str, asyncio.Task],
+        finalized: asyncio.Event
+    ) -> None:
+        """
+        Merge late source responses into the stored finalize_data record.
+
+        Waits for the late sources, stores their raw data, then waits until
+        the request has persisted its profile (mark_finalized) so the merge
+        never races the initial write. Only empty fields are filled in, so
+        user-provided and already-personalized values are kept.
+
+        Args:
+            email: Email address
+            domain: Company domain
+            raw_data: Raw data collected within the budget
+            late: Source name -> still-running fetch task
+            finalized: This run's event, set by mark_finalized
+        """
+        try:
+            done, _ = await asyncio.wait(late.values(), timeout=LATE_RESULT_TIMEOUT)
+            arrived = []
+            for source, task in late.items():
+                if task not in done:
+                    task.cancel()
+                    continue
+                data = self._task_result(source, task)
+                raw_data[source] = data
+                if data and not data.get("_error"):
+                    self.supabase.store_raw_data(email, source, data)
+                    arrived.append(source)
+
+            if not arrived:
+                return
+
+            try:
+                await asyncio.wait_for(finalized.wait(), timeout=FINALIZE_WAIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.info(f"No finalized profile for {email}, late sources stored as raw data only")
+                return
+
+            record = self.supabase.get_finalize_data(email)
+            if not record:
+                return
+
+            profile = dict(record.get("normalized_data") or {})
+            for field, value in self._resolve_profile(email, domain, raw_data).items():
+                if value and not profile.get(field):
+                    profile[field] = value
+
+            data_sources = list(record.get("data_sources") or profile.get("data_sources") or [])
+            data_sources += [s for s in arrived if s not in data_sources]
+            profile["data_sources"] = data_sources
+            profile["pending_sources"] = [s for s in profile.get("pending_sources", []) if s not in arrived]
+            profile["backfilled_sources"] = arrived
+            profile["data_quality_score"] = self._calculate_quality_score(raw_data)
+
+            self.supabase.upsert_finalize_data(
+                email=email,
+                normalized_data=profile,
+                intro=record.get("personalization_intro"),
+                cta=record.get("personalization_cta"),
+                data_sources=data_sources
+            )
+            logger.info(f"Backfilled late sources for {email}: {arrived}")
+
+        except Exception as e:
+            logger.error(f"Backfill failed for {email}: {e}")
+        finally:
+            pending = _finalized_events.get(email, set())
+            pending.discard(finalized)
+            if not pending:
+                _finalized_events.pop(email, None)
+
+    def mark_finalized(self, email: str) -> None:
+        """
+        Signal that finalize_data for this email has been written,
+        releasing any pending backfill of late sources.
+
+        Args:
+            email: Email address
+        """
+        for event in _finalized_events.get(email.strip().lower(), ()):
+            event.set()
 
     async def _fetch_with_fallback(
         self,
         source: str,
         email: str,
-        domain: str
+        domain: str,
+        **kwargs
     ) -> Dict[str, Any]:
         """
         Fetch from a single source with error handling.
@@ -175,6 +877,7 @@ class RADOrchestrator:
             source: Source name
             email: Email address
             domain: Company domain
+            **kwargs: Extra inputs for the source (e.g. company_name for gnews)
 
         Returns:
             Response data or error dict
@@ -183,8 +886,25 @@ class RADOrchestrator:
         if not api:
             return {"_error": f"Unknown source: {source}"}
 
+        key = normalize_domain(domain) if source in COMPANY_CACHE_TTLS else email
+        # News depends on the company searched for, not only the domain
+        company = canonical_company_name(kwargs.get("company_name") or "") or None
+        if company:
+            key = f"{key}|{company}"
         try:
-            return await api.enrich(email, domain)
+            if self.company_cache.is_cacheable(source):
+                return await self._fetch_unless_not_found(
+                    source, key,
+                    lambda: self._fetch_company_cached(
+                        source, domain, lambda: api.enrich(email, domain, **kwargs), company
+                    )
+                )
+            return await self._fetch_unless_not_found(
+                source, key, lambda: api.enrich(email, domain, **kwargs)
+            )
+        except CircuitOpenError as e:
+            logger.info(f"Skipping {source}: {e}")
+            return {"_error": str(e), "_skipped": "circuit_open"}
         except EnrichmentAPIError as e:
             logger.warning(f"{source} API error: {e}")
             return {"_error": str(e)}
@@ -192,6 +912,67 @@ class RADOrchestrator:
             logger.error(f"{source} unexpected error: {e}")
             return {"_error": str(e)}
 
+    async def _fetch_unless_not_found(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Skip a provider call it recently had no match for; remember new misses.
+
+        Args:
+            source: Source name
+            key: Normalized email (person sources) or domain (company-level sources)
+            fetch: Zero-arg coroutine factory that calls the provider
+
+        Returns:
+            Response data, or a `_not_found` error dict
+        """
+        if self.negative_cache.contains(source, key):
+            return cached_not_found(source, key)
+
+        data = await fetch()
+        if is_not_found(data):
+            self.negative_cache.add(source, key)
+        return data
+
+    async def _fetch_company_cached(
+        self,
+        source: str,
+        domain: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        company: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Serve a company-level source from the domain cache, fetching on miss.
+
+        Args:
+            source: Source name (pdl_company, zoominfo, gnews)
+            domain: Company domain (cache key)
+            fetch: Zero-arg coroutine factory that calls the provider
+            company: Canonical company name the response must be for (gnews);
+                cached data for another name is a miss
+
+        Concurrent misses for the same domain/source/company share one provider call.
+
+        Returns:
+            Cached or freshly fetched response data
+        """
+        cached = self.company_cache.get(domain, source)
+        if cached is not None and (
+            company is None or canonical_company_name(cached.get("company_name") or "") == company
+        ):
+            return cached
+
+        async def fetch_and_cache() -> Dict[str, Any]:
+            data = await fetch()
+            self.company_cache.set(domain, source, data)
+            return data
+
+        data = await company_flights.do((source, normalize_domain(domain), company), fetch_and_cache)
+        return dict(data)
+
     def _resolve_profile(
         self,
         email: str,
@@ -215,16 +996,8 @@ class RADOrchestrator:
         Returns:
             Normalized profile dict
         """
-        normalized = {}
-
-        # Define field mappings from each source
-        field_mappings = self._get_field_mappings()
-
-        # Process each field
-        for field, sources in field_mappings.items():
-            value = self._resolve_field(field, sources, raw_data)
-            if value is not None:
-                normalized[field] = value
+        # Mapped fields, via the plan compiled at import (no per-call sorting)
+        normalized = resolve_planned_fields(raw_data)
 
         # Email verification from Hunter
         hunter_data = raw_data.get("hunter", {})
@@ -260,112 +1033,22 @@ class RADOrchestrator:
 
         return normalized
 
-    def _get_field_mappings(self) -> Dict[str, List[Tuple[str, str]]]:
+    def resolve_batch(
+        self,
+        profiles: List[Tuple[str, str, Dict[str, Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
         """
-        Define field mappings from source fields to normalized fields.
-        Enhanced to include PDL company data for richer company insights.
+        Resolve many profiles' stored raw data (e.g. offline re-resolution of
+        raw_data rows after a mapping change). No API calls or storage.
+
+        Args:
+            profiles: (email, domain, raw_data) per profile
 
         Returns:
-            Dict mapping normalized field to list of (source, source_field) tuples
+            Normalized profiles, in input order
         """
-        return {
-            "first_name": [
-                ("apollo", "first_name"),
-                ("pdl", "first_name"),
-            ],
-            "last_name": [
-                ("apollo", "last_name"),
-                ("pdl", "last_name"),
-            ],
-            "full_name": [
-                ("pdl", "full_name"),
-            ],
-            "title": [
-                ("apollo", "title"),
-                ("pdl", "job_title"),
-            ],
-            "company_name": [
-                ("pdl_company", "name"),
-                ("apollo", "company_name"),
-                ("zoominfo", "company_name"),
-                ("pdl", "job_company_name"),
-            ],
-            "company_display_name": [
-                ("pdl_company", "display_name"),
-            ],
-            "industry": [
-                ("pdl_company", "industry"),
-                ("apollo", "industry"),
-                ("zoominfo", "industry"),
-                ("pdl", "job_company_industry"),
-            ],
-            "company_size": [
-                ("pdl_company", "size"),
-                ("apollo", "company_size"),
-                ("pdl", "job_company_size"),
-            ],
-            "employee_count": [
-                ("pdl_company", "employee_count"),
-                ("zoominfo", "employee_count"),
-            ],
-            "employee_count_range": [
-                ("pdl_company", "employee_count_range"),
-            ],
-            "linkedin_url": [
-                ("apollo", "linkedin_url"),
-                ("pdl", "linkedin_url"),
-            ],
-            "city": [
-                ("pdl_company", "locality"),
-                ("apollo", "city"),
-                ("zoominfo", "city"),
-                ("pdl", "location_locality"),
-            ],
-            "state": [
-                ("pdl_company", "region"),
-                ("apollo", "state"),
-                ("zoominfo", "state"),
-                ("pdl", "location_region"),
-            ],
-            "country": [
-                ("pdl_company", "country"),
-                ("apollo", "country"),
-                ("zoominfo", "country"),
-                ("pdl", "location_country"),
-            ],
-            "seniority": [
-                ("apollo", "seniority"),
-            ],
-            "skills": [
-                ("pdl", "skills"),
-            ],
-            "interests": [
-                ("pdl", "interests"),
-            ],
-            "experience": [
-                ("pdl", "experience"),
-            ],
-            "company_description": [
-                ("pdl_company", "summary"),
-                ("zoominfo", "description"),
-            ],
-            "founded_year": [
-                ("pdl_company", "founded"),
-                ("zoominfo", "founded_year"),
-            ],
-            "company_type": [
-                ("pdl_company", "type"),
-            ],
-            "ticker": [
-                ("pdl_company", "ticker"),
-            ],
-            "naics_codes": [
-                ("pdl_company", "naics"),
-            ],
-            "sic_codes": [
-                ("pdl_company", "sic"),
-            ],
-        }
+        resolve = self._resolve_profile
+        return [resolve(email, domain, raw_data) for email, domain, raw_data in profiles]
 
     def _resolve_field(
         self,
@@ -386,22 +1069,8 @@ class RADOrchestrator:
         Returns:
             Resolved field value or None
         """
-        candidates = []
-
-        for source_name, source_field in sources:
-            source_data = raw_data.get(source_name, {})
-            if source_data and not source_data.get("_error"):
-                value = source_data.get(source_field)
-                if value is not None and value != "":
-                    priority = SOURCE_PRIORITY.get(source_name, 0)
-                    candidates.append((priority, value))
-
-        if not candidates:
-            return None
-
-        # Sort by priority (descending) and return highest priority value
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        return candidates[0][1]
+        plan = compile_resolution_plan({field: sources})
+        return resolve_planned_fields(raw_data, plan).get(field)
 
     def _calculate_quality_score(self, raw_data: Dict[str, Dict[str, Any]]) -> float:
         """
@@ -413,8 +1082,12 @@ class RADOrchestrator:
         Returns:
             Quality score between 0.0 and 1.0
         """
-        # Total sources now includes pdl_company
-        total_sources = len(self.apis) + 1  # +1 for pdl_company
+        # Total sources now includes pdl_company; waterfall and personal-domain
+        # skips don't count against coverage (nothing was missing / nothing to find)
+        unscored = sum(
+            1 for data in raw_data.values() if data and data.get("_skipped") in UNSCORED_SKIPS
+        )
+        total_sources = max(1, len(self.apis) + 1 - unscored)  # +1 for pdl_company
         successful_sources = sum(
             1 for data in raw_data.values()
             if data and not data.get("_error") and not data.get("_mock")
@@ -447,28 +1120,101 @@ class RADOrchestrator:
     async def enrich_batch(
         self,
         emails: List[str],
-        concurrency: int = 5
+        concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Enrich multiple emails with controlled concurrency.
+        Enrich multiple emails concurrently.
+
+        Person-level sources with bulk endpoints (Apollo, PDL) are fetched in
+        vendor-sized chunks up front and fanned back out per email. Provider
+        calls are paced by per-provider adaptive rate limiters, so each vendor
+        runs at the highest rate it allows; no global cap is needed unless
+        `concurrency` is given.
 
         Args:
             emails: List of email addresses
-            concurrency: Max concurrent enrichments
+            concurrency: Optional cap on concurrent enrichments
 
         Returns:
             List of enrichment results
         """
-        semaphore = asyncio.Semaphore(concurrency)
+        emails = [email.strip().lower() for email in emails]
+        # Disposable addresses are rejected per email by enrich(); keep them out of bulk calls
+        prefetched = await self._prefetch_bulk([
+            email for email in dict.fromkeys(emails)
+            if not (settings.REJECT_DISPOSABLE_EMAILS and self.domain_classifier.classify(email).is_disposable)
+        ])
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
 
-        async def enrich_with_semaphore(email: str) -> Dict[str, Any]:
-            async with semaphore:
-                try:
-                    return await self.enrich(email)
-                except Exception as e:
-                    logger.error(f"Batch enrichment failed for {email}: {e}")
-                    return {"email": email, "_error": str(e)}
+        async def enrich_one(email: str) -> Dict[str, Any]:
+            email_prefetched = {
+                source: results[email]
+                for source, results in prefetched.items() if email in results
+            }
+            try:
+                if semaphore is None:
+                    return await self.enrich(email, prefetched=email_prefetched)
+                async with semaphore:
+                    return await self.enrich(email, prefetched=email_prefetched)
+            except Exception as e:
+                logger.error(f"Batch enrichment failed for {email}: {e}")
+                return {"email": email, "_error": str(e)}
 
-        return await asyncio.gather(*[
-            enrich_with_semaphore(email) for email in emails
-        ])
+        return await asyncio.gather(*[enrich_one(email) for email in emails])
+
+    async def _prefetch_bulk(self, emails: List[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Fetch person data for many emails through vendor bulk endpoints.
+
+        Args:
+            emails: Unique email addresses
+
+        Returns:
+            Source name -> {email: data}. Emails missing from a source's
+            results (failed chunks) are fetched individually later.
+        """
+        bulk_apis = {
+            source: api for source, api in self.apis.items()
+            if hasattr(api, "enrich_many")
+        }
+        if len(emails) < 2 or not bulk_apis:
+            return {}
+
+        # Emails a provider recently had no match for are left out of its bulk call
+        known_missing = {
+            source: {email for email in emails if self.negative_cache.contains(source, email.strip().lower())}
+            for source in bulk_apis
+        }
+        results = await asyncio.gather(
+            *[
+                api.enrich_many([email for email in emails if email not in known_missing[source]])
+                for source, api in bulk_apis.items()
+            ],
+            return_exceptions=True
+        )
+
+        prefetched = {}
+        for source, result in zip(bulk_apis, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{source} bulk enrichment failed: {result}")
+                continue
+            for email, data in result.items():
+                if is_not_found(data):
+                    self.negative_cache.add(source, email.strip().lower())
+            for email in known_missing[source]:
+                result[email] = cached_not_found(source, email.strip().lower())
+            prefetched[source] = result
+            logger.info(f"{source} bulk enrichment: {len(result)}/{len(emails)} emails")
+        return prefetched
+
+
+# Global instance (lazy-loaded; shared by all requests and batch workers)
+_rad_orchestrator: Optional[RADOrchestrator] = None
+
+
+def get_rad_orchestrator() -> RADOrchestrator:
+    """Get or create the shared orchestrator (backed by the global Supabase client)."""
+    global _rad_orchestrator
+    if _rad_orchestrator is None:
+        _rad_orchestrator = RADOrchestrator(get_supabase_client())
+    return _rad_orchestrator
@@ -0,0 +1,231 @@
+"""
+Adaptive per-provider rate limiting for enrichment APIs.
+Each provider gets a token bucket (requests/second) plus an AIMD concurrency
+window: the window is halved on 429 responses and grows back by one slot per
+window's worth of successes. Retry-After pauses all requests to that provider.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-provider defaults: (requests per second, max concurrency)
+# Override with e.g. APOLLO_RATE_LIMIT_RPS=10 / APOLLO_MAX_CONCURRENCY=20
+PROVIDER_RATE_LIMITS = {
+    "apollo": (5.0, 10),
+    "pdl": (10.0, 10),
+    "hunter": (10.0, 5),
+    "gnews": (5.0, 10),    # One search per company refresh (see app.services.news_index)
+    "zoominfo": (5.0, 5),
+}
+
+# Fallback pause when a 429 has no usable Retry-After (seconds)
+DEFAULT_RETRY_AFTER = 1.0
+
+# Never honor a Retry-After longer than this (seconds)
+MAX_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if missing/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket + AIMD concurrency limiter for one provider.
+    Not thread-safe; meant to be shared by coroutines of the app's event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        max_concurrency: int,
+        burst: Optional[float] = None,
+        min_concurrency: int = 1
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Provider name (for logs/metrics)
+            rate: Sustained requests per second
+            max_concurrency: Upper bound for the concurrency window
+            burst: Bucket size (defaults to one second of requests)
+            min_concurrency: Lower bound for the concurrency window
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency = float(max_concurrency)  # Current AIMD window
+
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self.stats_counters = {"requests": 0, "throttled": 0, "waited_seconds": 0.0}
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait for a token and a free concurrency slot."""
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+            elif self._in_flight >= int(self.concurrency):
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+                try:
+                    await waiter
+                finally:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+            elif self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+            else:
+                self._tokens -= 1
+                self._in_flight += 1
+                self.stats_counters["requests"] += 1
+                self.stats_counters["waited_seconds"] += now - started
+                return
+
+    def release(self) -> None:
+        """Free a concurrency slot and wake the next waiter."""
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake_waiters(int(self.concurrency) - self._in_flight)
+
+    def _wake_waiters(self, count: int) -> None:
+        """Wake up to `count` queued acquirers."""
+        while count > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            waiter.set_result(None)
+            count -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a rate-limited slot for the duration of one request."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def on_success(self) -> None:
+        """Additive increase: grow the window by ~1 slot per full window of successes."""
+        if self.concurrency < self.max_concurrency:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self._wake_waiters(int(self.concurrency) - self._in_flight)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicative decrease after a 429, and pause until Retry-After.
+
+        Args:
+            retry_after: Seconds the provider asked us to wait
+        """
+        self.stats_counters["throttled"] += 1
+        self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+        pause = min(MAX_RETRY_AFTER, retry_after if retry_after is not None else DEFAULT_RETRY_AFTER)
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        self._tokens = 0.0
+        logger.warning(
+            f"{self.name} throttled us: concurrency -> {int(self.concurrency)}, "
+            f"pausing {pause:.1f}s"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get current window and counters."""
+        return {
+            **self.stats_counters,
+            "waited_seconds": round(self.stats_counters["waited_seconds"], 3),
+            "rate": self.rate,
+            "concurrency": int(self.concurrency),
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+        }
+
+
+# Global registry (one limiter per provider, lazy-loaded)
+_rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter(source: str) -> Optional[AdaptiveRateLimiter]:
+    """
+    Get or create the limiter for a provider.
+
+    Args:
+        source: Provider name
+
+    Returns:
+        Shared AdaptiveRateLimiter, or None if rate limiting is disabled
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+    limiter = _rate_limiters.get(source)
+    if limiter is None:
+        default_rps, default_concurrency = PROVIDER_RATE_LIMITS.get(
+            source, (settings.RATE_LIMIT_DEFAULT_RPS, settings.RATE_LIMIT_DEFAULT_CONCURRENCY)
+        )
+        limiter = AdaptiveRateLimiter(
+            name=source,
+            rate=float(os.getenv(f"{source.upper()}_RATE_LIMIT_RPS", default_rps)),
+            max_concurrency=int(os.getenv(f"{source.upper()}_MAX_CONCURRENCY", default_concurrency))
+        )
+        _rate_limiters[source] = limiter
+    return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for all providers that have made requests."""
+    return {source: limiter.stats() for source, limiter in _rate_limiters.items()}
+
+
+def reset_rate_limiters() -> None:
+    """Discard all limiters (tests)."""
+    _rate_limiters.clear()
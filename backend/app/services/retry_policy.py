@@ -0,0 +1,180 @@
+"""
+Retries for enrichment provider calls.
+A RetryPolicy says which failures are worth retrying (transient 5xx, short
+429s, connection errors) and spaces attempts with exponential backoff and
+full jitter. Retries are bounded three ways: attempts per call, the time left
+on the request deadline, and a per-provider retry budget that only allows
+retries up to a share of recent traffic, so a vendor incident can't turn
+into a retry storm.
+"""
+
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, FrozenSet, Optional, Tuple, Type
+
+import httpx
+
+from app.config import settings
+from app.services.deadline import current_deadline
+
+logger = logging.getLogger(__name__)
+
+# Attempts are not retried unless at least this much of the deadline would be
+# left after the backoff (seconds)
+MIN_ATTEMPT_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Which failures to retry and how long to wait between attempts.
+    Unset limits use the RETRY_* settings at call time.
+    """
+    max_attempts: Optional[int] = None
+    base_delay: Optional[float] = None
+    max_delay: Optional[float] = None
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    # Read timeouts are left to the circuit breaker: they already cost a full timeout
+    retry_exceptions: Tuple[Type[BaseException], ...] = (
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+        httpx.ReadError,
+        httpx.WriteError,
+        httpx.RemoteProtocolError,
+        httpx.PoolTimeout,
+    )
+
+    @property
+    def attempts(self) -> int:
+        """Maximum attempts per call (including the first)."""
+        return self.max_attempts or settings.RETRY_MAX_ATTEMPTS
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Delay before the next attempt (full jitter).
+
+        Args:
+            attempt: Attempts made so far (1 after the first failure)
+            retry_after: Provider's Retry-After, if any
+
+        Returns:
+            Seconds to wait, or None if Retry-After is longer than max_delay
+        """
+        base_delay = settings.RETRY_BASE_DELAY if self.base_delay is None else self.base_delay
+        max_delay = settings.RETRY_MAX_DELAY if self.max_delay is None else self.max_delay
+        if retry_after is not None and retry_after > max_delay:
+            return None
+        delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+        return max(delay, retry_after or 0.0)
+
+
+class RetryBudget:
+    """
+    Per-provider cap on retries: within a sliding window, retries may not
+    exceed `ratio` of first attempts plus a small floor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ratio: Optional[float] = None,
+        min_per_second: Optional[float] = None,
+        window_seconds: float = 10.0
+    ):
+        """
+        Initialize budget.
+
+        Args:
+            name: Provider name (for logs/metrics)
+            ratio: Retries allowed per first attempt
+            min_per_second: Retries always allowed regardless of traffic
+            window_seconds: Length of the sliding window
+        """
+        self.name = name
+        self.ratio = settings.RETRY_BUDGET_RATIO if ratio is None else ratio
+        self.min_per_second = settings.RETRY_BUDGET_MIN_PER_SECOND if min_per_second is None else min_per_second
+        self.window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.stats_counters = {
+            "requests": 0,
+            "retries": 0,
+            "recovered": 0,       # Calls that succeeded after retrying
+            "exhausted": 0,       # Calls that failed after max attempts
+            "budget_denied": 0,   # Retries refused by this budget
+            "deadline_denied": 0,  # Retries refused for lack of time
+        }
+
+    def _prune(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and now - timestamps[0] > self.window_seconds:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        """Count a first attempt."""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+        self.stats_counters["requests"] += 1
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if the retry may proceed
+        """
+        now = time.monotonic()
+        self._prune(now)
+        allowed = self.min_per_second * self.window_seconds + self.ratio * len(self._requests)
+        if len(self._retries) >= allowed:
+            self.stats_counters["budget_denied"] += 1
+            return False
+        self._retries.append(now)
+        self.stats_counters["retries"] += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters and current window usage."""
+        return {
+            **self.stats_counters,
+            "window_requests": len(self._requests),
+            "window_retries": len(self._retries),
+        }
+
+
+def deadline_allows(delay: float) -> bool:
+    """Whether the request deadline leaves room to wait `delay` and try again."""
+    deadline = current_deadline()
+    return deadline is None or deadline.remaining() >= delay + MIN_ATTEMPT_SECONDS
+
+
+# Global registry (one budget per provider, lazy-loaded)
+_retry_budgets: Dict[str, RetryBudget] = {}
+
+
+def get_retry_budget(source: str) -> Optional[RetryBudget]:
+    """
+    Get or create the retry budget for a provider.
+
+    Args:
+        source: Provider name
+
+    Returns:
+        Shared RetryBudget, or None if retries are disabled
+    """
+    if not settings.RETRY_ENABLED:
+        return None
+    budget = _retry_budgets.get(source)
+    if budget is None:
+        budget = RetryBudget(source)
+        _retry_budgets[source] = budget
+    return budget
+
+
+def get_retry_stats() -> Dict[str, Dict[str, Any]]:
+    """Get retry counters for all providers that have made requests."""
+    return {source: budget.stats() for source, budget in _retry_budgets.items()}
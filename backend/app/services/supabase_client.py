@@ -4,12 +4,13 @@ Abstracts database operations for:
   - raw_data, staging_normalized, finalize_data (enrichment pipeline)
   - personalization_jobs, personalization_outputs (job tracking)
   - pdf_deliveries (PDF generation tracking)
+  - enrichment_cache (company-level enrichment cache)
 """
 
 import json
 import os
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import logging
 
@@ -47,6 +48,7 @@ class SupabaseClient:
             self._mock_jobs: List[Dict[str, Any]] = []
             self._mock_outputs: List[Dict[str, Any]] = []
             self._mock_pdfs: List[Dict[str, Any]] = []
+            self._mock_enrichment_cache: Dict[str, Dict[str, Any]] = {}
             self.client = None
         else:
             from supabase import create_client, Client
@@ -330,7 +332,8 @@ class SupabaseClient:
         buyer_stage: Optional[str] = None,
         company_name: Optional[str] = None,
         industry: Optional[str] = None,
-        company_size: Optional[str] = None
+        company_size: Optional[str] = None,
+        request_payload: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Create a new personalization job.
@@ -344,13 +347,12 @@ class SupabaseClient:
             company_name: Company name
             industry: Industry sector
             company_size: Company size range
+            request_payload: Original request (lets any worker run the job)
 
         Returns:
             Created job record with id
         """
-        job_id = str(uuid.uuid4())
         data = {
-            "id": job_id,
             "email": email,
             "domain": domain,
             "cta": cta,
@@ -360,12 +362,15 @@ class SupabaseClient:
             "industry": industry,
             "company_size": company_size,
             "status": "pending",
+            "request_payload": request_payload,
             "created_at": datetime.utcnow().isoformat()
         }
 
         if self.mock_mode:
+            # The table assigns ids (identity column); mock mode makes its own
+            data["id"] = str(uuid.uuid4())
             self._mock_jobs.append(data)
-            logger.info(f"[MOCK] Created job {job_id} for {email}")
+            logger.info(f"[MOCK] Created job {data['id']} for {email}")
             return data
 
         try:
@@ -380,7 +385,10 @@ class SupabaseClient:
         self,
         job_id: str,
         status: str,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        stage: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
+        started: bool = False
     ) -> Dict[str, Any]:
         """
         Update job status.
@@ -389,15 +397,23 @@ class SupabaseClient:
             job_id: Job ID
             status: New status (pending, processing, completed, failed)
             error_message: Error message if failed
+            stage: Pipeline stage now running (e.g. enriching, generating)
+            result: Job result summary (on completion)
+            started: Set started_at (only on the queued -> processing transition;
+                later stage updates keep the original start time)
 
         Returns:
             Updated job record
         """
         data = {"status": status}
+        if stage:
+            data["stage"] = stage
+        if result is not None:
+            data["result"] = result
 
-        if status == "processing":
+        if started:
             data["started_at"] = datetime.utcnow().isoformat()
-        elif status in ("completed", "failed"):
+        if status in ("completed", "failed"):
             data["completed_at"] = datetime.utcnow().isoformat()
 
         if error_message:
@@ -465,6 +481,167 @@ class SupabaseClient:
             logger.error(f"Error fetching pending jobs: {e}")
             return []
 
+    def claim_jobs(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically lease up to `limit` claimable jobs to one worker.
+        Claimable: pending, or processing with an expired lease (worker died).
+        Concurrent claimers never receive the same job (FOR UPDATE SKIP LOCKED).
+
+        Args:
+            worker_id: Claiming worker
+            limit: Maximum number of jobs to claim
+            lease_seconds: Lease length (defaults to JOB_LEASE_SECONDS)
+            max_attempts: Claims per job before it is failed (defaults to JOB_MAX_ATTEMPTS)
+
+        Returns:
+            Claimed job records (status processing, lease_owner = worker_id)
+        """
+        lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+        max_attempts = max_attempts or settings.JOB_MAX_ATTEMPTS
+
+        if self.mock_mode:
+            now = datetime.utcnow()
+            claimed = []
+            for job in sorted(self._mock_jobs, key=lambda j: j["created_at"]):
+                expired = job.get("status") == "processing" and self._mock_lease_expired(job, now)
+                if expired and job.get("attempts", 0) >= max_attempts:
+                    job.update({
+                        "status": "failed",
+                        "error_message": f"Lease expired after {job['attempts']} attempts",
+                        "completed_at": now.isoformat(),
+                        "lease_owner": None,
+                        "lease_expires_at": None,
+                    })
+                    continue
+                if len(claimed) < limit and (job.get("status") == "pending" or expired):
+                    job.update({
+                        "status": "processing",
+                        "lease_owner": worker_id,
+                        "lease_expires_at": (now + timedelta(seconds=lease_seconds)).isoformat(),
+                        "attempts": job.get("attempts", 0) + 1,
+                        "started_at": job.get("started_at") or now.isoformat(),
+                    })
+                    claimed.append(dict(job))
+            return claimed
+
+        try:
+            result = self.client.rpc("claim_personalization_jobs", {
+                "p_worker": worker_id,
+                "p_limit": limit,
+                "p_lease_seconds": lease_seconds,
+                "p_max_attempts": max_attempts,
+            }).execute()
+            return result.data or []
+        except Exception as e:
+            logger.error(f"Error claiming jobs for {worker_id}: {e}")
+            return []
+
+    def heartbeat_job(
+        self,
+        job_id: str,
+        worker_id: str,
+        lease_seconds: Optional[int] = None,
+        stage: Optional[str] = None
+    ) -> bool:
+        """
+        Extend a job lease, optionally recording the stage now running.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker that claimed the job
+            lease_seconds: New lease length from now (defaults to JOB_LEASE_SECONDS)
+            stage: Pipeline stage now running (only written while the lease is held)
+
+        Returns:
+            False if the worker no longer holds the lease (expired and reclaimed, or finished)
+        """
+        lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+
+        if self.mock_mode:
+            job = self.get_job(job_id)
+            if not job or job.get("lease_owner") != worker_id or job.get("status") != "processing":
+                return False
+            job["lease_expires_at"] = (datetime.utcnow() + timedelta(seconds=lease_seconds)).isoformat()
+            if stage:
+                job["stage"] = stage
+            return True
+
+        try:
+            result = self.client.rpc("heartbeat_personalization_job", {
+                "p_job_id": int(job_id),
+                "p_worker": worker_id,
+                "p_lease_seconds": lease_seconds,
+                "p_stage": stage,
+            }).execute()
+            return bool(result.data)
+        except Exception as e:
+            # Keep working: a missed heartbeat only matters once the lease runs out
+            logger.warning(f"Heartbeat failed for job {job_id}: {e}")
+            return True
+
+    def finish_job(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Record a leased job's outcome and release the lease.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker that claimed the job
+            status: completed or failed
+            error_message: Error message if failed
+            result: Job result summary
+
+        Returns:
+            False if the worker lost the lease (the outcome was not recorded)
+        """
+        if self.mock_mode:
+            job = self.get_job(job_id)
+            if not job or job.get("lease_owner") != worker_id or job.get("status") != "processing":
+                return False
+            job.update({
+                "status": status,
+                "error_message": error_message,
+                "completed_at": datetime.utcnow().isoformat(),
+                "lease_owner": None,
+                "lease_expires_at": None,
+            })
+            if status == "completed":
+                job["stage"] = "done"
+            if result is not None:
+                job["result"] = result
+            return True
+
+        try:
+            response = self.client.rpc("finish_personalization_job", {
+                "p_job_id": int(job_id),
+                "p_worker": worker_id,
+                "p_status": status,
+                "p_error_message": error_message,
+                "p_result": result,
+            }).execute()
+            return bool(response.data)
+        except Exception as e:
+            logger.error(f"Error finishing job {job_id}: {e}")
+            raise
+
+    @staticmethod
+    def _mock_lease_expired(job: Dict[str, Any], now: datetime) -> bool:
+        # Like the SQL, a job without a lease (run locally) is never reclaimed
+        expires_at = job.get("lease_expires_at")
+        return bool(expires_at) and datetime.fromisoformat(expires_at) < now
+
     # ========================================================================
     # PERSONALIZATION_OUTPUTS TABLE (LLM outputs)
     # ========================================================================
@@ -638,6 +815,128 @@ class SupabaseClient:
             logger.error(f"Error updating PDF delivery {delivery_id}: {e}")
             raise
 
+    # ========================================================================
+    # ENRICHMENT_CACHE TABLE (Company-level enrichment cache)
+    # ========================================================================
+
+    def get_enrichment_cache(self, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the unexpired cache row for a domain.
+
+        Args:
+            domain: Company domain
+
+        Returns:
+            enrichment_cache record, or None if missing/expired
+        """
+        now = datetime.utcnow().isoformat()
+
+        if self.mock_mode:
+            record = self._mock_enrichment_cache.get(domain)
+            if record and record["expires_at"] > now:
+                return record
+            return None
+
+        try:
+            result = self.client.table("enrichment_cache").select("*").eq(
+                "domain", domain
+            ).gt("expires_at", now).limit(1).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching enrichment_cache for {domain}: {e}")
+            return None
+
+    def upsert_enrichment_cache(
+        self,
+        domain: str,
+        enriched_data: Dict[str, Any],
+        expires_at: str,
+        confidence_score: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Insert or replace the cache row for a domain.
+
+        Args:
+            domain: Company domain
+            enriched_data: Cached responses keyed by source
+            expires_at: ISO timestamp when the row expires
+            confidence_score: Optional confidence for the cached data
+
+        Returns:
+            Upserted record
+        """
+        data = {
+            "domain": domain,
+            "enriched_data": enriched_data,
+            "confidence_score": confidence_score,
+            "cached_at": datetime.utcnow().isoformat(),
+            "expires_at": expires_at,
+        }
+
+        if self.mock_mode:
+            existing = self._mock_enrichment_cache.get(domain, {})
+            data["cache_hits"] = existing.get("cache_hits", 0)
+            self._mock_enrichment_cache[domain] = data
+            logger.info(f"[MOCK] Upserted enrichment_cache for {domain}")
+            return data
+
+        try:
+            result = self.client.table("enrichment_cache").upsert(
+                data,
+                on_conflict="domain"
+            ).execute()
+            logger.info(f"Upserted enrichment_cache for {domain}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error upserting enrichment_cache for {domain}: {e}")
+            raise
+
+    def record_enrichment_cache_hits(self, domain: str, hits: int) -> None:
+        """
+        Add hits to a cache row's counter and touch last_accessed_at.
+        The increment runs in SQL (record_enrichment_cache_hits() in migration
+        20261016000004), so concurrent flushes from other workers add up.
+
+        Args:
+            domain: Company domain
+            hits: Number of hits to add
+        """
+        if self.mock_mode:
+            record = self._mock_enrichment_cache.get(domain)
+            if record:
+                record["cache_hits"] = record.get("cache_hits", 0) + hits
+                record["last_accessed_at"] = datetime.utcnow().isoformat()
+            return
+
+        try:
+            self.client.rpc("record_enrichment_cache_hits", {
+                "p_domain": domain,
+                "p_hits": hits,
+            }).execute()
+        except Exception as e:
+            logger.error(f"Error recording cache hits for {domain}: {e}")
+
+    def clean_expired_enrichment_cache(self) -> int:
+        """
+        Delete expired cache rows (clean_expired_enrichment_cache() in migration 002).
+
+        Returns:
+            Number of rows deleted
+        """
+        if self.mock_mode:
+            now = datetime.utcnow().isoformat()
+            expired = [d for d, r in self._mock_enrichment_cache.items() if r["expires_at"] <= now]
+            for domain in expired:
+                del self._mock_enrichment_cache[domain]
+            return len(expired)
+
+        try:
+            result = self.client.rpc("clean_expired_enrichment_cache").execute()
+            return result.data or 0
+        except Exception as e:
+            logger.error(f"Error cleaning expired enrichment_cache: {e}")
+            return 0
+
     # ========================================================================
     # HEALTH CHECK
     # ========================================================================
@@ -0,0 +1,203 @@
+"""
+Access tokens for token-auth enrichment providers (e.g. ZoomInfo).
+Each provider has one shared TokenManager that exchanges credentials for an
+access token, caches it, and refreshes it in the background a margin before it
+expires, so enrichment calls only wait for auth at cold start (or after the
+token is rejected). Concurrent refreshes share a single auth request.
+"""
+
+import asyncio
+import base64
+import contextvars
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# fetch_token() -> (access token, lifetime in seconds)
+TokenFetcher = Callable[[], Awaitable[Tuple[str, float]]]
+
+# Never refresh more often than this, however short-lived the token
+MIN_REFRESH_DELAY_SECONDS = 5.0
+
+
+def jwt_lifetime(token: str) -> Optional[float]:
+    """
+    Seconds until a JWT's `exp` claim (signature is not checked).
+
+    Returns:
+        Remaining lifetime, or None if the token has no readable exp
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"]) - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenManager:
+    """Cached, proactively refreshed access token for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        fetch_token: TokenFetcher,
+        refresh_margin: Optional[float] = None,
+        min_refresh_delay: float = MIN_REFRESH_DELAY_SECONDS
+    ):
+        """
+        Initialize manager (no token is fetched until first use).
+
+        Args:
+            name: Provider name (for logs/metrics)
+            fetch_token: Coroutine factory performing the auth exchange
+            refresh_margin: Seconds before expiry to refresh in the background
+                (at most half the token's lifetime)
+            min_refresh_delay: Minimum seconds between a refresh and the next background one
+        """
+        self.name = name
+        self.fetch_token = fetch_token
+        self.refresh_margin = settings.TOKEN_REFRESH_MARGIN_SECONDS if refresh_margin is None else refresh_margin
+        self.min_refresh_delay = min_refresh_delay
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0  # When the background refresh is due
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_timer: Optional[asyncio.TimerHandle] = None
+        self.stats_counters = {
+            "refreshes": 0,
+            "failures": 0,
+            "cold_waits": 0,          # get_token() calls that had to wait for auth
+            "background_refreshes": 0,
+            "invalidations": 0,
+        }
+
+    def _valid(self) -> bool:
+        return self._token is not None and time.monotonic() < self._expires_at
+
+    async def get_token(self) -> str:
+        """
+        Get a valid access token.
+        Returns the cached token without waiting unless none is valid.
+
+        Raises:
+            Exception: Whatever fetch_token raised, if there is no valid token
+        """
+        if self._valid():
+            if time.monotonic() >= self._refresh_at:
+                self._refresh_in_background()
+            return self._token
+        self.stats_counters["cold_waits"] += 1
+        return await self.refresh()
+
+    async def refresh(self) -> str:
+        """
+        Fetch a new token (concurrent callers share one auth request).
+
+        Returns:
+            New access token
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self._start_fetch()
+        # Shielded so a cancelled caller never cancels the shared refresh
+        return await asyncio.shield(self._refresh_task)
+
+    def _start_fetch(self) -> asyncio.Task:
+        """
+        Start the auth exchange in an empty context: the shared refresh must not
+        inherit the triggering request's deadline_scope (often already expired
+        when a timer fires) or job_events_scope. (create_task only takes
+        `context=` from Python 3.11; the task copies the context it is created in.)
+        """
+        return contextvars.Context().run(asyncio.create_task, self._fetch())
+
+    async def _fetch(self) -> str:
+        try:
+            token, lifetime = await self.fetch_token()
+        except Exception as e:
+            self.stats_counters["failures"] += 1
+            logger.warning(f"{self.name}: token refresh failed: {e}")
+            raise
+        self._token = token
+        self._expires_at = time.monotonic() + lifetime
+        self.stats_counters["refreshes"] += 1
+        self._schedule_refresh(lifetime)
+        logger.info(f"{self.name}: new access token (valid {lifetime:.0f}s)")
+        return token
+
+    def _schedule_refresh(self, lifetime: float) -> None:
+        """Arrange a background refresh `refresh_margin` (at most half the lifetime) before expiry."""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if lifetime <= 0:
+            # Already expired (clock skew, replayed token): the next get_token()
+            # re-authenticates; rescheduling now would loop on /authenticate
+            logger.warning(f"{self.name}: received an expired access token")
+            self._refresh_at = float("inf")
+            return
+        delay = max(self.min_refresh_delay, lifetime - min(self.refresh_margin, lifetime / 2))
+        self._refresh_at = time.monotonic() + delay
+        self._refresh_timer = asyncio.get_running_loop().call_later(
+            delay, self._refresh_in_background, context=contextvars.Context()
+        )
+
+    def _refresh_in_background(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self.stats_counters["background_refreshes"] += 1
+        self._refresh_task = self._start_fetch()
+        # Failures are logged in _fetch; the current token stays in use until it expires
+        self._refresh_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Drop the cached token (e.g. after the provider rejected it with 401).
+
+        Args:
+            token: Token that was rejected; ignored if a newer one is already cached
+        """
+        if token is not None and token != self._token:
+            return
+        self._token = None
+        self._expires_at = 0.0
+        self.stats_counters["invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters and seconds until the current token expires."""
+        return {
+            **self.stats_counters,
+            "expires_in": round(max(0.0, self._expires_at - time.monotonic()), 1) if self._token else None,
+        }
+
+
+# Global registry (one manager per provider, lazy-loaded)
+_token_managers: Dict[str, TokenManager] = {}
+
+
+def get_token_manager(name: str, fetch_token: TokenFetcher) -> TokenManager:
+    """
+    Get or create the shared token manager for a provider.
+
+    Args:
+        name: Provider name
+        fetch_token: Auth exchange used if the manager is created now
+
+    Returns:
+        Shared TokenManager
+    """
+    manager = _token_managers.get(name)
+    if manager is None:
+        manager = TokenManager(name, fetch_token)
+        _token_managers[name] = manager
+    return manager
+
+
+def get_token_stats() -> Dict[str, Dict[str, Any]]:
+    """Get token counters for all providers that have authenticated."""
+    return {name: manager.stats() for name, manager in _token_managers.items()}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass news analytics vs. the previous per-keyword substring scans.
+Run: python scripts/benchmark_news_analytics.py [--articles 50] [--rounds 200]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.news_analytics import THEME_KEYWORDS, SENTIMENT_KEYWORDS, analyze_articles
+
+# Typical news prose: mostly filler words with a sprinkling of keywords
+FILLER = (
+    "the a of and to in for on with by at from as that this its their it is was were "
+    "will has have had said says company firm business year quarter week month today "
+    "new first more most other some after before over under about into than also which "
+    "people customers product products service services industry executives shares stock "
+    "investors plan plans team teams office offices city state country global regional "
+    "statement interview according analysts expected would could while during since"
+).split()
+KEYWORDS = (
+    "ai cloud data growth revenue partnership security hiring research innovation "
+    "layoffs decline announce report record digital analytics talent compliance"
+).split()
+KEYWORD_RATE = 0.05
+
+def legacy_themes(articles):
+    """Previous GNewsAPI._extract_themes: one substring scan per keyword."""
+    themes = set()
+    combined_text = " ".join([
+        (a.get("title", "") + " " + a.get("content", "")).lower()
+        for a in articles
+    ])
+    for theme, keywords in THEME_KEYWORDS.items():
+        if any(kw in combined_text for kw in keywords):
+            themes.add(theme)
+    return list(themes)[:5]
+
+
+def legacy_sentiment(articles):
+    """Previous GNewsAPI._analyze_sentiment_keywords: presence flags only."""
+    combined_text = " ".join([
+        (a.get("title", "") + " " + a.get("content", "")).lower()
+        for a in articles
+    ])
+    return {
+        label: sum(1 for word in words if word in combined_text)
+        for label, words in SENTIMENT_KEYWORDS.items()
+    }
+
+
+def make_text(rng: random.Random, words: int) -> str:
+    return " ".join(
+        rng.choice(KEYWORDS) if rng.random() < KEYWORD_RATE else rng.choice(FILLER)
+        for _ in range(words)
+    )
+
+
+def make_articles(count: int):
+    rng = random.Random(42)
+    return [
+        {"title": make_text(rng, 12).title(), "content": make_text(rng, 120) + "."}
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+
+    legacy = timeit.timeit(lambda: (legacy_themes(articles), legacy_sentiment(articles)), number=args.rounds)
+    single_pass = timeit.timeit(lambda: analyze_articles(articles), number=args.rounds)
+
+    print(f"{args.articles} articles x {args.rounds} rounds")
+    print(f"  legacy (themes + sentiment, two scans): {legacy / args.rounds * 1000:.3f} ms/call")
+    print(f"  single-pass analyze_articles:           {single_pass / args.rounds * 1000:.3f} ms/call")
+    print(f"  ratio: {legacy / single_pass:.2f}x")
+    print("Note: the single pass also returns per-theme counts/weights and whole-word matches only.")
+
+
+if __name__ == "__main__":
+    main()
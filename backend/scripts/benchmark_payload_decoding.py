@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark: projected decoding of provider payloads vs. full response.json() parsing.
+Uses synthetic payloads shaped like PDL person/company responses, or a recorded
+response body passed with --payload/--schema.
+Run: python scripts/benchmark_payload_decoding.py [--rounds 500] [--payload body.json --schema pdl.person]
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import payload_decoding
+from app.services.payload_decoding import PAYLOAD_SCHEMAS, PayloadDecoder
+
+
+def make_location(rng: random.Random) -> dict:
+    return {
+        "name": f"city {rng.randint(1, 500)}, state, united states",
+        "locality": f"city {rng.randint(1, 500)}",
+        "region": "state",
+        "metro": "metro area",
+        "country": "united states",
+        "continent": "north america",
+        "street_address": f"{rng.randint(1, 9999)} main st",
+        "postal_code": f"{rng.randint(10000, 99999)}",
+        "geo": f"{rng.uniform(-90, 90):.4f},{rng.uniform(-180, 180):.4f}",
+    }
+
+
+def make_company(rng: random.Random) -> dict:
+    return {
+        "name": f"company {rng.randint(1, 10000)}",
+        "size": rng.choice(["11-50", "51-200", "201-500", "1001-5000"]),
+        "id": f"{rng.getrandbits(64):x}",
+        "founded": rng.randint(1950, 2020),
+        "industry": "computer software",
+        "location": make_location(rng),
+        "linkedin_url": f"linkedin.com/company/c{rng.randint(1, 10000)}",
+        "linkedin_id": str(rng.randint(1, 10 ** 8)),
+        "facebook_url": None,
+        "twitter_url": None,
+        "website": f"c{rng.randint(1, 10000)}.com",
+    }
+
+
+def make_pdl_person(rng: random.Random) -> dict:
+    """A PDL person record: a handful of mapped fields plus the bulk we never read."""
+    return {
+        "id": f"{rng.getrandbits(128):x}",
+        "full_name": "jane doe",
+        "first_name": "jane",
+        "last_name": "doe",
+        "linkedin_url": "linkedin.com/in/janedoe",
+        "job_title": "vice president of engineering",
+        "job_company_name": "acme",
+        "job_company_industry": "computer software",
+        "job_company_size": "1001-5000",
+        "job_company_location": make_location(rng),
+        "location_country": "united states",
+        "location_region": "california",
+        "location_locality": "san francisco",
+        "location_names": [make_location(rng)["name"] for _ in range(5)],
+        "skills": [f"skill {i}" for i in range(40)],
+        "interests": [f"interest {i}" for i in range(15)],
+        "emails": [{"address": f"jane{i}@example.com", "type": "professional"} for i in range(6)],
+        "phone_numbers": [f"+1{rng.randint(10 ** 9, 10 ** 10 - 1)}" for _ in range(4)],
+        "profiles": [
+            {"network": net, "url": f"{net}.com/janedoe", "username": "janedoe", "id": None}
+            for net in ("linkedin", "twitter", "github", "facebook", "angellist")
+        ],
+        "education": [
+            {
+                "school": {**make_company(rng), "type": "post-secondary institution"},
+                "degrees": ["bachelors"],
+                "majors": ["computer science"],
+                "start_date": "2004",
+                "end_date": "2008",
+                "gpa": None,
+            }
+            for _ in range(3)
+        ],
+        "experience": [
+            {
+                "company": make_company(rng),
+                "title": {"name": "engineering manager", "role": "engineering", "levels": ["manager"]},
+                "location_names": [make_location(rng)["name"]],
+                "start_date": f"{2008 + i}-01",
+                "end_date": f"{2009 + i}-01",
+                "is_primary": i == 0,
+                "summary": "led teams building data platforms " * 10,
+            }
+            for i in range(12)
+        ],
+        "certifications": [{"name": f"cert {i}", "organization": "org"} for i in range(5)],
+        "languages": [{"name": "english", "proficiency": 5}],
+    }
+
+
+def make_pdl_company(rng: random.Random) -> dict:
+    """A PDL company record with its large optional sections."""
+    company = make_company(rng)
+    company.update({
+        "display_name": "Acme",
+        "employee_count": 2400,
+        "employee_count_by_country": {f"country {i}": rng.randint(1, 500) for i in range(60)},
+        "employee_count_by_month": {f"20{y:02d}-{m:02d}": rng.randint(1000, 3000) for y in range(15, 25) for m in range(1, 13)},
+        "employee_count_by_month_by_role": {
+            f"2024-{m:02d}": {f"role {r}": rng.randint(1, 300) for r in range(20)} for m in range(1, 13)
+        },
+        "tags": [f"tag {i}" for i in range(30)],
+        "summary": "acme builds software for enterprises " * 20,
+        "headline": "enterprise software",
+        "naics": [{"naics_code": "511210", "sector": "information"}],
+        "sic": [{"sic_code": "7372", "major_group": "business services"}],
+        "profiles": [f"linkedin.com/company/acme{i}" for i in range(5)],
+        "affiliated_profiles": [f"{rng.getrandbits(64):x}" for _ in range(20)],
+        "direct_phone_numbers": [f"+1{rng.randint(10 ** 9, 10 ** 10 - 1)}" for _ in range(5)],
+        "top_us_employee_metros": {f"metro {i}": {"current_headcount": rng.randint(1, 500)} for i in range(30)},
+    })
+    return company
+
+
+def measure(decode, body: bytes, rounds: int):
+    """Return (ms per call, peak KiB allocated during one call)."""
+    seconds = timeit.timeit(lambda: decode(body), number=rounds)
+    tracemalloc.start()
+    decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds / rounds * 1000, peak / 1024
+
+
+def bench(label: str, schema_name: str, body: bytes, rounds: int) -> None:
+    schema = PAYLOAD_SCHEMAS[schema_name]
+    candidates = [("json.loads (response.json)", json.loads)]
+    if payload_decoding.ORJSON_AVAILABLE:
+        import orjson
+        candidates.append(("orjson.loads (full)", orjson.loads))
+    candidates.append(("parse + project", PayloadDecoder(schema, use_msgspec=False).decode))
+    if payload_decoding.MSGSPEC_AVAILABLE:
+        candidates.append(("msgspec typed projection", PayloadDecoder(schema, use_msgspec=True).decode))
+
+    print(f"{label} [{schema_name}]: {len(body) / 1024:.1f} KiB x {rounds} rounds")
+    baseline = None
+    for name, decode in candidates:
+        ms, peak = measure(decode, body, rounds)
+        baseline = baseline or ms
+        print(f"  {name:<28} {ms:8.3f} ms/call  {baseline / ms:5.2f}x  peak {peak:8.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--payload", help="Recorded response body (JSON file)")
+    parser.add_argument("--schema", default="pdl.person", choices=sorted(PAYLOAD_SCHEMAS))
+    args = parser.parse_args()
+
+    if args.payload:
+        bench(args.payload, args.schema, Path(args.payload).read_bytes(), args.rounds)
+        return
+
+    rng = random.Random(42)
+    person = make_pdl_person(rng)
+    bench("PDL person", "pdl.person", json.dumps(person).encode(), args.rounds)
+    bench("PDL company", "pdl.company", json.dumps(make_pdl_company(rng)).encode(), args.rounds)
+    bulk = [{"status": 200, "data": make_pdl_person(rng)} for _ in range(100)]
+    bench("PDL bulk (100)", "pdl.person_bulk", json.dumps(bulk).encode(), max(1, args.rounds // 50))
+
+
+if __name__ == "__main__":
+    main()
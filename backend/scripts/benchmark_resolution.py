@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: field resolution with the compiled RESOLUTION_PLAN vs. the previous
+per-call approach (rebuild the mapping, collect candidates, sort by priority).
+Covers single-profile resolution and resolve_batch over synthetic raw_data rows.
+Run: python scripts/benchmark_resolution.py [--rounds 2000] [--batch 1000]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rad_orchestrator import FIELD_MAPPINGS, SOURCE_PRIORITY, RADOrchestrator, resolve_planned_fields
+
+
+def legacy_resolve_fields(raw_data: dict) -> dict:
+    """Previous _resolve_profile field loop: mapping rebuilt and candidates sorted per call."""
+    normalized = {}
+    mappings = {field: [pair for pair in sources] for field, sources in FIELD_MAPPINGS.items()}
+    for field, sources in mappings.items():
+        candidates = []
+        for source_name, source_field in sources:
+            source_data = raw_data.get(source_name, {})
+            if source_data and not source_data.get("_error"):
+                value = source_data.get(source_field)
+                if value is not None and value != "":
+                    candidates.append((SOURCE_PRIORITY.get(source_name, 0), value))
+        if candidates:
+            candidates.sort(key=lambda x: x[0], reverse=True)
+            normalized[field] = candidates[0][1]
+    return normalized
+
+
+def make_raw_data(rng: random.Random) -> dict:
+    """Raw data for one email: every source filled, with some misses and gaps."""
+    raw_data = {}
+    for source in ("apollo", "zoominfo", "pdl_company", "pdl", "hunter", "gnews"):
+        if rng.random() < 0.2:
+            raw_data[source] = {"_error": "No match", "_not_found": True}
+            continue
+        data = {
+            source_field: (None if rng.random() < 0.25 else f"{source}-{source_field}")
+            for sources in FIELD_MAPPINGS.values()
+            for mapped_source, source_field in sources
+            if mapped_source == source
+        }
+        raw_data[source] = data
+    raw_data["hunter"].update({"status": "valid", "score": 90, "result": "deliverable"})
+    return raw_data
+
+
+def bench(label: str, run, rounds: int, per: int = 1, baseline: float = None) -> float:
+    us = timeit.timeit(run, number=rounds) / (rounds * per) * 1e6
+    speedup = f"  {baseline / us:5.2f}x" if baseline else ""
+    print(f"  {label:<34} {us:8.2f} us/profile{speedup}")
+    return us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    orchestrator = RADOrchestrator(MagicMock(), company_cache=MagicMock())  # No fetches here
+    raw_data = make_raw_data(rng)
+    profiles = [(f"user{i}@acme.com", "acme.com", make_raw_data(rng)) for i in range(args.batch)]
+
+    print(f"Single profile x {args.rounds} rounds")
+    baseline = bench("legacy (sort per call)", lambda: legacy_resolve_fields(raw_data), args.rounds)
+    bench("compiled plan (mapped fields)", lambda: resolve_planned_fields(raw_data), args.rounds, baseline=baseline)
+    bench("_resolve_profile (incl. extras)",
+          lambda: orchestrator._resolve_profile("a@acme.com", "acme.com", raw_data), args.rounds, baseline=baseline)
+
+    batch_rounds = max(1, args.rounds // args.batch * 10)
+    print(f"Batch of {args.batch} x {batch_rounds} rounds")
+    baseline = bench("legacy (sort per call)",
+                     lambda: [legacy_resolve_fields(p[2]) for p in profiles], batch_rounds, args.batch)
+    bench("resolve_batch", lambda: orchestrator.resolve_batch(profiles), batch_rounds, args.batch, baseline)
+
+
+if __name__ == "__main__":
+    main()
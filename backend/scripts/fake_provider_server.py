@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the enrichment providers, for load-testing the real HTTP clients.
+Serves the Apollo, PDL (person, bulk, company), Hunter, GNews and ZoomInfo endpoints
+that app.services.enrichment_apis calls, each under /<source>, with configurable
+latency, error rates, 429 bursts, hangs and payload padding.
+
+Point the backend at it (any non-empty API keys work):
+    PROVIDER_BASE_URL=http://localhost:8900 APOLLO_API_KEY=fake PDL_API_KEY=fake \\
+    HUNTER_API_KEY=fake GNEWS_API_KEY=fake ZOOMINFO_API_KEY=fake uvicorn app.main:app
+(or ZOOMINFO_USERNAME=fake ZOOMINFO_PASSWORD=fake to exercise /authenticate)
+
+Run: python scripts/fake_provider_server.py [--port 8900] [--config fake_providers.json]
+     [--median-ms 150] [--p95-ms 600] [--error-rate 0.02] [--throttle-rate 0.01] [--payload-kb 20]
+
+Config file (all keys optional; endpoint names as in PAYLOAD_SCHEMAS):
+    {"default": {"median_ms": 150, "p95_ms": 600},
+     "endpoints": {"pdl.person": {"error_rate": 0.05, "payload_kb": 40},
+                   "apollo.match": {"throttle_rate": 0.02, "throttle_burst": 20, "retry_after": 2}}}
+The live config can be read or patched at /_config (GET/PUT); counters are at /_stats.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import random
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+# Behavior of an endpoint (every field can be overridden per endpoint)
+DEFAULT_PROFILE = {
+    "median_ms": 150.0,       # Latency distribution: lognormal with this median...
+    "p95_ms": 600.0,          # ...and this 95th percentile
+    "error_rate": 0.0,        # Share of requests answered with error_status
+    "error_status": 503,
+    "not_found_rate": 0.0,    # Share of lookups that find no record
+    "throttle_rate": 0.0,     # Chance a request starts a burst of 429s
+    "throttle_burst": 10,     # Requests rejected per burst
+    "retry_after": 1.0,       # Retry-After sent with 429s (seconds)
+    "hang_rate": 0.0,         # Share of requests that hang (client timeouts)
+    "hang_seconds": 120.0,
+    "payload_kb": 0.0,        # Unused filler added to each record (approx. KiB)
+}
+
+# name -> (method, path)
+ENDPOINTS = {
+    "apollo.match": ("POST", "/apollo/people/match"),
+    "apollo.bulk_match": ("POST", "/apollo/people/bulk_match"),
+    "pdl.person": ("GET", "/pdl/person/enrich"),
+    "pdl.person_bulk": ("POST", "/pdl/person/bulk"),
+    "pdl.company": ("GET", "/pdl/company/enrich"),
+    "hunter.email_verifier": ("GET", "/hunter/email-verifier"),
+    "gnews.search": ("GET", "/gnews/search"),
+    "zoominfo.authenticate": ("POST", "/zoominfo/authenticate"),
+    "zoominfo.company": ("POST", "/zoominfo/search/company"),
+}
+
+INDUSTRIES = ["computer software", "financial services", "hospital & health care", "retail", "manufacturing"]
+SIZES = ["11-50", "51-200", "201-500", "1001-5000", "10001+"]
+TITLES = ["chief technology officer", "vp of engineering", "it director", "data scientist", "cfo"]
+
+
+def _seeded(key: str) -> random.Random:
+    """Deterministic RNG per email/domain, so repeated lookups return the same record."""
+    return random.Random(int(hashlib.sha256(key.encode()).hexdigest()[:16], 16))
+
+
+def _company_label(domain: str) -> str:
+    return domain.split(".")[0].replace("-", " ").title()
+
+
+def _padding(kb: float) -> List[Dict[str, Any]]:
+    """Filler records the clients never read (about `kb` KiB of JSON)."""
+    return [{"id": i, "text": "x" * 200} for i in range(int(kb * 1024 / 220))]
+
+
+def person_record(email: str, kb: float) -> Dict[str, Any]:
+    """Flat PDL-style person record."""
+    rng = _seeded(email)
+    local, _, domain = email.partition("@")
+    first, _, last = local.partition(".")
+    company = _company_label(domain)
+    return {
+        "first_name": first.title(),
+        "last_name": (last or "user").title(),
+        "full_name": f"{first.title()} {(last or 'user').title()}",
+        "linkedin_url": f"linkedin.com/in/{local.replace('.', '-')}",
+        "job_title": rng.choice(TITLES),
+        "job_company_name": company,
+        "job_company_industry": rng.choice(INDUSTRIES),
+        "job_company_size": rng.choice(SIZES),
+        "location_country": "united states",
+        "location_region": "california",
+        "location_locality": "san francisco",
+        "skills": [f"skill {i}" for i in range(rng.randint(5, 30))],
+        "interests": [f"interest {i}" for i in range(rng.randint(0, 10))],
+        "experience": [
+            {
+                "title": {"name": rng.choice(TITLES)},
+                "company": {"name": company if i == 0 else f"previous co {i}", "size": rng.choice(SIZES)},
+                "start_date": f"{2020 - 3 * i}-01",
+                "end_date": None if i == 0 else f"{2023 - 3 * i}-01",
+                "is_primary": i == 0,
+            }
+            for i in range(rng.randint(1, 6))
+        ],
+        "padding": _padding(kb),
+    }
+
+
+def apollo_person(email: str, kb: float) -> Dict[str, Any]:
+    """Apollo person with nested organization."""
+    rng = _seeded(email)
+    local, _, domain = email.partition("@")
+    first, _, last = local.partition(".")
+    return {
+        "first_name": first.title(),
+        "last_name": (last or "user").title(),
+        "title": rng.choice(TITLES).title(),
+        "linkedin_url": f"https://linkedin.com/in/{local.replace('.', '-')}",
+        "city": "San Francisco",
+        "state": "California",
+        "country": "United States",
+        "seniority": rng.choice(["c_suite", "vp", "director", "senior"]),
+        "departments": [rng.choice(["engineering", "finance", "it"])],
+        "organization": {
+            "name": _company_label(domain),
+            "primary_domain": domain,
+            "industry": rng.choice(INDUSTRIES),
+            "estimated_num_employees": rng.randint(10, 50000),
+        },
+        "padding": _padding(kb),
+    }
+
+
+def company_record(domain: str, kb: float) -> Dict[str, Any]:
+    """Flat PDL-style company record."""
+    rng = _seeded(domain)
+    name = _company_label(domain)
+    return {
+        "name": name.lower(),
+        "display_name": name,
+        "size": rng.choice(SIZES),
+        "employee_count": rng.randint(10, 50000),
+        "founded": rng.randint(1950, 2020),
+        "industry": rng.choice(INDUSTRIES),
+        "locality": "san francisco",
+        "region": "california",
+        "country": "united states",
+        "type": rng.choice(["private", "public"]),
+        "linkedin_url": f"linkedin.com/company/{name.lower()}",
+        "tags": [f"tag {i}" for i in range(rng.randint(3, 20))],
+        "headline": f"{name} builds things",
+        "summary": f"{name} is a company operating at {domain}.",
+        "direct_phone_numbers": [],
+        "padding": _padding(kb),
+    }
+
+
+class FakeProviders:
+    """Request handling, fault injection and counters for the stand-in server."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None):
+        """
+        Initialize server state.
+
+        Args:
+            config: {"default": profile overrides, "endpoints": {name: profile overrides}}
+            seed: Seed for latency/fault sampling (None = random)
+        """
+        config = config or {}
+        self.default = {**DEFAULT_PROFILE, **config.get("default", {})}
+        self.overrides: Dict[str, Dict[str, Any]] = dict(config.get("endpoints", {}))
+        self.rng = random.Random(seed)
+        self._throttle_left: Counter = Counter()
+        self.stats: Dict[str, Counter] = {name: Counter() for name in ENDPOINTS}
+
+    def profile(self, endpoint: str) -> Dict[str, Any]:
+        """Effective behavior of one endpoint."""
+        return {**self.default, **self.overrides.get(endpoint, {})}
+
+    def latency(self, profile: Dict[str, Any]) -> float:
+        """Sample a latency in seconds from the endpoint's lognormal distribution."""
+        median = max(profile["median_ms"], 0.0) / 1000
+        if median == 0:
+            return 0.0
+        sigma = math.log(max(profile["p95_ms"] / 1000, median) / median) / 1.645
+        return median * math.exp(sigma * self.rng.gauss(0, 1))
+
+    async def handle(
+        self,
+        endpoint: str,
+        request: Request,
+        build: Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Any]
+    ) -> JSONResponse:
+        """
+        Apply fault injection, wait out the sampled latency, then build the payload.
+
+        Args:
+            endpoint: Endpoint name (key of ENDPOINTS)
+            request: Incoming request
+            build: build(params, body, profile) -> JSON payload, or a JSONResponse
+        """
+        profile = self.profile(endpoint)
+        stats = self.stats[endpoint]
+        stats["requests"] += 1
+
+        if self._throttle_left[endpoint] <= 0 and self.rng.random() < profile["throttle_rate"]:
+            self._throttle_left[endpoint] = int(profile["throttle_burst"])
+        if self._throttle_left[endpoint] > 0:
+            self._throttle_left[endpoint] -= 1
+            stats["429"] += 1
+            return JSONResponse(
+                {"error": "rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(profile["retry_after"])}
+            )
+
+        if self.rng.random() < profile["hang_rate"]:
+            stats["hung"] += 1
+            await asyncio.sleep(profile["hang_seconds"])
+        else:
+            await asyncio.sleep(self.latency(profile))
+
+        if self.rng.random() < profile["error_rate"]:
+            stats[str(profile["error_status"])] += 1
+            return JSONResponse({"error": "injected failure"}, status_code=int(profile["error_status"]))
+
+        body = await request.json() if request.method == "POST" else {}
+        payload = build(dict(request.query_params), body, profile)
+        if isinstance(payload, JSONResponse):
+            stats[str(payload.status_code)] += 1
+            return payload
+        stats["200"] += 1
+        return JSONResponse(payload)
+
+    def not_found(self, profile: Dict[str, Any]) -> bool:
+        return self.rng.random() < profile["not_found_rate"]
+
+    # --- payload builders (shapes follow the parsers in enrichment_apis) ---
+
+    def apollo_match(self, params, body, profile):
+        if self.not_found(profile):
+            return {"person": None}
+        return {"person": apollo_person(body.get("email", "unknown@example.com"), profile["payload_kb"])}
+
+    def apollo_bulk_match(self, params, body, profile):
+        return {"matches": [
+            None if self.not_found(profile) else apollo_person(detail.get("email", ""), profile["payload_kb"])
+            for detail in body.get("details", [])
+        ]}
+
+    def pdl_person(self, params, body, profile):
+        if self.not_found(profile):
+            return JSONResponse({"status": 404, "error": {"type": "not_found"}}, status_code=404)
+        return person_record(params.get("email", "unknown@example.com"), profile["payload_kb"])
+
+    def pdl_person_bulk(self, params, body, profile):
+        records = []
+        for item in body.get("requests", []):
+            email = (item.get("params", {}).get("email") or [""])[0]
+            if self.not_found(profile):
+                records.append({"status": 404, "error": {"type": "not_found"}})
+            else:
+                records.append({"status": 200, "data": person_record(email, profile["payload_kb"])})
+        return records
+
+    def pdl_company(self, params, body, profile):
+        if self.not_found(profile):
+            return JSONResponse({"status": 404, "error": {"type": "not_found"}}, status_code=404)
+        return company_record(params.get("website", "example.com"), profile["payload_kb"])
+
+    def hunter_email_verifier(self, params, body, profile):
+        email = params.get("email", "")
+        rng = _seeded(email)
+        return {"data": {
+            "status": rng.choice(["valid", "valid", "accept_all", "unknown"]),
+            "result": "deliverable",
+            "score": rng.randint(50, 100),
+            "regexp": True,
+            "gibberish": False,
+            "disposable": False,
+            "webmail": email.endswith(("@gmail.com", "@yahoo.com")),
+            "mx_records": True,
+            "smtp_server": True,
+            "smtp_check": True,
+            "accept_all": False,
+            "block": False,
+        }}
+
+    def gnews_search(self, params, body, profile):
+        company = params.get("q", "company").strip('"')
+        count = 0 if self.not_found(profile) else int(params.get("max", 10))
+        newest = datetime.now(timezone.utc)
+        articles = [
+            {
+                "title": f"{company} announces cloud and AI growth plans ({i})",
+                "description": f"{company} reported record revenue and new partnerships. " * 3,
+                "content": f"{company} said its data center expansion continues. " * 10,
+                "url": f"https://news.example.com/{company.lower().replace(' ', '-')}/{i}",
+                "image": None,
+                "publishedAt": (newest - timedelta(hours=6 * i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "source": {"name": "Example News", "url": "https://news.example.com"},
+            }
+            for i in range(count)
+        ]
+        return {"totalArticles": len(articles), "articles": articles}
+
+    def zoominfo_authenticate(self, params, body, profile):
+        # Unsigned JWT-shaped token; the client only reads its exp claim
+        claims = {"sub": body.get("username", "fake"), "exp": int(datetime.now(timezone.utc).timestamp()) + 3600}
+        payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+        return {"jwt": f"eyJhbGciOiJub25lIn0.{payload}.fake"}
+
+    def zoominfo_company(self, params, body, profile):
+        if self.not_found(profile):
+            return {"data": []}
+        domain = (body.get("matchCompanyInput") or [{}])[0].get("companyWebsite", "example.com")
+        rng = _seeded(domain)
+        return {"data": [{
+            "id": rng.randint(1, 10 ** 9),
+            "name": _company_label(domain),
+            "website": domain,
+            "industry": rng.choice(INDUSTRIES),
+            "subIndustry": "software",
+            "employeeCount": rng.randint(10, 50000),
+            "revenue": rng.randint(10 ** 6, 10 ** 10),
+            "city": "San Francisco",
+            "state": "California",
+            "country": "United States",
+            "description": f"{_company_label(domain)} company profile.",
+            "foundedYear": rng.randint(1950, 2020),
+            "techStackIds": [rng.randint(1, 1000) for _ in range(5)],
+            "padding": _padding(profile["payload_kb"]),
+        }]}
+
+
+def create_app(config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None) -> FastAPI:
+    """
+    Build the stand-in server.
+
+    Args:
+        config: See module docstring
+        seed: Seed for latency/fault sampling
+
+    Returns:
+        FastAPI app (state on app.state.providers)
+    """
+    app = FastAPI(title="Fake enrichment providers")
+    providers = FakeProviders(config, seed)
+    app.state.providers = providers
+
+    def register(name: str, method: str, path: str) -> None:
+        build = getattr(providers, name.replace(".", "_"))
+
+        async def endpoint(request: Request) -> JSONResponse:
+            return await providers.handle(name, request, build)
+
+        app.add_api_route(path, endpoint, methods=[method], name=name)
+
+    for name, (method, path) in ENDPOINTS.items():
+        register(name, method, path)
+
+    @app.get("/_config")
+    async def get_config() -> Dict[str, Any]:
+        return {"default": providers.default, "endpoints": providers.overrides}
+
+    @app.put("/_config")
+    async def put_config(request: Request) -> Dict[str, Any]:
+        update = await request.json()
+        providers.default.update(update.get("default", {}))
+        for name, profile in update.get("endpoints", {}).items():
+            providers.overrides.setdefault(name, {}).update(profile)
+        return {"default": providers.default, "endpoints": providers.overrides}
+
+    @app.get("/_stats")
+    async def get_stats() -> Dict[str, Dict[str, int]]:
+        return {name: dict(counts) for name, counts in providers.stats.items() if counts}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--config", help="JSON config file (see above)")
+    parser.add_argument("--seed", type=int)
+    for key, value in DEFAULT_PROFILE.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=type(value), dest=key)
+    args = parser.parse_args()
+
+    config = json.loads(Path(args.config).read_text()) if args.config else {}
+    config.setdefault("default", {}).update({
+        key: getattr(args, key) for key in DEFAULT_PROFILE if getattr(args, key) is not None
+    })
+
+    import uvicorn
+    uvicorn.run(create_app(config, args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
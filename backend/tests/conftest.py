@@ -16,7 +16,7 @@ os.environ["SUPABASE_KEY"] = "mock-test-key"
 # Import app and services
 from app.main import app
 from app.services.supabase_client import SupabaseClient, get_supabase_client
-from app.services.rad_orchestrator import RADOrchestrator
+from app.services.rad_orchestrator import RADOrchestrator, get_rad_orchestrator
 from app.services.llm_service import LLMService
 
 
@@ -50,6 +50,8 @@ def test_client(mock_supabase):
         return mock_supabase
 
     app.dependency_overrides[get_supabase_client] = mock_get_supabase
+    orchestrator = RADOrchestrator(mock_supabase)
+    app.dependency_overrides[get_rad_orchestrator] = lambda: orchestrator
 
     client = TestClient(app)
 
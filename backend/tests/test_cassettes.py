@@ -0,0 +1,126 @@
+"""
+Tests for provider record/replay cassettes.
+"""
+
+import gzip
+import pytest
+import httpx
+
+from app.config import settings
+from app.services import http_pool, rate_limiter, circuit_breaker, cassettes, token_manager
+from app.services.http_pool import HTTPClientPool
+from app.services.cassettes import CassetteStore, scrub
+from app.services.enrichment_apis import ApolloAPI, PDLAPI, ZoomInfoAPI, EnrichmentAPIError
+
+
+@pytest.fixture
+def provider_calls(monkeypatch, tmp_path):
+    """
+    Fixture: mock-transport pool plus a cassette directory.
+    Returns the list of requests that reached the "network".
+    """
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"person": {"first_name": "Rec", "organization": {"name": "Tape"}}})
+
+    monkeypatch.setattr(http_pool, "_http_pool", HTTPClientPool(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+    monkeypatch.setattr(cassettes, "_cassette_store", None)
+    monkeypatch.setattr(settings, "CASSETTE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "CASSETTE_LATENCY_SCALE", 0.0)
+    return calls
+
+
+class TestCassetteStore:
+    """Tests for keys, scrubbing and storage."""
+
+    def test_key_ignores_secrets_and_order(self, tmp_path):
+        """key: Secrets and param order don't change the key."""
+        store = CassetteStore(str(tmp_path))
+        a = store.normalize("get", "/person/enrich", {"email": "a@b.com", "api_key": "one"})
+        b = store.normalize("GET", "person/enrich", {"api_key": "two", "email": "a@b.com"})
+        c = store.normalize("GET", "/person/enrich", {"email": "c@b.com"})
+        assert store.key("pdl", a) == store.key("pdl", b)
+        assert store.key("pdl", a) != store.key("pdl", c)
+        assert store.key("pdl", a) != store.key("apollo", a)
+
+    def test_scrub_nested(self):
+        """scrub: Secret keys are replaced at any depth."""
+        assert scrub({"details": [{"email": "x", "API_KEY": "s"}], "token": "t"}) == {
+            "details": [{"email": "x", "API_KEY": "<scrubbed>"}], "token": "<scrubbed>"
+        }
+
+
+class TestRecordReplay:
+    """Tests for record/replay through BaseEnrichmentAPI._request."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay_offline(self, provider_calls, monkeypatch, tmp_path):
+        """_request: Recorded responses are replayed without touching the network."""
+        monkeypatch.setattr(settings, "CASSETTE_MODE", "record")
+        recorded = await ApolloAPI(api_key="secret-key").enrich("rec@tape.io")
+
+        files = list(tmp_path.rglob("*.json.gz"))
+        assert len(files) == 1
+        assert b"secret-key" not in gzip.decompress(files[0].read_bytes())
+
+        monkeypatch.setattr(settings, "CASSETTE_MODE", "replay")
+        replayed = await ApolloAPI(api_key="other-key").enrich("rec@tape.io")
+
+        assert len(provider_calls) == 1
+        assert replayed["first_name"] == recorded["first_name"] == "Rec"
+        assert cassettes.get_cassette_store().stats()["replayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_token_not_recorded(self, monkeypatch, tmp_path):
+        """record: The JWT from ZoomInfo /authenticate never reaches disk."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/authenticate"):
+                return httpx.Response(200, json={"jwt": "live-zoominfo-jwt"})
+            return httpx.Response(200, json={"data": [{"name": "Initech"}]})
+
+        monkeypatch.setattr(http_pool, "_http_pool", HTTPClientPool(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+        monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+        monkeypatch.setattr(token_manager, "_token_managers", {})
+        monkeypatch.setattr(cassettes, "_cassette_store", None)
+        monkeypatch.setattr(settings, "CASSETTE_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "CASSETTE_MODE", "record")
+
+        result = await ZoomInfoAPI(username="u", password="p").enrich("a@initech.com")
+
+        files = list(tmp_path.rglob("*.json.gz"))
+        assert result["company_name"] == "Initech" and len(files) == 2
+        for path in files:
+            assert b"live-zoominfo-jwt" not in gzip.decompress(path.read_bytes())
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_raises(self, provider_calls, monkeypatch):
+        """_request: Replay never falls through to the vendor."""
+        monkeypatch.setattr(settings, "CASSETTE_MODE", "replay")
+
+        with pytest.raises(EnrichmentAPIError, match="No cassette"):
+            await PDLAPI(api_key="k").enrich("nobody@tape.io")
+        assert provider_calls == []
+
+    @pytest.mark.asyncio
+    async def test_replay_scales_latency(self, tmp_path):
+        """replay: Recorded latency is multiplied by latency_scale."""
+        store = CassetteStore(str(tmp_path), latency_scale=0.5)
+        request = store.normalize("GET", "/search", {"q": "x"})
+        await store.record("gnews", request, httpx.Response(200, json={"articles": []}), latency=0.1)
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(cassettes.asyncio, "sleep", fake_sleep)
+            response = await store.replay("gnews", request, "https://gnews.io/api/v4/search")
+
+        assert response.json() == {"articles": []}
+        assert sleeps == [pytest.approx(0.05)]
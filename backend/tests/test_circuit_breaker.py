@@ -0,0 +1,93 @@
+"""
+Tests for provider circuit breakers.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from app.services.enrichment_apis import CircuitOpenError
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+def make_breaker(**overrides):
+    options = dict(
+        window_seconds=60, min_calls=4, failure_rate=0.5,
+        slow_call_seconds=5, slow_call_rate=0.8, open_seconds=30, half_open_probes=1
+    )
+    options.update(overrides)
+    return CircuitBreaker("test", **options)
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_on_error_rate(self):
+        """record_failure: Trips once the window's error rate hits the threshold."""
+        breaker = make_breaker()
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+        breaker.record_failure(0.1)
+        assert breaker.state == CLOSED
+
+        breaker.record_failure(0.1)
+
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_needs_min_calls(self):
+        """_record: A couple of failures alone do not trip the breaker."""
+        breaker = make_breaker()
+        breaker.record_failure(0.1)
+        breaker.record_failure(0.1)
+        assert breaker.state == CLOSED
+
+    def test_opens_on_slow_calls(self):
+        """record_success: Mostly-slow successes also trip the breaker."""
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record_success(6.0)
+        assert breaker.state == OPEN
+
+    def test_half_open_probe_closes(self):
+        """allow_request: After cool-down one probe is admitted; success closes."""
+        breaker = make_breaker(open_seconds=0.001)
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        breaker._opened_at -= 1
+
+        assert breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow_request()  # Only one probe at a time
+
+        breaker.record_success(0.1)
+        assert breaker.state == CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        """record_failure: A failed probe re-opens the breaker."""
+        breaker = make_breaker(open_seconds=0.001)
+        for _ in range(4):
+            breaker.record_failure(0.1)
+        breaker._opened_at -= 1
+        breaker.allow_request()
+
+        breaker.record_failure(0.1)
+
+        assert breaker.state == OPEN
+        assert breaker.stats()["opened"] == 2
+
+
+class TestOrchestratorSkipsOpenCircuits:
+    """Tests for circuit-open handling in RADOrchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_open_source_recorded_as_skipped(self, mock_supabase):
+        """enrich: Sources with open circuits are skipped and listed."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        orchestrator.apis["apollo"].enrich = AsyncMock(side_effect=CircuitOpenError("apollo", 30))
+
+        result = await orchestrator.enrich("skip@acme.com")
+
+        assert result["skipped_sources"] == ["apollo"]
+        assert "apollo" not in result["data_sources"]
@@ -0,0 +1,101 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.coalescing import SingleFlight
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.do."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """do: Concurrent callers with the same key run fn once."""
+        flights = SingleFlight("test")
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        results = await asyncio.gather(*[flights.do("k", work) for _ in range(5)])
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert flights.stats()["misses"] == 1
+        assert flights.stats()["coalesced"] == 4
+        assert flights.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_cached(self):
+        """do: A finished call is not reused by later callers."""
+        flights = SingleFlight("test")
+        work = AsyncMock(return_value="ok")
+
+        await flights.do("k", work)
+        await flights.do("k", work)
+
+        assert work.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_callers(self):
+        """do: Every caller sees the shared failure."""
+        flights = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", fail), flights.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        """do: Cancelling one waiter leaves the call running for others."""
+        flights = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(flights.do("k", work))
+        second = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+
+class TestOrchestratorCoalescing:
+    """Tests for coalescing in RADOrchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_enrich_same_email_calls_provider_once(self, mock_supabase):
+        """enrich: Double-submitted emails share one provider fan-out."""
+        orchestrator = RADOrchestrator(mock_supabase)
+
+        async def slow_apollo(email, domain=None):
+            await asyncio.sleep(0.01)
+            return {"email": email, "first_name": "Jane", "_mock": True}
+
+        apollo_call = AsyncMock(side_effect=slow_apollo)
+        orchestrator.apis["apollo"].enrich = apollo_call
+
+        results = await asyncio.gather(
+            orchestrator.enrich("jane@acme.com"),
+            orchestrator.enrich("Jane@Acme.com"),
+        )
+
+        assert apollo_call.await_count == 1
+        assert results[0] is not results[1]
+        assert results[0]["email"] == results[1]["email"]
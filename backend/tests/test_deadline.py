@@ -0,0 +1,119 @@
+"""
+Tests for request deadlines, partial enrichment results and late backfill.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.deadline import Deadline, current_deadline, deadline_scope, remaining_budget
+from app.services.llm_service import LLMService
+from app.services import rad_orchestrator
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+class TestDeadline:
+    """Tests for Deadline and deadline_scope."""
+
+    def test_remaining_and_cap(self):
+        deadline = Deadline(10)
+        assert 9 < deadline.remaining() <= 10
+        assert deadline.cap(3) == 3
+        assert not deadline.expired
+
+    def test_scope_sets_and_resets(self):
+        """deadline_scope: Visible inside the block only."""
+        assert current_deadline() is None
+        with deadline_scope(5) as deadline:
+            assert current_deadline() is deadline
+            assert remaining_budget(30) <= 5
+        assert current_deadline() is None
+        assert remaining_budget(30) == 30
+
+    def test_nested_scope_cannot_extend(self):
+        """deadline_scope: Inner scopes keep the tighter outer deadline."""
+        with deadline_scope(1) as outer:
+            with deadline_scope(60) as inner:
+                assert inner is outer
+
+
+class TestEnrichmentBudget:
+    """Tests for budgeted enrichment in RADOrchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_slow_source_returns_partial_and_backfills(self, mock_supabase):
+        """enrich: Resolves at the budget, then merges the late source afterwards."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        release = asyncio.Event()
+
+        async def slow_zoominfo(email, domain=None):
+            await release.wait()
+            return {"email": email, "title": "VP Infrastructure", "seniority": "vp"}
+
+        orchestrator.apis["zoominfo"].enrich = AsyncMock(side_effect=slow_zoominfo)
+        orchestrator.apis["apollo"].enrich = AsyncMock(
+            return_value={"email": "lee@latecorp.com", "first_name": "Lee"}
+        )
+
+        raw_data = await orchestrator._fetch_all_sources("lee@latecorp.com", "latecorp.com", budget=0.05)
+        assert raw_data["zoominfo"]["_pending"] is True
+
+        profile = orchestrator._resolve_profile("lee@latecorp.com", "latecorp.com", raw_data)
+        mock_supabase.upsert_finalize_data(
+            email="lee@latecorp.com", normalized_data=profile, intro="hi", cta="go",
+            data_sources=["apollo"]
+        )
+        orchestrator.mark_finalized("lee@latecorp.com")
+        release.set()
+        await asyncio.gather(*rad_orchestrator._background_tasks)
+
+        record = mock_supabase.get_finalize_data("lee@latecorp.com")
+        assert record["normalized_data"]["backfilled_sources"] == ["zoominfo"]
+        assert "zoominfo" in record["data_sources"]
+        assert record["normalized_data"]["first_name"] == "Lee"
+        assert record["personalization_intro"] == "hi"
+
+    @pytest.mark.asyncio
+    async def test_overlapping_backfills_for_one_email(self, mock_supabase, caplog):
+        """_schedule_backfill: Concurrent runs for the same email each wait on their own event."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        release = asyncio.Event()
+
+        async def slow_zoominfo(email, domain=None):
+            await release.wait()
+            return {"email": email, "title": "VP Infrastructure"}
+
+        orchestrator.apis["zoominfo"].enrich = AsyncMock(side_effect=slow_zoominfo)
+
+        for _ in range(2):
+            await orchestrator._fetch_all_sources("sam@overlapco.com", "overlapco.com", budget=0.01)
+        assert len(rad_orchestrator._finalized_events["sam@overlapco.com"]) == 2
+
+        mock_supabase.upsert_finalize_data(
+            email="sam@overlapco.com", normalized_data={}, intro="hi", cta="go", data_sources=[]
+        )
+        orchestrator.mark_finalized("sam@overlapco.com")
+        release.set()
+        await asyncio.gather(*rad_orchestrator._background_tasks)
+
+        assert "Backfill failed" not in caplog.text
+        assert "sam@overlapco.com" not in rad_orchestrator._finalized_events
+        record = mock_supabase.get_finalize_data("sam@overlapco.com")
+        assert record["normalized_data"]["backfilled_sources"] == ["zoominfo"]
+
+
+class TestLLMDeadline:
+    """Tests for deadline handling in LLMService."""
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_skips_providers(self):
+        """_call_with_fallback: No provider calls once the deadline has passed."""
+        service = LLMService()
+        client = MagicMock()
+        service.providers = [{"name": "anthropic", "client": client, "model": "m"}]
+
+        with deadline_scope(0):
+            content, provider = await service._call_with_fallback("sys", "user")
+
+        assert (content, provider) == (None, "none")
+        client.messages.create.assert_not_called()
@@ -0,0 +1,92 @@
+"""
+Tests for email domain classification.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.domain_classifier import (
+    DomainClassifier,
+    DisposableEmailError,
+    CORPORATE,
+    DISPOSABLE,
+    EDUCATION,
+    FREEMAIL,
+    GOVERNMENT,
+)
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+class TestDomainClassifier:
+    """Tests for the bundled lists and suffix matching."""
+
+    @pytest.fixture
+    def classifier(self):
+        return DomainClassifier()
+
+    def test_bundled_lists(self, classifier):
+        """classify_domain: Each bundled list is recognized; unknown domains are corporate."""
+        assert classifier.classify_domain("gmail.com") == FREEMAIL
+        assert classifier.classify_domain("mailinator.com") == DISPOSABLE
+        assert classifier.classify_domain("stanford.edu") == EDUCATION
+        assert classifier.classify_domain("ox.ac.uk") == EDUCATION
+        assert classifier.classify_domain("nasa.gov") == GOVERNMENT
+        assert classifier.classify_domain("acme.com") == CORPORATE
+
+    def test_subdomains_and_case(self, classifier):
+        """classify_domain: Entries cover subdomains; input is normalized."""
+        assert classifier.classify_domain("Mail.Yahoo.co.uk.") == FREEMAIL
+        assert classifier.classify_domain("jane@GMAIL.com") == FREEMAIL
+        assert classifier.classify_domain("notgmail.com") == CORPORATE
+
+    def test_classify_email(self, classifier):
+        """classify: Role mailboxes are flagged (plus-addressing ignored)."""
+        role = classifier.classify("Sales+EU@acme.com")
+        person = classifier.classify("jane@outlook.com")
+
+        assert role.role_account and role.domain_type == CORPORATE
+        assert person.is_personal and not person.role_account
+
+    def test_custom_list_dir(self, tmp_path):
+        """reload: Lists are read from the configured directory and can be updated."""
+        (tmp_path / "freemail.txt").write_text("# comment\nexample-mail.net\n")
+        classifier = DomainClassifier(str(tmp_path))
+        assert classifier.classify_domain("example-mail.net") == FREEMAIL
+
+        (tmp_path / "disposable.txt").write_text("example-mail.net\n")
+        classifier.reload()
+        assert classifier.classify_domain("example-mail.net") == DISPOSABLE
+
+
+class TestOrchestratorClassification:
+    """Tests for domain classification in RADOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, mock_supabase):
+        """Fixture: orchestrator whose providers are all AsyncMocks."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        for source in ("apollo", "pdl", "hunter", "zoominfo", "gnews"):
+            orchestrator.apis[source].enrich = AsyncMock(return_value={"first_name": "Pat"})
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(return_value={"name": "Gmail"})
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_freemail_skips_company_sources(self, orchestrator):
+        """enrich: Free-mail domains are never looked up as companies."""
+        result = await orchestrator.enrich("pat.doe@gmail.com")
+
+        orchestrator.apis["apollo"].enrich.assert_awaited_once()
+        orchestrator.apis["zoominfo"].enrich.assert_not_awaited()
+        orchestrator.apis["gnews"].enrich.assert_not_awaited()
+        orchestrator.apis["pdl"].enrich_company.assert_not_awaited()
+        assert result["domain_type"] == FREEMAIL
+        assert result["skipped_reasons"]["gnews"] == "personal_domain"
+
+    @pytest.mark.asyncio
+    async def test_disposable_rejected_before_calls(self, orchestrator):
+        """enrich: Disposable mailboxes raise before any provider call."""
+        with pytest.raises(DisposableEmailError):
+            await orchestrator.enrich("temp@mailinator.com")
+
+        for source in ("apollo", "pdl", "hunter", "zoominfo", "gnews"):
+            orchestrator.apis[source].enrich.assert_not_awaited()
@@ -0,0 +1,213 @@
+"""
+Tests for enrichment API clients.
+Covers the shared HTTP plumbing in BaseEnrichmentAPI using httpx.MockTransport.
+"""
+
+import asyncio
+import json
+import pytest
+import httpx
+
+from app.config import settings
+from app.services import http_pool, rate_limiter, circuit_breaker, retry_policy
+from app.services.http_pool import HTTPClientPool
+from app.services.enrichment_apis import ApolloAPI, PDLAPI, EnrichmentAPIError, CircuitOpenError
+
+
+@pytest.fixture
+def mock_transport_pool(monkeypatch):
+    """
+    Fixture: install a global HTTP pool backed by a MockTransport.
+    Returns the list of captured requests and a setter for the handler.
+    """
+    state = {"requests": [], "handler": lambda request: httpx.Response(200, json={})}
+
+    def dispatch(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        return state["handler"](request)
+
+    pool = HTTPClientPool(transport=httpx.MockTransport(dispatch))
+    monkeypatch.setattr(http_pool, "_http_pool", pool)
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+    monkeypatch.setattr(retry_policy, "_retry_budgets", {})
+    monkeypatch.setattr(settings, "RETRY_BASE_DELAY", 0.0)
+    yield state
+
+
+class TestHTTPClientPool:
+    """Tests for pooled provider clients."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_reused_per_provider(self):
+        """get: Repeated lookups return one long-lived client per provider."""
+        pool = HTTPClientPool()
+        try:
+            assert pool.get("apollo") is pool.get("apollo")
+            assert pool.get("apollo") is not pool.get("pdl")
+        finally:
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_provider_connection_cap(self, monkeypatch):
+        """_max_connections: Env override beats the built-in provider cap."""
+        monkeypatch.setenv("HUNTER_MAX_CONNECTIONS", "3")
+        pool = HTTPClientPool()
+        assert pool._max_connections("hunter") == 3
+        assert pool._max_connections("apollo") == http_pool.PROVIDER_MAX_CONNECTIONS["apollo"]
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients(self):
+        """aclose: All pooled clients are closed on shutdown."""
+        pool = HTTPClientPool()
+        client = pool.get("gnews")
+        await pool.aclose()
+        assert client.is_closed
+
+    def test_client_replaced_on_new_loop_is_closed(self):
+        """get: A client left behind by another event loop is closed, not leaked."""
+        pool = HTTPClientPool()
+
+        async def get_client():
+            return pool.get("apollo")
+
+        async def replace_client():
+            client = pool.get("apollo")
+            await asyncio.sleep(0)
+            return client
+
+        old = asyncio.run(get_client())
+        new = asyncio.run(replace_client())
+
+        assert old is not new
+        assert old.is_closed and not new.is_closed
+        asyncio.run(pool.aclose())
+
+    @pytest.mark.asyncio
+    async def test_warm_up_ignores_failures(self):
+        """warm_up: Connection errors are logged, not raised."""
+        def refuse(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        pool = HTTPClientPool(transport=httpx.MockTransport(refuse))
+        await pool.warm_up({"apollo": "https://api.apollo.io/v1"})
+        await pool.aclose()
+
+
+class TestProviderRequests:
+    """Tests for provider calls going through the shared pool."""
+
+    @pytest.mark.asyncio
+    async def test_apollo_uses_pooled_client(self, mock_transport_pool):
+        """ApolloAPI.enrich: Requests go through the global pool."""
+        mock_transport_pool["handler"] = lambda request: httpx.Response(
+            200, json={"person": {"first_name": "Jane", "organization": {"name": "Acme"}}}
+        )
+        api = ApolloAPI(api_key="test-key")
+
+        first = await api.enrich("jane@acme.com")
+        await api.enrich("joe@acme.com")
+
+        assert first["first_name"] == "Jane"
+        assert first["company_name"] == "Acme"
+        assert len(mock_transport_pool["requests"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, mock_transport_pool):
+        """PDLAPI.enrich: 4xx/5xx responses raise EnrichmentAPIError."""
+        mock_transport_pool["handler"] = lambda request: httpx.Response(500, text="boom")
+        api = PDLAPI(api_key="test-key")
+
+        with pytest.raises(EnrichmentAPIError) as exc_info:
+            await api.enrich("jane@acme.com")
+
+        assert exc_info.value.status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_no_match_is_marked_not_found(self, mock_transport_pool):
+        """enrich: PDL 404s and empty Apollo matches become _not_found error dicts."""
+        mock_transport_pool["handler"] = lambda request: (
+            httpx.Response(404, json={"error": {"message": "Not found"}})
+            if "peopledatalabs" in request.url.host else httpx.Response(200, json={"person": None})
+        )
+
+        pdl = await PDLAPI(api_key="test-key").enrich("nobody@acme.com")
+        apollo = await ApolloAPI(api_key="test-key").enrich("nobody@acme.com")
+
+        assert pdl["_not_found"] and pdl["_error"]
+        assert apollo["_not_found"] and apollo["_error"]
+
+    @pytest.mark.asyncio
+    async def test_429_throttles_provider(self, mock_transport_pool):
+        """_request: A 429 halves the provider's window and honors Retry-After."""
+        mock_transport_pool["handler"] = lambda request: httpx.Response(
+            429, headers={"Retry-After": "7"}, text="slow down"
+        )
+        api = PDLAPI(api_key="test-key")
+
+        with pytest.raises(EnrichmentAPIError) as exc_info:
+            await api.enrich("jane@acme.com")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after == 7.0
+        stats = rate_limiter.get_rate_limit_stats()["pdl"]
+        assert stats["throttled"] == 1
+        assert stats["concurrency"] == stats["max_concurrency"] // 2
+        assert stats["paused_for"] > 6
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, mock_transport_pool):
+        """_request: After repeated 5xx, calls fail without hitting the provider."""
+        mock_transport_pool["handler"] = lambda request: httpx.Response(503, text="down")
+        api = ApolloAPI(api_key="test-key")
+
+        for _ in range(5):
+            with pytest.raises(EnrichmentAPIError):
+                await api.enrich("jane@acme.com")
+
+        with pytest.raises(CircuitOpenError):
+            await api.enrich("jane@acme.com")
+
+        assert len(mock_transport_pool["requests"]) == 5
+        assert circuit_breaker.get_circuit_breaker_stats()["apollo"]["state"] == "open"
+
+
+class TestBulkEnrichment:
+    """Tests for vendor bulk endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_apollo_enrich_many_chunks_by_ten(self, mock_transport_pool):
+        """ApolloAPI.enrich_many: 25 emails become 3 bulk_match calls."""
+        def handler(request):
+            details = json.loads(request.content)["details"]
+            matches = [{"first_name": d["email"].split("@")[0]} for d in details]
+            return httpx.Response(200, json={"matches": matches})
+
+        mock_transport_pool["handler"] = handler
+        emails = [f"user{i}@acme.com" for i in range(25)]
+
+        results = await ApolloAPI(api_key="test-key").enrich_many(emails)
+
+        assert len(mock_transport_pool["requests"]) == 3
+        assert all(r.url.path.endswith("/people/bulk_match") for r in mock_transport_pool["requests"])
+        assert results["user17@acme.com"]["first_name"] == "user17"
+
+    @pytest.mark.asyncio
+    async def test_pdl_enrich_many_per_record_status(self, mock_transport_pool):
+        """PDLAPI.enrich_many: Unmatched records become error dicts."""
+        mock_transport_pool["handler"] = lambda request: httpx.Response(200, json=[
+            {"status": 200, "data": {"first_name": "Jane", "job_title": "CTO"}},
+            {"status": 404, "error": {"message": "Not found"}},
+        ])
+
+        results = await PDLAPI(api_key="test-key").enrich_many(["jane@acme.com", "nobody@acme.com"])
+
+        assert results["jane@acme.com"]["job_title"] == "CTO"
+        assert "_error" in results["nobody@acme.com"]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_left_out(self, mock_transport_pool):
+        """PDLAPI.enrich_many: A failed bulk call omits its emails for fallback."""
+        mock_transport_pool["handler"] = lambda request: httpx.Response(500, text="boom")
+
+        assert await PDLAPI(api_key="test-key").enrich_many(["jane@acme.com"]) == {}
@@ -0,0 +1,123 @@
+"""
+Tests for the company enrichment cache.
+Uses the mocked Supabase client as the L2 table.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.enrichment_cache import CompanyCache
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+COMPANY_DATA = {"domain": "acme.com", "name": "Acme", "industry": "Software"}
+
+
+class TestCompanyCache:
+    """Tests for CompanyCache tiers and TTLs."""
+
+    @pytest.fixture
+    def cache(self, mock_supabase):
+        return CompanyCache(mock_supabase, max_entries=10)
+
+    def test_miss_then_l1_hit(self, cache):
+        """get: Returns None on miss and the stored data once set."""
+        assert cache.get("acme.com", "pdl_company") is None
+
+        cache.set("acme.com", "pdl_company", COMPANY_DATA)
+
+        assert cache.get("acme.com", "pdl_company")["name"] == "Acme"
+        assert cache.stats()["l1_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_l2_hit_from_table(self, cache, mock_supabase):
+        """get: A fresh process finds data written by another via the table."""
+        cache.set("acme.com", "zoominfo", COMPANY_DATA)
+
+        other_process = CompanyCache(mock_supabase)
+        assert other_process.get("acme.com", "zoominfo")["name"] == "Acme"
+        assert other_process.stats()["l2_hits"] == 1
+
+    def test_sources_share_one_row(self, cache, mock_supabase):
+        """set: Sources for one domain merge into a single table row."""
+        cache.set("acme.com", "pdl_company", COMPANY_DATA)
+        cache.set("acme.com", "gnews", {"answer": "news"})
+
+        row = mock_supabase.get_enrichment_cache("acme.com")
+        assert set(row["enriched_data"].keys()) == {"pdl_company", "gnews"}
+
+    def test_domain_normalized(self, cache):
+        """get: www. prefix and case are ignored."""
+        cache.set("WWW.Acme.com", "pdl_company", COMPANY_DATA)
+        assert cache.get("acme.com", "pdl_company") is not None
+
+    def test_errors_and_mocks_not_cached(self, cache):
+        """set: Error and mock responses are never cached."""
+        cache.set("acme.com", "pdl_company", {"_error": "timeout"})
+        cache.set("acme.com", "zoominfo", {"name": "x", "_mock": True})
+
+        assert cache.get("acme.com", "pdl_company") is None
+        assert cache.get("acme.com", "zoominfo") is None
+
+    def test_person_sources_not_cacheable(self, cache):
+        """is_cacheable: Person-level sources are not cached by domain."""
+        assert not cache.is_cacheable("apollo")
+        assert not cache.is_cacheable("pdl")
+        assert cache.is_cacheable("pdl_company")
+
+    def test_expired_entries_ignored_and_purged(self, cache):
+        """purge_expired: Expired entries are not served and are swept."""
+        cache.set("acme.com", "gnews", {"answer": "news"})
+        row = cache._lru["acme.com"]
+        row["sources"]["gnews"]["expires_at"] = (datetime.utcnow() - timedelta(seconds=1)).isoformat()
+
+        assert cache.get("acme.com", "gnews") is None
+        assert cache.purge_expired() == 1
+
+    def test_lru_eviction(self, mock_supabase):
+        """_put: Oldest domains are evicted beyond max_entries."""
+        cache = CompanyCache(None, max_entries=2)
+        for domain in ("a.com", "b.com", "c.com"):
+            cache.set(domain, "pdl_company", COMPANY_DATA)
+
+        assert "a.com" not in cache._lru
+        assert cache.stats()["evictions"] == 1
+
+    def test_flush_hits_updates_table(self, cache, mock_supabase):
+        """flush_hits: L1 hits are written to cache_hits in bulk."""
+        cache.set("acme.com", "pdl_company", COMPANY_DATA)
+        cache.get("acme.com", "pdl_company")
+        cache.get("acme.com", "pdl_company")
+
+        cache.flush_hits()
+
+        assert mock_supabase._mock_enrichment_cache["acme.com"]["cache_hits"] == 2
+
+    def test_hits_incremented_in_sql(self, mock_supabase, monkeypatch):
+        """record_enrichment_cache_hits: Hits are added by the RPC, not read-modify-write."""
+        client = MagicMock()
+        monkeypatch.setattr(mock_supabase, "mock_mode", False)
+        monkeypatch.setattr(mock_supabase, "client", client, raising=False)
+
+        mock_supabase.record_enrichment_cache_hits("acme.com", 3)
+
+        client.rpc.assert_called_once_with("record_enrichment_cache_hits", {"p_domain": "acme.com", "p_hits": 3})
+        client.table.assert_not_called()
+
+
+class TestOrchestratorCompanyCache:
+    """Tests for company cache use in RADOrchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_company_sources_fetched_once_per_domain(self, mock_supabase):
+        """_fetch_all_sources: Second employee at a domain reuses company data."""
+        cache = CompanyCache(mock_supabase)
+        orchestrator = RADOrchestrator(mock_supabase, company_cache=cache)
+        company_call = AsyncMock(return_value=dict(COMPANY_DATA))
+        orchestrator.apis["pdl"].enrich_company = company_call
+
+        await orchestrator._fetch_all_sources("jane@acme.com", "acme.com")
+        await orchestrator._fetch_all_sources("joe@acme.com", "acme.com")
+
+        assert company_call.await_count == 1
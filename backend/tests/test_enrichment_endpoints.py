@@ -1,8 +1,9 @@
 """
 Tests for enrichment endpoints.
-POST /rad/enrich and GET /rad/profile/{email}
+POST /rad/enrich, GET /rad/jobs/{job_id} and GET /rad/profile/{email}
 """
 
+import time
 import pytest
 from datetime import datetime
 from fastapi import status
@@ -14,18 +15,19 @@ class TestEnrichmentEndpoint:
     def test_enrich_valid_email(self, test_client, mock_supabase):
         """
         Happy path: POST /rad/enrich with valid email.
-        Should return 200 with job_id and status=completed.
+        Should return 202 with job_id and status=queued.
         """
         response = test_client.post(
             "/rad/enrich",
             json={"email": "john@acme.com"}
         )
 
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_202_ACCEPTED
         data = response.json()
         assert "job_id" in data
         assert data["email"] == "john@acme.com"
-        assert data["status"] == "completed"
+        assert data["status"] == "queued"
+        assert data["status_url"] == f"/rad/jobs/{data['job_id']}"
         assert "created_at" in data
 
     def test_enrich_with_domain(self, test_client, mock_supabase):
@@ -41,7 +43,7 @@ class TestEnrichmentEndpoint:
             }
         )
 
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_202_ACCEPTED
         data = response.json()
         assert data["email"] == "john@acme.com"
 
@@ -78,20 +80,29 @@ class TestEnrichmentEndpoint:
             json={"email": "JOHN@ACME.COM"}
         )
 
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_202_ACCEPTED
         data = response.json()
         assert data["email"] == "john@acme.com"
 
     def test_enrich_stores_finalize_data(self, test_client, mock_supabase):
         """
-        POST /rad/enrich: Should write to finalize_data via Supabase.
-        """
-        response = test_client.post(
-            "/rad/enrich",
-            json={"email": "john@acme.com"}
-        )
-
-        assert response.status_code == status.HTTP_200_OK
+        POST /rad/enrich: The queued job should write to finalize_data via Supabase.
+        """
+        # Entering the client keeps one event loop (and the job workers) running
+        with test_client:
+            response = test_client.post(
+                "/rad/enrich",
+                json={"email": "john@acme.com"}
+            )
+            assert response.status_code == status.HTTP_202_ACCEPTED
+
+            job = test_client.get(response.json()["status_url"]).json()
+            for _ in range(200):
+                if job["status"] in ("completed", "failed"):
+                    break
+                time.sleep(0.05)
+                job = test_client.get(response.json()["status_url"]).json()
+        assert job["status"] == "completed"
 
         # Verify data was written to mock storage
         finalized = mock_supabase.get_finalize_data("john@acme.com")
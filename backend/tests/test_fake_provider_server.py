@@ -0,0 +1,115 @@
+"""
+Tests for the provider stand-in server (scripts/fake_provider_server.py).
+Drives the real enrichment clients against it through the pooled HTTP client.
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services import http_pool, rate_limiter, circuit_breaker, retry_policy
+from app.services.http_pool import HTTPClientPool
+from app.services.enrichment_apis import (
+    ApolloAPI,
+    PDLAPI,
+    HunterAPI,
+    GNewsAPI,
+    ZoomInfoAPI,
+    EnrichmentAPIError,
+    provider_base_url,
+)
+
+_spec = importlib.util.spec_from_file_location(
+    "fake_provider_server", Path(__file__).parent.parent / "scripts" / "fake_provider_server.py"
+)
+fake_provider_server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fake_provider_server)
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """
+    Fixture: zero-latency stand-in server wired into the global HTTP pool.
+    Returns the server's FakeProviders state.
+    """
+    app = fake_provider_server.create_app({"default": {"median_ms": 0}}, seed=1)
+    pool = HTTPClientPool(transport=httpx.ASGITransport(app=app))
+    monkeypatch.setattr(http_pool, "_http_pool", pool)
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+    monkeypatch.setattr(retry_policy, "_retry_budgets", {})
+    monkeypatch.setattr(settings, "RETRY_BASE_DELAY", 0.0)
+    monkeypatch.setattr(settings, "PROVIDER_BASE_URL", "http://fake-providers")
+    yield app.state.providers
+
+
+class TestBaseURLOverride:
+    """Tests for pointing clients at another base URL."""
+
+    def test_global_and_per_provider_override(self, monkeypatch):
+        """provider_base_url: <SRC>_BASE_URL beats PROVIDER_BASE_URL beats the vendor URL."""
+        monkeypatch.setattr(settings, "PROVIDER_BASE_URL", None)
+        assert provider_base_url("pdl", "https://api.example.com") == "https://api.example.com"
+
+        monkeypatch.setattr(settings, "PROVIDER_BASE_URL", "http://localhost:8900/")
+        assert PDLAPI(api_key="k").base_url == "http://localhost:8900/pdl"
+
+        monkeypatch.setenv("PDL_BASE_URL", "http://pdl-stub:9000/v5/")
+        assert PDLAPI(api_key="k").base_url == "http://pdl-stub:9000/v5"
+
+
+class TestFakeProviderServer:
+    """Tests for the stand-in endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_serves_every_client(self, fake_server):
+        """Every real client parses the stand-in's responses."""
+        email, domain = "jane.doe@initech.com", "initech.com"
+
+        apollo = await ApolloAPI(api_key="fake").enrich(email)
+        pdl = await PDLAPI(api_key="fake").enrich(email)
+        company = await PDLAPI(api_key="fake").enrich_company(domain)
+        hunter = await HunterAPI(api_key="fake").enrich(email)
+        news = await GNewsAPI(api_key="fake").enrich(email, domain, company_name="Initech")
+        zoominfo = await ZoomInfoAPI(api_key="fake").enrich(email, domain)
+        bulk = await PDLAPI(api_key="fake").enrich_many([email, "bob@initech.com"])
+
+        assert apollo["first_name"] == "Jane" and apollo["company_name"] == "Initech"
+        assert pdl["last_name"] == "Doe" and pdl["experience"]
+        assert company["display_name"] == "Initech"
+        assert hunter["score"] is not None
+        assert news["result_count"] == GNewsAPI.max_results
+        assert zoominfo["company_name"] == "Initech"
+        assert set(bulk) == {email, "bob@initech.com"}
+        assert fake_server.stats["pdl.person"]["200"] == 1
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_and_throttling(self, fake_server):
+        """Configured errors and 429 bursts surface through the real error handling."""
+        fake_server.overrides["pdl.person"] = {"error_rate": 1.0, "error_status": 502}
+        fake_server.overrides["hunter.email_verifier"] = {"throttle_rate": 1.0, "retry_after": 30}
+
+        with pytest.raises(EnrichmentAPIError) as failed:
+            await PDLAPI(api_key="fake").enrich("a@initech.com")
+        with pytest.raises(EnrichmentAPIError) as throttled:
+            await HunterAPI(api_key="fake").enrich("a@initech.com")
+
+        assert failed.value.status_code == 502
+        assert throttled.value.status_code == 429
+        assert rate_limiter.get_rate_limiter("hunter").stats()["throttled"] == 1
+
+    def test_latency_distribution(self):
+        """latency: Samples follow the configured median."""
+        providers = fake_provider_server.FakeProviders({"default": {"median_ms": 100, "p95_ms": 400}}, seed=7)
+        samples = sorted(providers.latency(providers.profile("apollo.match")) for _ in range(2000))
+        assert 0.08 < samples[1000] < 0.12
+
+    def test_payload_padding(self):
+        """person_record: payload_kb adds roughly that much unused JSON."""
+        small = fake_provider_server.person_record("a@b.com", 0)
+        padded = fake_provider_server.person_record("a@b.com", 50)
+        assert len(json.dumps(padded)) - len(json.dumps(small)) > 45 * 1024
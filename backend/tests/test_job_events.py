@@ -0,0 +1,210 @@
+"""
+Tests for job progress events and GET /rad/jobs/{job_id}/events (SSE).
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from app.main import app
+from app.routes import enrichment
+from app.services import job_events, job_queue
+from app.services.job_events import JobEventBus, emit_job_event, job_events_scope
+from app.services.job_queue import JobQueue
+from app.services.llm_service import LLMService
+from app.services.rad_orchestrator import RADOrchestrator, get_rad_orchestrator
+from app.services.supabase_client import get_supabase_client
+
+
+def parse_sse(body: str) -> list:
+    """Split an SSE body into (id, event, data) tuples, skipping comments."""
+    messages = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            messages.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return messages
+
+
+class TestJobEventBus:
+    """Tests for the in-process pub/sub."""
+
+    @pytest.mark.asyncio
+    async def test_replays_history_then_live_until_terminal(self):
+        """subscribe: Late subscribers get past events, then live ones, then stop."""
+        bus = JobEventBus()
+        bus.publish("job-1", "stage", {"stage": "enriching"})
+        received = []
+
+        async def listen():
+            async for message in bus.subscribe("job-1"):
+                received.append(message.event)
+
+        listener = asyncio.create_task(listen())
+        await asyncio.sleep(0)
+        bus.publish("job-1", "profile", {"first_name": "Jane"})
+        bus.publish("job-1", "completed", {})
+        bus.publish("job-1", "pdf_ready", {})
+        await asyncio.wait_for(listener, 1)
+
+        assert received == ["stage", "profile", "completed"]
+        assert bus.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_event_id_and_custom_terminal(self):
+        """subscribe: `after` skips seen events; `terminal` can extend the stream."""
+        bus = JobEventBus()
+        for event in ("stage", "profile", "completed", "pdf_ready"):
+            bus.publish("job-1", event)
+
+        received = [m.event async for m in bus.subscribe("job-1", after=1, terminal=("failed", "pdf_ready"))]
+
+        assert received == ["profile", "completed", "pdf_ready"]
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_yields_none_when_idle(self):
+        """subscribe: Idle streams yield None every `heartbeat` seconds."""
+        bus = JobEventBus()
+        bus.publish("job-1", "stage")
+        stream = bus.subscribe("job-1", heartbeat=0.01)
+
+        assert (await stream.__anext__()).event == "stage"
+        assert await stream.__anext__() is None
+        await stream.aclose()
+
+    def test_finished_jobs_expire(self):
+        """_expire: Finished jobs are dropped after the retention period."""
+        bus = JobEventBus(retention_seconds=0)
+        bus.publish("old", "completed")
+        bus.publish("new", "stage")
+
+        assert not bus.known("old") and bus.known("new")
+
+    def test_emit_outside_scope_is_noop(self, monkeypatch):
+        """emit_job_event: Without a job_events_scope nothing is published."""
+        bus = JobEventBus()
+        monkeypatch.setattr(job_events, "_job_event_bus", bus)
+
+        emit_job_event("profile", {"first_name": "Jane"})
+        with job_events_scope("job-1"):
+            emit_job_event("profile", {"first_name": "Jane"})
+
+        assert bus.stats()["published"] == 1 and bus.known("job-1")
+
+
+class TestPipelineEvents:
+    """Tests for events published by the orchestrator and LLMService."""
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_and_llm_publish_progress(self, monkeypatch, mock_supabase):
+        """enrich/generate_ebook_personalization: Providers, profile and hook are published."""
+        bus = JobEventBus()
+        monkeypatch.setattr(job_events, "_job_event_bus", bus)
+        orchestrator = RADOrchestrator(mock_supabase)
+
+        with job_events_scope("job-1"):
+            profile = await orchestrator.enrich("jane.doe@acme.com")
+            await LLMService().generate_ebook_personalization(profile=profile, user_context={})
+
+        events = [m async for m in bus.subscribe("job-1", terminal=("ebook_hook",))]
+        providers = {m.data["source"] for m in events if m.event == "provider"}
+        [resolved] = [m.data for m in events if m.event == "profile"]
+
+        assert set(profile["data_sources"]) <= providers
+        assert resolved["company_name"] == profile["company_name"]
+        assert resolved["data_sources"] == profile["data_sources"]
+        assert events[-1].data["personalized_hook"]
+
+
+class TestJobEventStream:
+    """Tests for GET /rad/jobs/{job_id}/events."""
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch, mock_supabase):
+        """Fixture: fresh queue and bus, and a pipeline that waits for `release`."""
+        state = {"release": asyncio.Event()}
+
+        async def personalize(job_id, request, supabase, orchestrator, lease=None):
+            emit_job_event("profile", {"first_name": "Jane", "company_name": "Acme"})
+            await state["release"].wait()
+            return {"data_sources": ["apollo"]}
+
+        monkeypatch.setattr(job_queue, "_job_queue", JobQueue(workers=2, max_size=5))
+        monkeypatch.setattr(job_events, "_job_event_bus", JobEventBus())
+        monkeypatch.setattr(enrichment, "_personalize", personalize)
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_rad_orchestrator] = lambda: RADOrchestrator(mock_supabase)
+        yield state
+        app.dependency_overrides.clear()
+
+    @asynccontextmanager
+    async def client(self):
+        """In-loop ASGI client (workers share the test's event loop)."""
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+        await job_queue.get_job_queue().stop()
+
+    @pytest.mark.asyncio
+    async def test_streams_stages_until_completed(self, pipeline):
+        """GET /rad/jobs/{job_id}/events: Partial profile first, result last."""
+        async with self.client() as client:
+            job = (await client.post("/rad/enrich", json={"email": "jane@acme.com"})).json()
+            asyncio.get_running_loop().call_later(0.02, pipeline["release"].set)
+            response = await client.get(job["events_url"])
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = parse_sse(response.text)
+        assert [event for _, event, _ in messages] == ["stage", "stage", "profile", "stage", "completed"]
+        assert messages[2][2]["company_name"] == "Acme"
+        assert messages[-1][2]["result"] == {"data_sources": ["apollo"]}
+
+        async with self.client() as client:
+            resumed = await client.get(job["events_url"], headers={"Last-Event-ID": "3"})
+        assert [event for _, event, _ in parse_sse(resumed.text)] == ["stage", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_job_gets_leader_events(self, pipeline):
+        """GET /rad/jobs/{job_id}/events: A job sharing another's run streams that run's events."""
+        async with self.client() as client:
+            leader = (await client.post("/rad/enrich", json={"email": "jane@acme.com"})).json()
+            follower = (await client.post("/rad/enrich", json={"email": "jane@acme.com"})).json()
+            asyncio.get_running_loop().call_later(0.02, pipeline["release"].set)
+            response = await client.get(follower["events_url"])
+
+        messages = parse_sse(response.text)
+        events = [event for _, event, _ in messages]
+        assert events[:3] == ["stage", "stage", "coalesced"] and events[-1] == "completed"
+        assert messages[2][2]["leader_job_id"] == leader["job_id"]
+        assert "profile" in events
+        assert messages[-1][2]["result"] == {"data_sources": ["apollo"]}
+
+    @pytest.mark.asyncio
+    async def test_until_pdf_ready(self, pipeline):
+        """GET /rad/jobs/{job_id}/events?until=pdf_ready: Stream stays open for the PDF."""
+        pipeline["release"].set()
+        async with self.client() as client:
+            job = (await client.post("/rad/enrich", json={"email": "jane@acme.com"})).json()
+            await job_queue.get_job_queue().join()
+            enrichment._publish_pdf_ready(job["job_id"], {"pdf_url": "https://cdn/x.pdf"})
+            response = await client.get(f"{job['events_url']}?until=pdf_ready")
+
+        _, event, data = parse_sse(response.text)[-1]
+        assert (event, data["pdf_url"]) == ("pdf_ready", "https://cdn/x.pdf")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_job_row(self, pipeline, mock_supabase):
+        """GET /rad/jobs/{job_id}/events: Jobs unknown to this process stream from the DB."""
+        job_id = str(mock_supabase.create_job(email="jane@acme.com")["id"])
+        mock_supabase.update_job_status(job_id, "failed", stage="generating", error_message="LLM down")
+
+        async with self.client() as client:
+            response = await client.get(f"/rad/jobs/{job_id}/events")
+            missing = await client.get("/rad/jobs/missing/events")
+
+        [(_, stage, stage_data), (_, outcome, outcome_data)] = parse_sse(response.text)
+        assert (stage, stage_data["stage"]) == ("stage", "generating")
+        assert (outcome, outcome_data["error_message"]) == ("failed", "LLM down")
+        assert missing.status_code == 404
@@ -0,0 +1,173 @@
+"""
+Tests for the personalization job queue behind POST /rad/enrich.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from app.main import app
+from app.routes import enrichment
+from app.services import job_queue
+from app.services.job_queue import JobQueue, QueueFullError
+from app.services.rad_orchestrator import RADOrchestrator, get_rad_orchestrator
+from app.services.supabase_client import get_supabase_client
+
+
+class TestJobQueue:
+    """Tests for the bounded worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_workers_bound_concurrency(self):
+        """_worker: No more than `workers` jobs run at once; all finish."""
+        queue = JobQueue(workers=2, max_size=10)
+        running, peak, done = [0], [0], []
+
+        async def job(n):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            done.append(n)
+
+        for n in range(6):
+            queue.submit(str(n), lambda n=n: job(n))
+        await queue.join()
+        await queue.stop()
+
+        assert sorted(done) == list(range(6))
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        """submit: Past max_size waiting jobs, submit raises QueueFullError."""
+        queue = JobQueue(workers=1, max_size=1)
+        release = asyncio.Event()
+
+        queue.submit("running", release.wait)
+        await asyncio.sleep(0)  # Worker takes the first job
+        queue.submit("waiting", release.wait)
+
+        with pytest.raises(QueueFullError):
+            queue.submit("rejected", release.wait)
+        release.set()
+        await queue.join()
+        await queue.stop()
+        assert queue.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_job_keeps_worker(self):
+        """_worker: A job that raises is counted and the worker moves on."""
+        queue = JobQueue(workers=1, max_size=10)
+        done = []
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def ok():
+            done.append(True)
+
+        queue.submit("bad", boom)
+        queue.submit("good", ok)
+        await queue.join()
+        await queue.stop()
+
+        assert done == [True]
+        assert queue.stats()["failed"] == 1
+
+
+class TestEnrichJobs:
+    """Tests for POST /rad/enrich queueing and GET /rad/jobs/{job_id}."""
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch, mock_supabase):
+        """Fixture: fresh queue, mocked dependencies and a pipeline that waits for `release`."""
+        state = {"release": asyncio.Event()}
+
+        async def personalize(job_id, request, supabase, orchestrator, lease=None):
+            enrichment._record_job(supabase, job_id, "processing", stage=enrichment.JOB_STAGE_GENERATING)
+            await state["release"].wait()
+            return {"data_sources": ["apollo"], "data_quality_score": 0.8}
+
+        monkeypatch.setattr(job_queue, "_job_queue", JobQueue(workers=2, max_size=5))
+        monkeypatch.setattr(enrichment, "_personalize", personalize)
+        app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+        app.dependency_overrides[get_rad_orchestrator] = lambda: RADOrchestrator(mock_supabase)
+        yield state
+        app.dependency_overrides.clear()
+
+    @asynccontextmanager
+    async def client(self):
+        """In-loop ASGI client (workers share the test's event loop)."""
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+        await job_queue.get_job_queue().stop()
+
+    @pytest.mark.asyncio
+    async def test_enrich_returns_202_and_reports_stages(self, pipeline):
+        """POST /rad/enrich: Returns 202 before the pipeline runs; the job reports stages."""
+        async with self.client() as client:
+            response = await client.post("/rad/enrich", json={"email": "Jane@Acme.com"})
+
+            assert response.status_code == 202
+            body = response.json()
+            assert body["status"] == "queued" and body["email"] == "jane@acme.com"
+
+            await asyncio.sleep(0.01)
+            job = (await client.get(body["status_url"])).json()
+            assert (job["status"], job["stage"]) == ("processing", "generating")
+
+            pipeline["release"].set()
+            await job_queue.get_job_queue().join()
+            job = (await client.get(body["status_url"])).json()
+
+        assert (job["status"], job["stage"]) == ("completed", "done")
+        assert job["result"]["data_sources"] == ["apollo"]
+        assert job["completed_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_stage_updates_keep_started_at(self, pipeline, mock_supabase):
+        """_record_job: started_at is the pickup time, not the start of the last stage."""
+        async with self.client() as client:
+            job_id = (await client.post("/rad/enrich", json={"email": "jane@acme.com"})).json()["job_id"]
+            await asyncio.sleep(0.01)
+            started_at = mock_supabase.get_job(job_id)["started_at"]
+
+            await asyncio.sleep(0.01)
+            enrichment._record_job(mock_supabase, job_id, "processing", stage=enrichment.JOB_STAGE_STORING)
+            pipeline["release"].set()
+            await job_queue.get_job_queue().join()
+
+        assert started_at is not None
+        assert mock_supabase.get_job(job_id)["started_at"] == started_at
+
+    @pytest.mark.asyncio
+    async def test_full_queue_returns_503(self, pipeline):
+        """POST /rad/enrich: A full queue answers 503 with Retry-After."""
+        async with self.client() as client:
+            responses = []
+            for i in range(8):
+                responses.append(await client.post("/rad/enrich", json={"email": f"user{i}@acme.com"}))
+                await asyncio.sleep(0)  # Let idle workers pick jobs up
+            pipeline["release"].set()
+
+        assert [r.status_code for r in responses].count(202) == 7  # 2 running + 5 waiting
+        assert responses[-1].status_code == 503
+        assert responses[-1].headers["Retry-After"] == "5"
+
+    @pytest.mark.asyncio
+    async def test_disposable_rejected_before_queueing(self, pipeline, mock_supabase):
+        """POST /rad/enrich: Disposable addresses get 400 and no job."""
+        async with self.client() as client:
+            response = await client.post("/rad/enrich", json={"email": "temp@mailinator.com"})
+
+        assert response.status_code == 400
+        assert mock_supabase._mock_jobs == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_404(self, pipeline):
+        """GET /rad/jobs/{job_id}: Unknown ids are 404."""
+        async with self.client() as client:
+            assert (await client.get("/rad/jobs/missing")).status_code == 404
@@ -3,11 +3,14 @@ Tests for LLM service personalization generation.
 Uses mock mode (no real API calls) for predictable testing.
 """
 
+import asyncio
+import json
+import time
 import pytest
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from app.services.llm_service import LLMService, MAX_INTRO_LENGTH, MAX_CTA_LENGTH
+from app.services.llm_service import COMBINED_FIELDS, LLMService, MAX_INTRO_LENGTH, MAX_CTA_LENGTH
 
 
 class TestLLMService:
@@ -348,3 +351,120 @@ class TestPromptBuilding:
         assert "JSON" in system_prompt
         assert "intro_hook" in system_prompt
         assert "cta" in system_prompt
+
+
+class TestCombinedPersonalization:
+    """Tests for one-call ebook + intro/CTA generation."""
+
+    OUTPUT = {
+        "intro_hook": "Acme is scaling AI fast.",
+        "cta": "Get the Acme readiness guide",
+        "personalized_hook": "Acme, with 500 employees...",
+        "case_study_framing": "Like Acme, KT Cloud cut costs 25%...",
+        "personalized_cta": "Discover where Acme stands.",
+    }
+
+    @pytest.fixture
+    def llm_service(self):
+        """Fixture: LLM service with a stand-in provider."""
+        service = LLMService()
+        service.providers = [{"name": "anthropic", "client": None, "model": "test"}]
+        return service
+
+    @pytest.mark.asyncio
+    async def test_one_call_yields_both_shapes(self, llm_service):
+        """generate_combined_personalization: One LLM call fills ebook and legacy results."""
+        content = f"```json\n{json.dumps(self.OUTPUT)}\n```"
+        with patch.object(llm_service, "_call_with_fallback", return_value=(content, "anthropic")) as call:
+            combined = await llm_service.generate_combined_personalization(
+                {"first_name": "Jane", "company_name": "Acme"}, {"goal": "awareness"}
+            )
+
+        assert call.call_count == 1
+        system_prompt, prompt = call.call_args.args
+        assert "intro_hook" in system_prompt and "case_study_framing" in system_prompt
+        assert "5. cta" in prompt
+
+        ebook, legacy = LLMService.split_combined_personalization(combined)
+        assert ebook["personalized_hook"] == self.OUTPUT["personalized_hook"]
+        assert "intro_hook" not in ebook
+        assert (legacy["intro_hook"], legacy["cta"]) == (self.OUTPUT["intro_hook"], self.OUTPUT["cta"])
+        assert legacy["model_used"] == ebook["model_used"] == "anthropic"
+
+    @pytest.mark.parametrize("field", COMBINED_FIELDS)
+    def test_parser_requires_every_field(self, llm_service, field):
+        """_parse_combined_response: A missing or blank field rejects the response."""
+        missing = {k: v for k, v in self.OUTPUT.items() if k != field}
+        blank = {**self.OUTPUT, field: "  "}
+
+        assert llm_service._parse_combined_response(json.dumps(missing)) is None
+        assert llm_service._parse_combined_response(json.dumps(blank)) is None
+
+    def test_parser_trims_legacy_fields(self, llm_service):
+        """_parse_combined_response: intro_hook/cta are cut to the legacy length limits."""
+        long = {**self.OUTPUT, "intro_hook": "x" * 500, "cta": "y" * 500}
+
+        parsed = llm_service._parse_combined_response(json.dumps(long))
+
+        assert len(parsed["intro_hook"]) == MAX_INTRO_LENGTH
+        assert len(parsed["cta"]) == MAX_CTA_LENGTH
+
+    @pytest.mark.asyncio
+    async def test_unparseable_output_falls_back_to_mock(self, llm_service):
+        """generate_combined_personalization: Bad output yields the mock with all five fields."""
+        with patch.object(llm_service, "_call_with_fallback", return_value=("not json", "anthropic")):
+            combined = await llm_service.generate_combined_personalization({"company_name": "Acme"})
+
+        assert combined["model_used"] == "mock"
+        assert all(combined[field] for field in COMBINED_FIELDS)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_generate_in_parallel(self):
+        """generate_combined_personalization: The LLM call does not hold the event loop."""
+        def create(**kwargs):
+            time.sleep(0.1)
+            return MagicMock(content=[MagicMock(text=json.dumps(self.OUTPUT))])
+
+        client = MagicMock()
+        client.messages.create.side_effect = create
+        service = LLMService()
+        service.providers = [{"name": "anthropic", "client": client, "model": "test"}]
+
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *[service.generate_combined_personalization({"company_name": "Acme"}) for _ in range(3)]
+        )
+
+        assert [r["model_used"] for r in results] == ["anthropic"] * 3
+        assert time.monotonic() - started < 0.25  # Not 3 x 0.1s back to back
+
+
+class TestProviderCalls:
+    """Tests for provider calls sharing the event loop with job workers."""
+
+    @pytest.mark.asyncio
+    async def test_provider_call_does_not_block_event_loop(self):
+        """_call_with_fallback: Blocking SDK calls and retry backoff leave the loop running."""
+        def slow_create(**kwargs):
+            time.sleep(0.1)
+            raise RuntimeError("overloaded")
+
+        client = MagicMock()
+        client.messages.create.side_effect = slow_create
+        service = LLMService()
+        service.providers = [{"name": "anthropic", "client": client, "model": "test"}]
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        with patch("app.services.llm_service.RETRY_DELAY_SECONDS", 0.1):
+            content, provider = await service._call_with_fallback("sys", "user")
+        ticker.cancel()
+
+        assert (content, provider) == (None, "none")
+        assert client.messages.create.call_count == 2
+        assert len(ticks) > 10  # ~0.3s of calls and backoff, ticking every 10ms
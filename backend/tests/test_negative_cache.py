@@ -0,0 +1,94 @@
+"""
+Tests for the negative cache of provider "no match" results.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.negative_cache import NegativeCache
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+NOT_FOUND = {"_error": "No pdl match", "_not_found": True}
+
+
+class TestNegativeCache:
+    """Tests for NegativeCache membership and TTLs."""
+
+    def test_add_then_contains(self):
+        """contains: Misses are remembered per source and key."""
+        cache = NegativeCache(max_entries=10, ttl=60)
+        assert not cache.contains("pdl", "nobody@acme.com")
+
+        cache.add("pdl", "nobody@acme.com")
+
+        assert cache.contains("pdl", "nobody@acme.com")
+        assert not cache.contains("apollo", "nobody@acme.com")
+        assert cache.stats()["hits"] == 1
+
+    def test_per_source_ttl(self, monkeypatch):
+        """add: NEGATIVE_CACHE_TTL_<SOURCE> overrides the default TTL."""
+        monkeypatch.setenv("NEGATIVE_CACHE_TTL_PDL", "-1")
+        cache = NegativeCache(max_entries=10, ttl=60)
+
+        cache.add("pdl", "nobody@acme.com")
+        cache.add("apollo", "nobody@acme.com")
+
+        assert not cache.contains("pdl", "nobody@acme.com")
+        assert cache.contains("apollo", "nobody@acme.com")
+        assert cache.stats()["expired"] == 1
+
+    def test_lru_eviction(self):
+        """add: The least recently used key is dropped past max_entries."""
+        cache = NegativeCache(max_entries=2, ttl=60)
+        cache.add("pdl", "a@x.com")
+        cache.add("pdl", "b@x.com")
+        cache.contains("pdl", "a@x.com")
+        cache.add("pdl", "c@x.com")
+
+        assert cache.contains("pdl", "a@x.com")
+        assert not cache.contains("pdl", "b@x.com")
+        assert cache.stats()["evictions"] == 1
+
+
+class TestOrchestratorNegativeCache:
+    """Tests for negative caching in RADOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, mock_supabase):
+        """Fixture: orchestrator with a private negative cache and a PDL that never matches."""
+        orchestrator = RADOrchestrator(mock_supabase, negative_cache=NegativeCache(max_entries=100, ttl=60))
+        orchestrator.apis["pdl"].enrich = AsyncMock(return_value=NOT_FOUND)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_miss_skips_next_call(self, orchestrator, mock_supabase):
+        """enrich: A PDL miss is not stored and not paid for twice."""
+        await orchestrator.enrich("ghost@nowhere.io")
+        result = await orchestrator.enrich("ghost@nowhere.io")
+
+        orchestrator.apis["pdl"].enrich.assert_awaited_once()
+        assert result["skipped_reasons"]["pdl"] == "not_found"
+        assert not [row for row in mock_supabase._mock_raw_data if row["source"] == "pdl"]
+
+    @pytest.mark.asyncio
+    async def test_company_miss_keyed_by_domain(self, orchestrator):
+        """_fetch_pdl_company: A company miss covers every colleague at the domain."""
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(return_value=NOT_FOUND)
+
+        await orchestrator._fetch_pdl_company("unknown-co.io")
+        data = await orchestrator._fetch_pdl_company("www.Unknown-Co.io")
+
+        orchestrator.apis["pdl"].enrich_company.assert_awaited_once()
+        assert data["_skipped"] == "not_found"
+
+    @pytest.mark.asyncio
+    async def test_bulk_skips_known_misses(self, orchestrator):
+        """_prefetch_bulk: Known misses are left out of bulk calls."""
+        orchestrator.negative_cache.add("pdl", "ghost@acme.com")
+        orchestrator.apis["pdl"].enrich_many = AsyncMock(return_value={"jane@acme.com": {"first_name": "Jane"}})
+
+        prefetched = await orchestrator._prefetch_bulk(["jane@acme.com", "ghost@acme.com"])
+
+        orchestrator.apis["pdl"].enrich_many.assert_awaited_once_with(["jane@acme.com"])
+        assert prefetched["pdl"]["ghost@acme.com"]["_not_found"]
@@ -0,0 +1,81 @@
+"""
+Tests for single-pass news analytics.
+"""
+
+from app.services.news_analytics import analyze_article, analyze_articles
+
+
+class TestAnalyzeArticle:
+    """Tests for per-article scoring."""
+
+    def test_whole_words_only(self):
+        """analyze_article: Keywords never match inside other words."""
+        scores = analyze_article({"title": "CEO said HTML glossy", "content": ""})
+        assert "AI adoption" not in scores["theme_scores"]
+        assert scores["sentiment"]["negative"] == 0  # "loss" in "glossy"
+        assert analyze_article({"title": "Data centerpiece"})["category"] == "general"
+
+    def test_phrases_stop_at_sentence_boundaries(self):
+        """analyze_article: Multi-word keywords never span punctuation that ends a clause."""
+        assert analyze_article({"title": "We have data. Center stage"})["category"] == "general"
+        assert analyze_article({"title": "New data-center push"})["category"] == "ai_technology"
+
+    def test_counts_and_title_weight(self):
+        """analyze_article: Counts every hit; title hits weigh more."""
+        scores = analyze_article({
+            "title": "Acme doubles down on AI",
+            "content": "AI and machine learning drive AI revenue growth.",
+        })
+        ai = scores["theme_scores"]["AI adoption"]
+        assert ai["count"] == 4  # 3x "ai" + "machine learning"
+        assert ai["weight"] == 5.0  # title hit x2
+        assert scores["sentiment"]["positive"] == 1
+        assert scores["themes"][0] == "AI adoption"
+
+    def test_plurals_and_punctuation(self):
+        """analyze_article: Plurals and punctuation-adjacent words match."""
+        scores = analyze_article({"title": "Layoffs hit; data centers expand", "content": ""})
+        assert scores["sentiment"]["negative"] == 1
+        assert scores["category"] == "ai_technology"  # "data center(s)"
+        assert "Data strategy" in scores["theme_scores"]
+
+    def test_category_order(self):
+        """analyze_article: First matching category in rule order wins."""
+        assert analyze_article({"title": "CEO unveils AI chip"})["category"] == "ai_technology"
+        assert analyze_article({"title": "Quarterly update"})["category"] == "general"
+
+
+class TestAnalyzeArticles:
+    """Tests for batch scoring."""
+
+    def test_batch_matches_sum_of_articles(self):
+        """analyze_articles: Aggregates equal the per-article totals."""
+        articles = [
+            {"title": "Cloud growth", "content": "Record cloud revenue."},
+            {"title": "Security lawsuit", "content": "A privacy lawsuit and a decline."},
+        ]
+
+        batch = analyze_articles(articles)
+        singles = [analyze_article(a) for a in articles]
+
+        for label in ("positive", "negative", "neutral"):
+            assert batch["sentiment"][label] == sum(s["sentiment"][label] for s in singles)
+        assert batch["theme_scores"]["Cloud transformation"]["count"] == 2
+        assert batch["themes"][0] == "Cloud transformation"
+
+    def test_phrases_never_span_articles(self):
+        """analyze_articles: A phrase split across two articles is not counted."""
+        batch = analyze_articles([
+            {"title": "Vendors bet on the machine", "content": "New joint"},
+            {"title": "Learning from outages", "content": "Venture teams"},
+        ])
+
+        assert "AI adoption" not in batch["theme_scores"]  # "machine" + "learning"
+        assert "Partnership" not in batch["theme_scores"]  # "joint" + "venture"
+
+    def test_empty(self):
+        assert analyze_articles([]) == {
+            "themes": [],
+            "theme_scores": {},
+            "sentiment": {"positive": 0, "negative": 0, "neutral": 0},
+        }
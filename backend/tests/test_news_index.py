@@ -0,0 +1,126 @@
+"""
+Tests for the per-company GNews index.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from app.services.enrichment_apis import GNewsAPI, EnrichmentAPIError
+from app.services.news_index import NewsIndex, canonical_company_name, categorize_article
+
+
+def article(url, title, days_ago=1):
+    published = (datetime.utcnow() - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {"url": url, "title": title, "content": "", "published_at": published}
+
+
+class TestHelpers:
+    """Tests for name canonicalization and local categorization."""
+
+    def test_canonical_company_name(self):
+        assert canonical_company_name("Acme, Inc.") == "acme"
+        assert canonical_company_name("ACME Corporation") == "acme"
+        assert canonical_company_name("Johnson & Johnson") == "johnson & johnson"
+
+    def test_categorize_article(self):
+        assert categorize_article({"title": "Acme bets on generative AI"}) == "ai_technology"
+        assert categorize_article({"title": "Acme appoints new CFO"}) == "leadership"
+        assert categorize_article({"title": "Acme acquires Widgets Co"}) == "growth"
+        # Word boundaries: "said" must not match "ai"
+        assert categorize_article({"title": "Acme said little at the event"}) == "general"
+
+
+class TestNewsIndex:
+    """Tests for NewsIndex refresh behavior."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_served_without_search(self):
+        """get_articles: Same company (any spelling) hits the index."""
+        index = NewsIndex(refresh_seconds=3600)
+        search = AsyncMock(return_value=[article("u1", "Acme launches product")])
+
+        await index.get_articles("Acme Inc", search)
+        articles = await index.get_articles("acme", search)
+
+        assert search.await_count == 1
+        assert articles[0]["query_category"] == "innovation"
+        assert index.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_search(self):
+        """get_articles: Simultaneous misses for one company (any spelling) search once."""
+        index = NewsIndex(refresh_seconds=3600)
+
+        async def slow_search(company_name, since):
+            await asyncio.sleep(0.01)
+            return [article("u1", "Acme launches product")]
+
+        search = AsyncMock(side_effect=slow_search)
+        results = await asyncio.gather(*[index.get_articles(name, search) for name in ("Acme", "Acme Inc", "ACME")])
+
+        assert search.await_count == 1
+        assert [len(articles) for articles in results] == [1, 1, 1]
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_uses_newest_date(self):
+        """get_articles: A refresh only asks for articles after the newest one."""
+        index = NewsIndex(refresh_seconds=1)
+        first = [article("u1", "Old news", days_ago=3), article("u2", "Newer news", days_ago=2)]
+        search = AsyncMock(side_effect=[first, [article("u3", "Latest news", days_ago=0)]])
+
+        await index.get_articles("Acme", search)
+        index._entries["acme"]["refreshed_at"] -= 10
+        articles = await index.get_articles("Acme", search)
+
+        assert search.await_args_list[0].args == ("Acme", None)
+        assert search.await_args_list[1].args == ("Acme", first[1]["published_at"])
+        assert [a["url"] for a in articles] == ["u3", "u2", "u1"]
+        assert index.stats()["incremental_fetches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_old_articles_pruned(self):
+        """_merge: Articles past max_age_days are dropped."""
+        index = NewsIndex(max_age_days=30)
+        search = AsyncMock(return_value=[article("u1", "Ancient", days_ago=90), article("u2", "Recent")])
+
+        articles = await index.get_articles("Acme", search)
+
+        assert [a["url"] for a in articles] == ["u2"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_serves_indexed_articles(self):
+        """get_articles: Provider errors fall back to the existing entry."""
+        index = NewsIndex(refresh_seconds=1)
+        search = AsyncMock(side_effect=[[article("u1", "News")], EnrichmentAPIError("gnews", "down")])
+
+        await index.get_articles("Acme", search)
+        index._entries["acme"]["refreshed_at"] -= 10
+        articles = await index.get_articles("Acme", search)
+
+        assert [a["url"] for a in articles] == ["u1"]
+        assert index.stats()["stale_served"] == 1
+
+
+class TestGNewsEnrich:
+    """Tests for GNewsAPI.enrich on top of the index."""
+
+    @pytest.mark.asyncio
+    async def test_single_search_per_company(self, monkeypatch):
+        """enrich: One search feeds every employee of the same company."""
+        index = NewsIndex()
+        monkeypatch.setattr("app.services.enrichment_apis.get_news_index", lambda: index)
+        api = GNewsAPI(api_key="test-key")
+        api._search_news = AsyncMock(return_value=[
+            article("u1", "Initech expands AI partnership"),
+            article("u2", "Initech names new CEO"),
+        ])
+
+        first = await api.enrich("a@initech.com", "initech.com", company_name="Initech")
+        second = await api.enrich("b@initech.com", "initech.com", company_name="Initech")
+
+        assert api._search_news.await_count == 1
+        assert first["result_count"] == second["result_count"] == 2
+        assert len(first["categorized"]["leadership"]) == 1
@@ -0,0 +1,102 @@
+"""
+Tests for field-projecting provider payload decoding.
+"""
+
+import json
+import pytest
+import httpx
+
+from app.services import http_pool, rate_limiter, circuit_breaker, payload_decoding
+from app.services.http_pool import HTTPClientPool
+from app.services.enrichment_apis import PDLAPI
+from app.services.payload_decoding import (
+    PAYLOAD_SCHEMAS,
+    PayloadDecoder,
+    decode_payload,
+    get_payload_decoder,
+    project,
+)
+
+PDL_PERSON = {
+    "first_name": "jane",
+    "job_title": "cto",
+    "skills": ["python", "sql"],
+    "emails": [{"address": "jane@acme.com", "type": "professional"}],
+    "education": [{"school": {"name": "MIT", "location": {"country": "us"}}}],
+    "experience": [
+        {
+            "title": {"name": "cto", "levels": ["cxo"]},
+            "company": {"name": "acme", "size": "51-200", "location": {"geo": "1,2"}},
+            "summary": "x" * 1000,
+        }
+    ],
+}
+
+# Both decoding paths must give identical results
+DECODER_MODES = [False] + ([True] if payload_decoding.MSGSPEC_AVAILABLE else [])
+
+
+@pytest.mark.parametrize("use_msgspec", DECODER_MODES)
+class TestPayloadDecoder:
+    """Tests for projected decoding (typed structs and parse + project)."""
+
+    def test_drops_unused_fields(self, use_msgspec):
+        """decode: Only fields the schema declares are kept; ANY subtrees stay whole."""
+        decoder = PayloadDecoder(PAYLOAD_SCHEMAS["pdl.person"], use_msgspec=use_msgspec)
+        data = decoder.decode(json.dumps(PDL_PERSON).encode())
+
+        assert data["first_name"] == "jane"
+        assert data["skills"] == ["python", "sql"]
+        assert "emails" not in data and "education" not in data
+        assert data["experience"] == PDL_PERSON["experience"]
+
+    def test_missing_and_null_fields(self, use_msgspec):
+        """decode: Missing keys stay missing (so .get defaults apply); nulls are kept."""
+        decoder = PayloadDecoder(PAYLOAD_SCHEMAS["apollo.bulk_match"], use_msgspec=use_msgspec)
+        data = decoder.decode(b'{"matches": [null, {"first_name": "Jo", "organization": null}]}')
+        assert data == {"matches": [None, {"first_name": "Jo", "organization": None}]}
+
+    def test_unexpected_shape_kept(self, use_msgspec):
+        """decode: Values whose type doesn't match the schema pass through unchanged."""
+        decoder = PayloadDecoder(PAYLOAD_SCHEMAS["pdl.person"], use_msgspec=use_msgspec)
+        data = decoder.decode(b'{"experience": [{"company": "acme"}], "first_name": "J"}')
+        assert data == {"experience": [{"company": "acme"}], "first_name": "J"}
+
+    def test_invalid_json_raises(self, use_msgspec):
+        """decode: Malformed bodies raise ValueError like response.json()."""
+        decoder = PayloadDecoder(PAYLOAD_SCHEMAS["pdl.company"], use_msgspec=use_msgspec)
+        with pytest.raises(ValueError):
+            decoder.decode(b"{not json")
+
+
+class TestSchemas:
+    """Tests for the schema registry."""
+
+    def test_all_schemas_build(self):
+        """get_payload_decoder: Every declared schema yields a working decoder."""
+        for name in PAYLOAD_SCHEMAS:
+            decoder = get_payload_decoder(name)
+            assert decoder is get_payload_decoder(name)
+            assert decode_payload(name, b"null") is None
+
+    def test_project_leaves_any_untouched(self):
+        """project: ANY leaves keep nested values as-is."""
+        value = {"tags": [{"a": 1}], "other": 1}
+        assert project(value, {"tags": None}) == {"tags": [{"a": 1}]}
+
+
+@pytest.mark.asyncio
+async def test_pdl_enrich_uses_projection(monkeypatch):
+    """PDLAPI.enrich: Mapped fields are unchanged by projected decoding."""
+    pool = HTTPClientPool(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=PDL_PERSON)))
+    monkeypatch.setattr(http_pool, "_http_pool", pool)
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+
+    result = await PDLAPI(api_key="test-key").enrich("jane@acme.com")
+
+    assert result["first_name"] == "jane"
+    assert result["job_title"] == "cto"
+    # Experience entries keep the provider's full shape (stored in raw/finalize data)
+    assert result["experience"] == PDL_PERSON["experience"]
+    assert result["interests"] == []
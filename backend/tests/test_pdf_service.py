@@ -0,0 +1,126 @@
+"""
+Tests for render-once PDF artifacts (/rad/deliver, /rad/pdf, /rad/download).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.routes import enrichment
+from app.services import pdf_service
+from app.services.pdf_service import PDFArtifactCache, PDFService
+
+PROFILE = {
+    "email": "jane@acme.com",
+    "first_name": "Jane",
+    "company_name": "Acme",
+    "ebook_personalization": {
+        "personalized_hook": "Acme is scaling AI.",
+        "case_study_framing": "Like Acme, KT Cloud...",
+        "personalized_cta": "Discover where Acme stands.",
+    },
+    "user_context": {"industry_input": "technology"},
+}
+
+
+@pytest.fixture
+def render(monkeypatch):
+    """Fixture: fresh artifact cache and a stubbed PDF layout that counts calls."""
+    monkeypatch.setattr(pdf_service, "_pdf_artifact_cache", PDFArtifactCache(max_entries=10, ttl_seconds=60))
+    layout = AsyncMock(return_value=b"%PDF-1.4 rendered")
+    monkeypatch.setattr(PDFService, "_html_to_pdf", layout)
+    return layout
+
+
+class TestPDFArtifacts:
+    """Tests for PDFService.render_profile_pdf / store_artifact."""
+
+    @pytest.mark.asyncio
+    async def test_same_content_renders_once(self, render, mock_supabase):
+        """render_profile_pdf: Repeated and concurrent renders share one layout pass."""
+        service = PDFService(mock_supabase)
+
+        first, second = await asyncio.gather(
+            service.render_profile_pdf(PROFILE), service.render_profile_pdf(PROFILE)
+        )
+        third = await service.render_profile_pdf(PROFILE)
+
+        assert render.await_count == 1
+        assert first is second is third
+        assert first.case_study_used
+
+    @pytest.mark.asyncio
+    async def test_changed_content_renders_again(self, render, mock_supabase):
+        """render_profile_pdf: A different personalization is a different PDF."""
+        service = PDFService(mock_supabase)
+        changed = {**PROFILE, "ebook_personalization": {**PROFILE["ebook_personalization"], "personalized_hook": "New"}}
+
+        await service.render_profile_pdf(PROFILE)
+        await service.render_profile_pdf(changed)
+        await service.render_profile_pdf({"first_name": "Jane"}, intro_hook="Hi", cta="Read")
+
+        assert render.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_artifact_uploaded_once(self, render, mock_supabase):
+        """store_artifact: Later calls reuse the stored copy."""
+        service = PDFService(mock_supabase)
+        artifact = await service.render_profile_pdf(PROFILE)
+
+        with patch.object(service, "_store_pdf", wraps=service._store_pdf) as store:
+            first = await service.store_artifact(artifact, 1, "jane@acme.com")
+            second = await service.store_artifact(artifact, 1, "jane@acme.com")
+
+        assert store.await_count == 1
+        assert first is second
+        assert first["file_size_bytes"] == len(artifact.pdf_bytes)
+
+    @pytest.mark.asyncio
+    async def test_each_job_gets_its_own_upload(self, render, mock_supabase):
+        """store_artifact: The same PDF for another job is stored under that job's name."""
+        service = PDFService(mock_supabase)
+        artifact = await service.render_profile_pdf(PROFILE)
+
+        with patch.object(service, "_store_pdf", wraps=service._store_pdf) as store:
+            first, second = await asyncio.gather(
+                service.store_artifact(artifact, 1, "jane@acme.com"),
+                service.store_artifact(artifact, 2, "jane@acme.com"),
+            )
+
+        assert store.await_count == 2
+        assert first["storage_path"] != second["storage_path"]
+        assert render.await_count == 1
+
+
+class TestDeliveryPipeline:
+    """Tests for the PDF endpoints sharing one artifact."""
+
+    def test_deliver_pdf_download_render_once(self, render, test_client, mock_supabase, monkeypatch):
+        """/rad/deliver, /rad/pdf, /rad/download: One layout; upload runs alongside the email."""
+        mock_supabase.upsert_finalize_data("jane@acme.com", PROFILE, intro="Hi", cta="Read")
+        order = []
+
+        async def send_ebook(self, to_email, pdf_bytes, **kwargs):
+            order.append("email_start")
+            await asyncio.sleep(0.01)
+            order.append("email_done")
+            assert pdf_bytes == b"%PDF-1.4 rendered"
+            return {"success": True, "provider": "test"}
+
+        async def publish(self, pdf_bytes, email, job_id):
+            order.append("upload")
+            return {"pdf_url": "https://cdn/ebook.pdf", "storage_path": "p", "file_size_bytes": len(pdf_bytes)}
+
+        monkeypatch.setattr(enrichment.EmailService, "send_ebook", send_ebook)
+        monkeypatch.setattr(PDFService, "_publish_pdf", publish)
+
+        delivered = test_client.post("/rad/deliver/jane@acme.com")
+        stored = test_client.post("/rad/pdf/jane@acme.com")
+        downloaded = test_client.get("/rad/download/jane@acme.com")
+
+        assert delivered.status_code == stored.status_code == downloaded.status_code == 200
+        assert order == ["email_start", "upload", "email_done"]
+        assert delivered.json()["pdf_url"] == stored.json()["pdf_url"] == "https://cdn/ebook.pdf"
+        assert downloaded.content == b"%PDF-1.4 rendered"
+        assert render.await_count == 1
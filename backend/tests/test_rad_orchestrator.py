@@ -3,11 +3,19 @@ Tests for RAD orchestrator.
 Tests resolution logic and data aggregation using mock API responses.
 """
 
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.services.rad_orchestrator import RADOrchestrator, SOURCE_PRIORITY
+from app.config import settings
+from app.services.rad_orchestrator import (
+    RADOrchestrator,
+    RESOLUTION_PLAN,
+    SOURCE_PRIORITY,
+    select_fetch_plan,
+    waterfall_tiers,
+)
 
 
 @pytest.mark.asyncio
@@ -91,8 +99,6 @@ class TestRADOrchestrator:
             "tavily": {},
             "zoominfo": {}
         }
-        orchestrator.data_sources = ["apollo", "pdl", "hunter"]
-
         result = orchestrator._resolve_profile("john@acme.com", "acme.com", raw_data)
 
         # Fields should be resolved
@@ -119,8 +125,6 @@ class TestRADOrchestrator:
             "tavily": {},
             "zoominfo": {}
         }
-        orchestrator.data_sources = ["apollo", "pdl"]
-
         result = orchestrator._resolve_profile("john@acme.com", "acme.com", raw_data)
 
         # Apollo's name should win due to higher priority
@@ -232,10 +236,10 @@ class TestRADDataFlow:
         """
         enrich: data_sources list should reflect which APIs returned data.
         """
-        await orchestrator.enrich("john@acme.com")
+        result = await orchestrator.enrich("john@acme.com")
 
         # In mock mode, all APIs return mock data
-        assert len(orchestrator.data_sources) >= 0  # May be 0 if all mocked with errors
+        assert len(result["data_sources"]) >= 0  # May be 0 if all mocked with errors
 
     @pytest.mark.asyncio
     async def test_enrich_returns_complete_profile(self, orchestrator):
@@ -250,6 +254,250 @@ class TestRADDataFlow:
         assert "data_sources" in result
         assert "data_quality_score" in result
 
+    @pytest.mark.asyncio
+    async def test_enrich_batch_uses_bulk_endpoints(self, orchestrator):
+        """
+        enrich_batch: Apollo/PDL are fetched once in bulk, not per email.
+        """
+        emails = ["ann@acme.com", "bob@acme.com", "cal@acme.com"]
+        apollo_many = AsyncMock(return_value={e: {"email": e, "first_name": "Bulk"} for e in emails})
+        pdl_many = AsyncMock(return_value={e: {"email": e, "job_title": "Engineer"} for e in emails})
+        apollo_single = AsyncMock()
+        orchestrator.apis["apollo"].enrich_many = apollo_many
+        orchestrator.apis["pdl"].enrich_many = pdl_many
+        orchestrator.apis["apollo"].enrich = apollo_single
+
+        results = await orchestrator.enrich_batch(emails)
+
+        apollo_many.assert_awaited_once_with(emails)
+        pdl_many.assert_awaited_once_with(emails)
+        apollo_single.assert_not_awaited()
+        assert [r["first_name"] for r in results] == ["Bulk", "Bulk", "Bulk"]
+
+
+class TestResolutionPlan:
+    """Tests for the compiled field-resolution plan."""
+
+    def test_plan_sorted_by_priority(self):
+        """RESOLUTION_PLAN: Candidates are pre-sorted, listing order breaking ties."""
+        plan = dict(RESOLUTION_PLAN)
+
+        assert [source for source, _ in plan["company_name"]] == ["apollo", "pdl_company", "zoominfo", "pdl"]
+        for sources in plan.values():
+            priorities = [SOURCE_PRIORITY[source] for source, _ in sources]
+            assert priorities == sorted(priorities, reverse=True)
+
+    def test_first_non_empty_wins(self, mock_supabase):
+        """_resolve_profile: Empty and errored higher-priority sources fall through."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        raw_data = {
+            "apollo": {"company_name": "", "title": None},
+            "pdl_company": {"_error": "down", "name": "Stale"},
+            "zoominfo": {"company_name": "Initech"},
+            "pdl": {"job_title": "Engineer"},
+        }
+
+        result = orchestrator._resolve_profile("pat@initech.com", "initech.com", raw_data)
+
+        assert result["company_name"] == "Initech"
+        assert result["title"] == "Engineer"
+
+    def test_resolve_batch_matches_single(self, mock_supabase):
+        """resolve_batch: Same profiles as resolving one at a time, in order."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        profiles = [
+            (f"user{i}@acme.com", "acme.com", {"apollo": {"first_name": f"User{i}"}, "pdl": {"skills": ["go"]}})
+            for i in range(5)
+        ]
+
+        results = orchestrator.resolve_batch(profiles)
+
+        assert results == [orchestrator._resolve_profile(*profile) for profile in profiles]
+        assert [r["first_name"] for r in results] == [f"User{i}" for i in range(5)]
+
+
+class TestSharedOrchestrator:
+    """Tests for one orchestrator instance serving concurrent calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_do_not_share_state(self, mock_supabase):
+        """enrich: Interleaved calls on one instance each get their own sources/fields."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        emails = [f"user{i}@corp{i}.io" for i in range(12)]
+
+        async def person(email, domain=None):
+            # Later emails finish first, so calls interleave
+            await asyncio.sleep(0.001 * (len(emails) - int(email[4:].split("@")[0])))
+            index = int(email[4:].split("@")[0])
+            if index % 2:
+                return {"_error": "No match"}
+            return {"email": email, "first_name": f"User{index}"}
+
+        async def company(domain):
+            return {"name": domain.split(".")[0].title(), "domain": domain}
+
+        for source in ("apollo", "pdl", "hunter", "zoominfo", "gnews"):
+            orchestrator.apis[source].enrich = AsyncMock(return_value={"_error": "disabled"})
+        orchestrator.apis["apollo"].enrich = AsyncMock(side_effect=person)
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(side_effect=company)
+
+        results = await asyncio.gather(*[orchestrator.enrich(email) for email in emails])
+
+        for index, (email, result) in enumerate(zip(emails, results)):
+            assert result["email"] == email
+            assert result["company_name"] == f"Corp{index}"
+            if index % 2:
+                assert result.get("first_name") is None
+                assert result["data_sources"] == ["pdl_company"]
+            else:
+                assert result["first_name"] == f"User{index}"
+                assert sorted(result["data_sources"]) == ["apollo", "pdl_company"]
+
+    def test_get_rad_orchestrator_is_shared(self, monkeypatch, mock_supabase):
+        """get_rad_orchestrator: Every caller gets the same instance."""
+        from app.services import rad_orchestrator
+
+        monkeypatch.setattr(rad_orchestrator, "_rad_orchestrator", None)
+        monkeypatch.setattr(rad_orchestrator, "get_supabase_client", lambda: mock_supabase)
+
+        assert rad_orchestrator.get_rad_orchestrator() is rad_orchestrator.get_rad_orchestrator()
+
+
+class TestFetchStages:
+    """Tests for the stage graph in _fetch_all_sources."""
+
+    @pytest.mark.asyncio
+    async def test_company_lookup_runs_alongside_person_sources(self, mock_supabase):
+        """_fetch_all_sources: PDL company starts immediately, not after phase 1."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        started = []
+
+        async def slow_apollo(email, domain=None):
+            started.append("apollo")
+            await asyncio.sleep(0.05)
+            return {"email": email}
+
+        async def company(domain):
+            started.append("pdl_company")
+            return {"name": "Stage Corp", "domain": domain}
+
+        orchestrator.apis["apollo"].enrich = AsyncMock(side_effect=slow_apollo)
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(side_effect=company)
+        timings = {}
+
+        await orchestrator._fetch_all_sources("ann@stagecorp.io", "stagecorp.io", timings=timings)
+
+        assert started[:2] == ["apollo", "pdl_company"]
+        assert timings["pdl_company"]["start_ms"] < 40
+        assert set(timings) >= {"apollo", "pdl", "hunter", "zoominfo", "pdl_company", "gnews"}
+
+    @pytest.mark.asyncio
+    async def test_news_uses_resolved_company_name(self, mock_supabase):
+        """_fetch_all_sources: GNews waits for PDL company and searches its name."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(
+            return_value={"name": "Globex Corporation", "domain": "globex.io"}
+        )
+        news = AsyncMock(return_value={"answer": "news"})
+        orchestrator.apis["gnews"].enrich = news
+
+        await orchestrator._fetch_all_sources("hank@globex.io", "globex.io")
+
+        news.assert_awaited_once_with("hank@globex.io", "globex.io", company_name="Globex Corporation")
+
+    @pytest.mark.asyncio
+    async def test_cached_news_is_per_company_name(self, mock_supabase):
+        """_fetch_with_fallback: Cached GNews data is only reused for the same company."""
+        orchestrator = RADOrchestrator(mock_supabase)
+        news = AsyncMock(side_effect=lambda email, domain, company_name=None: {"company_name": company_name})
+        orchestrator.apis["gnews"].enrich = news
+
+        for name in ("Initech", "Initech, Inc.", "Initrode"):
+            data = await orchestrator._fetch_with_fallback("gnews", "bill@initech.io", "initech.io", company_name=name)
+
+        assert news.await_count == 2
+        assert data["company_name"] == "Initrode"
+
+
+class TestWaterfallPlan:
+    """Tests for the cost-ordered waterfall fetch plan."""
+
+    @pytest.fixture
+    def orchestrator(self, mock_supabase, monkeypatch):
+        """Fixture: orchestrator whose providers are all AsyncMocks."""
+        monkeypatch.setattr(settings, "WATERFALL_REQUIRED_FIELDS", "first_name,title,company_name,industry")
+        orchestrator = RADOrchestrator(mock_supabase)
+        for source in ("apollo", "pdl", "hunter", "zoominfo", "gnews"):
+            orchestrator.apis[source].enrich = AsyncMock(return_value={})
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(return_value={})
+        return orchestrator
+
+    def test_tiers_follow_source_priority(self):
+        """waterfall_tiers: Most trusted tier first; equal priorities share a tier."""
+        tiers = waterfall_tiers()
+        assert tiers[0] == ("apollo",)
+        assert set(tiers[1]) == {"zoominfo", "pdl_company"}
+        assert tiers[-1] == ("gnews",)
+
+    @pytest.mark.asyncio
+    async def test_stops_once_required_fields_filled(self, orchestrator):
+        """_fetch_all_sources: Later tiers are skipped when Apollo covers everything."""
+        orchestrator.apis["apollo"].enrich.return_value = {
+            "first_name": "Ann", "title": "CTO", "company_name": "Falls Inc", "industry": "Software",
+        }
+
+        raw_data = await orchestrator._fetch_all_sources(
+            "ann@fallsinc.io", "fallsinc.io", fetch_plan="waterfall"
+        )
+
+        orchestrator.apis["apollo"].enrich.assert_awaited_once()
+        orchestrator.apis["pdl"].enrich.assert_not_awaited()
+        orchestrator.apis["pdl"].enrich_company.assert_not_awaited()
+        assert raw_data["zoominfo"]["_skipped"] == "waterfall"
+        assert raw_data["gnews"]["_skipped"] == "waterfall"
+
+    @pytest.mark.asyncio
+    async def test_missing_field_calls_next_tier(self, orchestrator):
+        """_fetch_all_sources: Only tiers that can fill a missing field are called."""
+        orchestrator.apis["apollo"].enrich.return_value = {
+            "first_name": "Ann", "title": "CTO", "company_name": "Falls Inc",
+        }
+        orchestrator.apis["pdl"].enrich_company.return_value = {"name": "Falls", "industry": "Software"}
+
+        raw_data = await orchestrator._fetch_all_sources(
+            "ann@fallsinc2.io", "fallsinc2.io", fetch_plan="waterfall"
+        )
+
+        orchestrator.apis["pdl"].enrich_company.assert_awaited_once()
+        orchestrator.apis["zoominfo"].enrich.assert_awaited_once()
+        orchestrator.apis["pdl"].enrich.assert_not_awaited()
+        assert raw_data["pdl"]["_skipped"] == "waterfall"
+
+    @pytest.mark.asyncio
+    async def test_user_fields_count_as_filled(self, orchestrator):
+        """enrich: User-supplied fields fill requirements; skipped calls are reported."""
+        orchestrator.apis["apollo"].enrich.return_value = {"title": "CTO"}
+
+        result = await orchestrator.enrich(
+            "bo@userfields.io",
+            fetch_plan="waterfall",
+            known_fields={"first_name": "Bo", "company_name": "UF", "industry": "retail"},
+        )
+
+        assert result["fetch_plan"] == "waterfall"
+        assert set(result["skipped_sources"]) == {"zoominfo", "pdl_company", "pdl", "hunter", "gnews"}
+        assert result["skipped_reasons"]["pdl"] == "waterfall"
+
+    def test_select_fetch_plan(self, monkeypatch):
+        """select_fetch_plan: Request beats campaign beats default; unknown plans fall back."""
+        monkeypatch.setattr(settings, "CAMPAIGN_FETCH_PLANS", "webinar:waterfall, demo:full")
+        monkeypatch.setattr(settings, "ENRICHMENT_FETCH_PLAN", "full")
+
+        assert select_fetch_plan("full", "webinar") == "full"
+        assert select_fetch_plan(None, "webinar") == "waterfall"
+        assert select_fetch_plan(None, "other") == "full"
+        assert select_fetch_plan("bogus") == "full"
+
 
 class TestSourcePriority:
     """Tests for source priority configuration."""
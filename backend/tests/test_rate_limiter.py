@@ -0,0 +1,84 @@
+"""
+Tests for adaptive per-provider rate limiting.
+"""
+
+import asyncio
+import time
+import pytest
+
+from app.services.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for token bucket + AIMD behavior."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_window_caps_in_flight(self):
+        """slot: No more than `concurrency` requests run at once."""
+        limiter = AdaptiveRateLimiter("test", rate=1000, max_concurrency=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter._in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[request() for _ in range(6)])
+
+        assert peak == 2
+        assert limiter.stats()["requests"] == 6
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self):
+        """acquire: Requests beyond the burst wait for tokens."""
+        limiter = AdaptiveRateLimiter("test", rate=50, max_concurrency=10, burst=1)
+        started = time.monotonic()
+
+        for _ in range(3):
+            async with limiter.slot():
+                pass
+
+        assert time.monotonic() - started >= 0.035
+
+    def test_aimd_window(self):
+        """on_throttle/on_success: Halve on 429, grow back additively."""
+        limiter = AdaptiveRateLimiter("test", rate=10, max_concurrency=8)
+
+        limiter.on_throttle(retry_after=0)
+        assert int(limiter.concurrency) == 4
+
+        for _ in range(5):
+            limiter.on_success()
+        assert int(limiter.concurrency) == 5
+
+        limiter.on_throttle(retry_after=0)
+        limiter.on_throttle(retry_after=0)
+        limiter.on_throttle(retry_after=0)
+        assert limiter.concurrency == limiter.min_concurrency
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_requests(self):
+        """acquire: Requests wait out the provider's Retry-After."""
+        limiter = AdaptiveRateLimiter("test", rate=1000, max_concurrency=4)
+        limiter.on_throttle(retry_after=0.05)
+        started = time.monotonic()
+
+        async with limiter.slot():
+            pass
+
+        assert time.monotonic() - started >= 0.04
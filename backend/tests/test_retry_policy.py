@@ -0,0 +1,132 @@
+"""
+Tests for provider retries (backoff, retry budgets, deadlines).
+"""
+
+import pytest
+import httpx
+
+from app.config import settings
+from app.services import http_pool, rate_limiter, circuit_breaker, retry_policy
+from app.services.http_pool import HTTPClientPool
+from app.services.retry_policy import RetryPolicy, RetryBudget, get_retry_budget
+from app.services.deadline import deadline_scope
+from app.services.enrichment_apis import PDLAPI, EnrichmentAPIError
+
+
+PERSON = {"first_name": "Jane", "last_name": "Doe"}
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """
+    Fixture: mock-transport pool that answers with scripted responses.
+    Set state["script"] to a list of responses/exceptions; the last one repeats.
+    """
+    state = {"script": [], "calls": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        script = state["script"]
+        item = script[min(state["calls"], len(script) - 1)]
+        state["calls"] += 1
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    monkeypatch.setattr(http_pool, "_http_pool", HTTPClientPool(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+    monkeypatch.setattr(retry_policy, "_retry_budgets", {})
+    monkeypatch.setattr(settings, "RETRY_BASE_DELAY", 0.0)
+    yield state
+
+
+class TestRetryPolicy:
+    """Tests for backoff and budget arithmetic."""
+
+    def test_backoff_is_jittered_and_capped(self):
+        """backoff: Delays stay within min(max_delay, base * 2^(n-1))."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+        for attempt, cap in [(1, 1.0), (2, 2.0), (5, 3.0)]:
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= d <= cap for d in delays)
+            assert len(set(delays)) > 1
+
+    def test_backoff_honors_retry_after(self):
+        """backoff: Short Retry-After is a floor; long Retry-After means don't retry."""
+        policy = RetryPolicy(base_delay=0.0, max_delay=4.0)
+        assert policy.backoff(1, retry_after=2.0) == 2.0
+        assert policy.backoff(1, retry_after=30.0) is None
+
+    def test_budget_caps_retries(self):
+        """try_spend: Retries stop at floor + ratio x requests within the window."""
+        budget = RetryBudget("pdl", ratio=0.5, min_per_second=0.1, window_seconds=10)
+        for _ in range(4):
+            budget.record_request()
+        allowed = [budget.try_spend() for _ in range(5)]
+        assert allowed == [True, True, True, False, False]
+        assert budget.stats()["budget_denied"] == 2
+
+    def test_disabled(self, monkeypatch):
+        """get_retry_budget: Returns None when retries are disabled."""
+        monkeypatch.setattr(settings, "RETRY_ENABLED", False)
+        assert get_retry_budget("pdl") is None
+
+
+class TestRetries:
+    """Tests for retries through BaseEnrichmentAPI._request."""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_recovers(self, provider):
+        """_request: A 502 then a 200 returns the 200."""
+        provider["script"] = [httpx.Response(502, text="bad gateway"), httpx.Response(200, json=PERSON)]
+
+        result = await PDLAPI(api_key="k").enrich("jane@acme.com")
+
+        assert result["first_name"] == "Jane"
+        assert provider["calls"] == 2
+        stats = retry_policy.get_retry_stats()["pdl"]
+        assert stats["retries"] == 1 and stats["recovered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error_recovers(self, provider):
+        """_request: Connection errors are retried."""
+        provider["script"] = [httpx.ConnectError("reset"), httpx.Response(200, json=PERSON)]
+
+        result = await PDLAPI(api_key="k").enrich("jane@acme.com")
+
+        assert result["last_name"] == "Doe"
+        assert provider["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, provider):
+        """_request: 4xx (other than 429) fail on the first attempt."""
+        provider["script"] = [httpx.Response(401, text="nope")]
+
+        with pytest.raises(EnrichmentAPIError):
+            await PDLAPI(api_key="k").enrich("jane@acme.com")
+        assert provider["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_after_max_attempts(self, provider):
+        """_request: Persistent 503s stop after RETRY_MAX_ATTEMPTS."""
+        provider["script"] = [httpx.Response(503, text="down")]
+
+        with pytest.raises(EnrichmentAPIError) as exc_info:
+            await PDLAPI(api_key="k").enrich("jane@acme.com")
+
+        assert exc_info.value.status_code == 503
+        assert provider["calls"] == settings.RETRY_MAX_ATTEMPTS
+        assert retry_policy.get_retry_stats()["pdl"]["exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_denies_retry(self, provider, monkeypatch):
+        """_request: No retry when the request deadline can't fit another attempt."""
+        provider["script"] = [httpx.Response(503, text="down"), httpx.Response(200, json=PERSON)]
+        monkeypatch.setattr(retry_policy, "MIN_ATTEMPT_SECONDS", 60.0)
+
+        with deadline_scope(5.0):
+            with pytest.raises(EnrichmentAPIError):
+                await PDLAPI(api_key="k").enrich("jane@acme.com")
+
+        assert provider["calls"] == 1
+        assert retry_policy.get_retry_stats()["pdl"]["deadline_denied"] == 1
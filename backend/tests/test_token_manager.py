@@ -0,0 +1,188 @@
+"""
+Tests for cached provider access tokens (ZoomInfo /authenticate).
+"""
+
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+import httpx
+
+from app.services import http_pool, rate_limiter, circuit_breaker, retry_policy, token_manager
+from app.services.deadline import deadline_scope, remaining_budget
+from app.services.http_pool import HTTPClientPool
+from app.services.token_manager import TokenManager, jwt_lifetime
+from app.services.enrichment_apis import ZoomInfoAPI
+
+
+def make_jwt(lifetime: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + lifetime}).encode()).decode()
+    return f"header.{claims.rstrip('=')}.sig"
+
+
+class TestTokenManager:
+    """Tests for caching, single-flight and background refresh."""
+
+    @pytest.mark.asyncio
+    async def test_cached_and_single_flight(self):
+        """get_token: Concurrent cold callers share one auth call; later calls hit the cache."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return f"token-{len(calls)}", 3600
+
+        manager = TokenManager("test", fetch, refresh_margin=60)
+        tokens = await asyncio.gather(*[manager.get_token() for _ in range(10)])
+        tokens.append(await manager.get_token())
+
+        assert set(tokens) == {"token-1"}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_ahead_of_expiry_without_blocking(self):
+        """get_token: Inside the margin the old token is returned while a refresh runs."""
+        calls, release = [], asyncio.Event()
+
+        async def fetch():
+            calls.append(1)
+            if len(calls) > 1:
+                await release.wait()
+            return f"token-{len(calls)}", 0.2
+
+        manager = TokenManager("test", fetch, refresh_margin=60, min_refresh_delay=0)
+        assert await manager.get_token() == "token-1"
+
+        # Margin is capped at half the lifetime: refresh starts at 0.1s, old token still served
+        await asyncio.sleep(0.12)
+        assert await manager.get_token() == "token-1"
+        release.set()
+        await asyncio.sleep(0)
+        assert await manager.get_token() == "token-2"
+        assert manager.stats()["cold_waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_failure_keeps_token(self):
+        """_refresh_in_background: A failed refresh leaves the valid token in use."""
+        results = [("token-1", 0.2)]
+
+        async def fetch():
+            if not results:
+                raise RuntimeError("auth down")
+            return results.pop(0)
+
+        manager = TokenManager("test", fetch, refresh_margin=60, min_refresh_delay=0)
+        await manager.get_token()
+        await asyncio.sleep(0.12)  # Timer fires the (failing) refresh
+
+        assert await manager.get_token() == "token-1"
+        assert manager.stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_short_or_expired_tokens_do_not_loop(self):
+        """_schedule_refresh: Lifetimes under the margin, or already expired, never re-auth in a loop."""
+        for lifetime in (120, -30):
+            calls = []
+
+            async def fetch():
+                calls.append(1)
+                return "token", lifetime
+
+            manager = TokenManager("test", fetch, refresh_margin=300)
+            await manager.refresh()
+            await asyncio.sleep(0.05)
+
+            assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_ignores_request_deadline(self):
+        """refresh: The shared auth call does not run under the caller's (expired) deadline."""
+        budgets = []
+
+        async def fetch():
+            budgets.append(remaining_budget(10))
+            return f"token-{len(budgets)}", 0.02
+
+        manager = TokenManager("test", fetch, refresh_margin=60, min_refresh_delay=0)
+        with deadline_scope(0):
+            await manager.refresh()
+        await asyncio.sleep(0.03)  # Timer created under the expired scope fires a refresh
+
+        assert len(budgets) >= 2 and set(budgets) == {10}
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_create_task_context(self, monkeypatch):
+        """refresh: Works where asyncio.create_task has no `context=` (Python 3.10)."""
+        create_task = asyncio.create_task
+
+        def create_task_py310(coro, *, name=None):
+            return create_task(coro, name=name)
+
+        monkeypatch.setattr(asyncio, "create_task", create_task_py310)
+        budgets = []
+
+        async def fetch():
+            budgets.append(remaining_budget(10))
+            return "token", 3600
+
+        manager = TokenManager("test", fetch, refresh_margin=60)
+        with deadline_scope(0):
+            assert await manager.get_token() == "token"
+        assert budgets == [10]
+
+    def test_jwt_lifetime(self):
+        """jwt_lifetime: Reads exp; opaque tokens give None."""
+        assert jwt_lifetime(make_jwt(600)) == pytest.approx(600, abs=5)
+        assert jwt_lifetime("opaque-token") is None
+
+
+class TestZoomInfoAuth:
+    """Tests for ZoomInfoAPI token auth through the shared pool."""
+
+    @pytest.fixture
+    def zoominfo(self, monkeypatch):
+        """Fixture: ZoomInfo stand-in that issues tokens and checks them."""
+        state = {"auth_calls": 0, "valid": set()}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/authenticate"):
+                state["auth_calls"] += 1
+                token = make_jwt(3600) + str(state["auth_calls"])
+                state["valid"] = {token}
+                return httpx.Response(200, json={"jwt": token})
+            if request.headers["Authorization"].removeprefix("Bearer ") not in state["valid"]:
+                return httpx.Response(401, json={"error": "expired"})
+            return httpx.Response(200, json={"data": [{"name": "Initech"}]})
+
+        monkeypatch.setattr(http_pool, "_http_pool", HTTPClientPool(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+        monkeypatch.setattr(circuit_breaker, "_circuit_breakers", {})
+        monkeypatch.setattr(retry_policy, "_retry_budgets", {})
+        monkeypatch.setattr(token_manager, "_token_managers", {})
+        yield state
+
+    @pytest.mark.asyncio
+    async def test_authenticates_once(self, zoominfo):
+        """enrich: One /authenticate call serves many requests."""
+        api = ZoomInfoAPI(username="u", password="p")
+
+        results = await asyncio.gather(*[api.enrich(f"a@co{i}.com") for i in range(5)])
+        await ZoomInfoAPI(username="u", password="p").enrich("b@co.com")
+
+        assert all(r["company_name"] == "Initech" for r in results)
+        assert zoominfo["auth_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_reauthenticates(self, zoominfo):
+        """enrich: A 401 drops the token and retries once with a fresh one."""
+        api = ZoomInfoAPI(username="u", password="p")
+        await api.enrich("a@co.com")
+        zoominfo["valid"] = set()  # Server revokes the token
+
+        result = await api.enrich("b@co.com")
+
+        assert result["company_name"] == "Initech"
+        assert zoominfo["auth_calls"] == 2
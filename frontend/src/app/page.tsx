@@ -42,6 +42,57 @@ function HomeContent() {
     return '/api';
   };
 
+  // Follow the job's progress stream; fall back to polling if it cannot be opened
+  const waitForJob = (apiUrl: string, jobId: string) =>
+    new Promise<void>((resolve, reject) => {
+      const jobUrl = `${apiUrl}/rad/jobs/${encodeURIComponent(jobId)}`;
+      const events = new EventSource(`${jobUrl}/events`);
+      let progressed = false;
+
+      events.addEventListener('profile', (event) => {
+        progressed = true;
+        // Show the resolved name and company while the ebook is generated
+        const profile = JSON.parse((event as MessageEvent).data);
+        setUserContext((current) => ({
+          ...current,
+          firstName: current?.firstName || profile.first_name || undefined,
+          company: current?.company || profile.company_name || undefined,
+        }));
+      });
+      events.addEventListener('stage', () => {
+        progressed = true;
+      });
+      events.addEventListener('completed', () => {
+        events.close();
+        resolve();
+      });
+      events.addEventListener('failed', (event) => {
+        events.close();
+        reject(new Error(JSON.parse((event as MessageEvent).data).error_message || 'Personalization failed'));
+      });
+      events.onerror = () => {
+        // EventSource reconnects on its own once the stream has started
+        if (progressed) return;
+        events.close();
+        pollJob(jobUrl).then(resolve, reject);
+      };
+    });
+
+  const pollJob = async (jobUrl: string) => {
+    for (;;) {
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      const jobResponse = await fetch(jobUrl);
+      if (!jobResponse.ok) {
+        throw new Error(`Failed to check personalization status: ${jobResponse.status}`);
+      }
+      const jobStatus = await jobResponse.json();
+      if (jobStatus.status === 'completed') return;
+      if (jobStatus.status === 'failed') {
+        throw new Error(jobStatus.error_message || 'Personalization failed');
+      }
+    }
+  };
+
   const handleSubmit = async (inputs: UserInputs) => {
     setIsLoading(true);
     setError(null);
@@ -78,6 +129,12 @@ function HomeContent() {
         throw new Error(`Failed to start personalization: ${response.status}`);
       }
 
+      // 202: enrichment runs as a background job; wait for it before reading the profile
+      const job = await response.json();
+      if (job.status !== 'completed') {
+        await waitForJob(apiUrl, job.job_id);
+      }
+
       const profileResponse = await fetch(`${apiUrl}/rad/profile/${encodeURIComponent(inputs.email)}`);
 
       if (!profileResponse.ok) {
@@ -0,0 +1,12 @@
+-- Job queue fields for personalization_jobs
+-- POST /rad/enrich now records a job and returns 202; workers report progress
+-- here and GET /rad/jobs/{id} reads it back.
+
+ALTER TABLE personalization_jobs
+ADD COLUMN IF NOT EXISTS stage VARCHAR(50),
+ADD COLUMN IF NOT EXISTS request_payload JSONB,
+ADD COLUMN IF NOT EXISTS result JSONB;
+
+COMMENT ON COLUMN personalization_jobs.stage IS 'Pipeline stage while processing: enriching, generating, compliance, storing, done';
+COMMENT ON COLUMN personalization_jobs.request_payload IS 'Original POST /rad/enrich body, so any worker can run the job';
+COMMENT ON COLUMN personalization_jobs.result IS 'Enrichment summary (data sources, quality score, key fields) once completed';
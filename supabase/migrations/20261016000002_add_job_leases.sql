@@ -0,0 +1,114 @@
+-- Lease-based job claiming for personalization_jobs
+-- Any number of backend workers poll claim_personalization_jobs(); each job is
+-- handed to exactly one worker for a lease period. Workers extend the lease with
+-- heartbeats while they run the job; a job whose worker died (lease expired) is
+-- claimed again, up to p_max_attempts times, then marked failed.
+
+ALTER TABLE personalization_jobs
+ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255),
+ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 0 NOT NULL;
+
+COMMENT ON COLUMN personalization_jobs.lease_owner IS 'Worker currently holding the job (NULL when not processing)';
+COMMENT ON COLUMN personalization_jobs.lease_expires_at IS 'Job may be reclaimed by another worker after this time';
+COMMENT ON COLUMN personalization_jobs.attempts IS 'Number of times the job has been claimed';
+
+-- Claim scans: pending jobs by age, processing jobs by lease expiry
+CREATE INDEX IF NOT EXISTS idx_jobs_claimable
+    ON personalization_jobs(status, created_at)
+    WHERE status IN ('pending', 'processing');
+
+-- ============================================================================
+-- claim_personalization_jobs: atomically lease up to p_limit jobs
+-- ============================================================================
+CREATE OR REPLACE FUNCTION claim_personalization_jobs(
+    p_worker TEXT,
+    p_limit INTEGER DEFAULT 1,
+    p_lease_seconds INTEGER DEFAULT 120,
+    p_max_attempts INTEGER DEFAULT 3
+)
+RETURNS SETOF personalization_jobs
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Give up on jobs whose leases keep expiring (worker crashes mid-job)
+    UPDATE personalization_jobs
+    SET status = 'failed',
+        error_message = 'Lease expired after ' || attempts || ' attempts',
+        completed_at = NOW(),
+        lease_owner = NULL,
+        lease_expires_at = NULL
+    WHERE status = 'processing'
+      AND lease_expires_at < NOW()
+      AND attempts >= p_max_attempts;
+
+    -- SKIP LOCKED: concurrent claimers never wait on or take the same rows
+    RETURN QUERY
+    UPDATE personalization_jobs j
+    SET status = 'processing',
+        lease_owner = p_worker,
+        lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = j.attempts + 1,
+        started_at = COALESCE(j.started_at, NOW())
+    WHERE j.id IN (
+        SELECT id
+        FROM personalization_jobs
+        WHERE (status = 'pending' OR (status = 'processing' AND lease_expires_at < NOW()))
+          AND attempts < p_max_attempts
+        ORDER BY created_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.*;
+END;
+$$;
+
+-- ============================================================================
+-- heartbeat_personalization_job: extend a lease the caller still holds
+-- ============================================================================
+CREATE OR REPLACE FUNCTION heartbeat_personalization_job(
+    p_job_id BIGINT,
+    p_worker TEXT,
+    p_lease_seconds INTEGER DEFAULT 120
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE personalization_jobs
+    SET lease_expires_at = NOW() + make_interval(secs => p_lease_seconds)
+    WHERE id = p_job_id
+      AND lease_owner = p_worker
+      AND status = 'processing';
+    RETURN FOUND;
+END;
+$$;
+
+-- ============================================================================
+-- finish_personalization_job: record the outcome if the caller still holds the lease
+-- ============================================================================
+CREATE OR REPLACE FUNCTION finish_personalization_job(
+    p_job_id BIGINT,
+    p_worker TEXT,
+    p_status TEXT,
+    p_error_message TEXT DEFAULT NULL,
+    p_result JSONB DEFAULT NULL
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE personalization_jobs
+    SET status = p_status,
+        stage = CASE WHEN p_status = 'completed' THEN 'done' ELSE stage END,
+        error_message = p_error_message,
+        result = COALESCE(p_result, result),
+        completed_at = NOW(),
+        lease_owner = NULL,
+        lease_expires_at = NULL
+    WHERE id = p_job_id
+      AND lease_owner = p_worker
+      AND status = 'processing';
+    RETURN FOUND;
+END;
+$$;
@@ -0,0 +1,29 @@
+-- Lease-checked stage updates for personalization_jobs
+-- Workers record pipeline stages through the heartbeat, so a worker whose lease
+-- expired (and was reclaimed) can no longer overwrite the new owner's stage.
+
+DROP FUNCTION IF EXISTS heartbeat_personalization_job(BIGINT, TEXT, INTEGER);
+
+-- ============================================================================
+-- heartbeat_personalization_job: extend a lease the caller still holds,
+-- optionally recording the stage now running
+-- ============================================================================
+CREATE OR REPLACE FUNCTION heartbeat_personalization_job(
+    p_job_id BIGINT,
+    p_worker TEXT,
+    p_lease_seconds INTEGER DEFAULT 120,
+    p_stage TEXT DEFAULT NULL
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE personalization_jobs
+    SET lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        stage = COALESCE(p_stage, stage)
+    WHERE id = p_job_id
+      AND lease_owner = p_worker
+      AND status = 'processing';
+    RETURN FOUND;
+END;
+$$;
@@ -0,0 +1,18 @@
+-- Atomic hit counting for enrichment_cache
+-- Workers on every node flush their in-process hit counts; incrementing in SQL
+-- means concurrent flushes for the same domain never overwrite each other.
+
+CREATE OR REPLACE FUNCTION record_enrichment_cache_hits(
+    p_domain TEXT,
+    p_hits INTEGER
+)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE enrichment_cache
+    SET cache_hits = COALESCE(cache_hits, 0) + p_hits,
+        last_accessed_at = NOW()
+    WHERE domain = p_domain;
+$$;
+
+COMMENT ON FUNCTION record_enrichment_cache_hits IS 'Adds flushed in-process cache hits to enrichment_cache.cache_hits.';